@@ -1,249 +1,524 @@
+import multiprocessing
+import queue
 import random
-import copy
+import time
+from multiprocessing import shared_memory
+
+import numpy as np
+
+from bits import (SolucaoBits, bytes_por_solucao, desempacotar, empacotar, inverter_posicoes,
+                  mascaras_prefixo)
+from cache import CacheFitness
+from eventos import FIM, INICIO, ITERACAO, MELHORIA, Emissor
+from historico import Historico
+from instrumentacao import Estatisticas
+from itens import ItensArray
+from reparo import Reparador
 
 class AG:
     @classmethod
     def executa_ag(cls, itens, capacidade_maxima=50, pop_size=50, geracoes=120,
-                   k_torneio=3, p_cross=0.9, p_mut=0.02, elitismo=2, mostrar_processo=False):
+                   k_torneio=3, p_cross=0.9, p_mut=0.02, elitismo=2, tamanho_cache=10000,
+                   migracao=None, preencher_reparo=False, geracoes_sem_melhoria=None,
+                   diversidade_minima=None, valor_alvo=None, tempo_limite=None, solucao_inicial=None,
+                   opcoes_historico=None, observadores=None, perfilar=False, rastrear_memoria=False,
+                   mostrar_processo=False):
         """
         Executa algoritmo Genético para o problema da mochila
         
         Args:
-            itens: Lista de ItemDataclass com nome, valor e peso
-            capacidade_maxima: Capacidade máxima da mochila (padrão: 50)
+            itens: Lista de ItemDataclass com nome, valor e peso (ou ItensArray)
+            capacidade_maxima: Capacidade máxima da mochila (padrão: 50); com vários recursos,
+                               um vetor com a capacidade de cada um (ver restricoes.py)
             pop_size: Tamanho da população (padrão: 50)
             geracoes: Número de gerações (padrão: 120)
             k_torneio: Tamanho do torneio para seleção (padrão: 3)
             p_cross: Probabilidade de crossover (padrão: 0.9)
             p_mut: Probabilidade de mutação (padrão: 0.02)
             elitismo: Número de melhores indivíduos preservados (padrão: 2)
-            mostrar_processo: Se deve mostrar o processo detalhado
+            tamanho_cache: Máximo de genomas no cache LRU de fitness; 0 desativa (padrão: 10000)
+            migracao: Função (geracao, populacao, fitness_populacao) -> populacao chamada a cada
+                      geração após a avaliação, com a população empacotada em bits;
+                      usada pelo modelo de ilhas (padrão: None)
+            preencher_reparo: Se a metade reparada da população inicial também tem a folga
+                              preenchida com os itens de maior ratio que cabem (padrão: False)
+            geracoes_sem_melhoria: Para após esse nº de gerações seguidas sem melhorar a melhor
+                                   solução global; None desativa (padrão: None)
+            diversidade_minima: Para quando a entropia de Hamming da população (entropia binária
+                                média por gene, de 0 = convergida a 1) cai abaixo desse valor;
+                                None desativa (padrão: None)
+            valor_alvo: Para assim que a melhor solução atinge esse valor (padrão: None)
+            tempo_limite: Orçamento em segundos, verificado a cada geração (padrão: None)
+            solucao_inicial: Solução conhecida (array 0/1 ou SolucaoBits) semeada, já reparada,
+                             na população inicial no lugar de um indivíduo (padrão: None)
+            opcoes_historico: Opções do Historico devolvido (intervalo, apenas_melhorias, limite,
+                              arquivo); por padrão registra todas as gerações (ver historico.py)
+            observadores: Chamáveis que recebem os Eventos da execução (ver eventos.py)
+            perfilar: Se a execução roda sob cProfile (historico.estatisticas.perfil) (padrão: False)
+            rastrear_memoria: Se mede o pico de memória com tracemalloc (padrão: False)
+            mostrar_processo: Se deve mostrar o processo detalhado (RelatorioConsole)
         
         Returns:
-            tuple: (melhor_solucao, melhor_valor, melhor_peso, historico)
+            tuple: (melhor_solucao, melhor_valor, melhor_peso, historico) - tempos por fase
+                   (avaliação, seleção, cruzamento, mutação...) e avaliações em
+                   historico.estatisticas (ver instrumentacao.py)
         """
         
-        def calcular_fitness(individuo):
-            """Calcula o fitness (valor total) de um indivíduo"""
-            peso_total = sum(itens[i].peso for i in range(len(individuo)) if individuo[i] == 1)
+        if geracoes_sem_melhoria is not None and geracoes_sem_melhoria < 1:
+            raise ValueError("geracoes_sem_melhoria deve ser pelo menos 1")
+        
+        inicio_execucao = time.perf_counter()
+        itens = ItensArray.de_itens(itens)
+        n_itens = len(itens)
+        if solucao_inicial is not None and len(solucao_inicial) != n_itens:
+            raise ValueError("solucao_inicial deve ter um valor por item")
+        estatisticas = Estatisticas("AG", perfilar, rastrear_memoria).iniciar()
+        n_bytes = bytes_por_solucao(n_itens)
+        emissor = Emissor("AG", observadores, mostrar_processo)
+        reparador = Reparador(itens, capacidade_maxima)
+        restricoes = reparador.restricoes
+        penalidade_grupo = float(itens.valores.max()) if n_itens else 0.0
+        
+        # Linhas desempacotadas por bloco na avaliação: limita a matriz temporária de 0/1
+        linhas_por_bloco = max(1, (1 << 22) // max(n_itens, 1))
+        
+        # Gerador NumPy derivado do módulo random: random.seed continua controlando a execução
+        rng = np.random.default_rng(random.getrandbits(64))
+        
+        cache = CacheFitness(tamanho_cache) if tamanho_cache > 0 else None
+        
+        def calcular_fitness_populacao(populacao):
+            """
+            Calcula fitness e peso de TODA a população (matriz empacotada pop_size x n_bytes),
+            desempacotando em blocos e usando um produto matriz-vetor por atributo
+            """
+            estatisticas.contar("avaliacoes", len(populacao))
+            pesos_populacao = np.empty(len(populacao))
+            valores_populacao = np.empty(len(populacao))
+            penalidades = np.empty(len(populacao))
+            for inicio in range(0, len(populacao), linhas_por_bloco):
+                bloco = desempacotar(populacao[inicio:inicio + linhas_por_bloco], n_itens)
+                linhas = slice(inicio, inicio + len(bloco))
+                valores_populacao[linhas] = bloco @ itens.valores
+                
+                # PENALIZAÇÃO: Fitness proporcional ao excesso de peso (10 pontos por kg)
+                if restricoes.simples:
+                    pesos_populacao[linhas] = bloco @ itens.pesos
+                    penalidades[linhas] = np.maximum(pesos_populacao[linhas] - capacidade_maxima, 0.0) * 10
+                else:
+                    # Vários recursos: 10 pontos por unidade de excesso em cada um; cada item a
+                    # mais em um grupo de escolha múltipla custa o valor do item mais valioso
+                    usos = restricoes.usos(bloco)
+                    pesos_populacao[linhas] = usos[:, 0]
+                    penalidades[linhas] = (np.maximum(usos - restricoes.capacidade, 0.0).sum(axis=1) * 10
+                                           + restricoes.excesso_grupos(bloco) * penalidade_grupo)
             
-            if peso_total > capacidade_maxima:
-                # PENALIZAÇÃO: Fitness proporcional ao excesso de peso
-                excesso = peso_total - capacidade_maxima
-                penalizacao = excesso * 10  # Penaliza 10 pontos por kg de excesso
-                valor_bruto = sum(itens[i].valor for i in range(len(individuo)) if individuo[i] == 1)
-                return max(0, valor_bruto - penalizacao)
+            fitness_populacao = np.maximum(valores_populacao - penalidades, 0.0)
             
-            valor_total = sum(itens[i].valor for i in range(len(individuo)) if individuo[i] == 1)
-            return valor_total
+            return fitness_populacao, pesos_populacao
         
-        def calcular_peso(individuo):
-            """Calcula o peso total de um indivíduo"""
-            return sum(itens[i].peso for i in range(len(individuo)) if individuo[i] == 1)
+        def avaliar_populacao(populacao):
+            """
+            Avalia a população consultando o cache de fitness: só os genomas ainda
+            não vistos passam pelo produto matriz-vetor
+            """
+            if cache is None:
+                return calcular_fitness_populacao(populacao)
+            
+            chaves = CacheFitness.chaves(populacao)
+            fitness_populacao = np.empty(len(populacao))
+            pesos_populacao = np.empty(len(populacao))
+            
+            faltantes = []
+            for linha, chave in enumerate(chaves):
+                avaliacao = cache.obter(chave)
+                if avaliacao is None:
+                    faltantes.append(linha)
+                else:
+                    fitness_populacao[linha], pesos_populacao[linha] = avaliacao
+            
+            if faltantes:
+                fitness_novos, pesos_novos = calcular_fitness_populacao(populacao[faltantes])
+                fitness_populacao[faltantes] = fitness_novos
+                pesos_populacao[faltantes] = pesos_novos
+                for linha, fitness, peso in zip(faltantes, fitness_novos.tolist(), pesos_novos.tolist()):
+                    cache.guardar(chaves[linha], (fitness, peso))
+            
+            return fitness_populacao, pesos_populacao
         
-        def gerar_individuo_aleatorio():
-            """Gera um indivíduo (solução) aleatório"""
-            return [random.randint(0, 1) for _ in range(len(itens))]
+        def gerar_individuos_aleatorios(quantidade):
+            """Gera uma matriz de indivíduos (soluções) aleatórios, ainda desempacotada"""
+            return rng.integers(0, 2, size=(quantidade, n_itens), dtype=np.uint8)
         
         def gerar_populacao_inicial():
             """Gera população inicial de indivíduos aleatórios"""
-            populacao = []
-            
             # 50% da população: indivíduos completamente aleatórios
-            for _ in range(pop_size // 2):
-                individuo = gerar_individuo_aleatorio()
-                populacao.append(individuo)
+            aleatorios = empacotar(gerar_individuos_aleatorios(pop_size // 2))
             
             # 50% da população: indivíduos com reparo (heurística gulosa)
-            for _ in range(pop_size // 2):
-                individuo = gerar_individuo_aleatorio()
-                individuo_reparado = reparar_individuo(individuo)
-                populacao.append(individuo_reparado)
-            
-            return populacao
-        
-        def reparar_individuo(individuo):
-            """Repara indivíduo inválido removendo itens com menor ratio"""
-            individuo_reparado = individuo.copy()
-            peso_atual = calcular_peso(individuo_reparado)
-            
-            while peso_atual > capacidade_maxima:
-                itens_selecionados = [i for i in range(len(individuo_reparado)) if individuo_reparado[i] == 1]
-                if not itens_selecionados:
-                    break
-                
-                item_a_remover = min(itens_selecionados, key=lambda i: itens[i].ratio_valor_peso())
-                individuo_reparado[item_a_remover] = 0
-                peso_atual -= itens[item_a_remover].peso
+            reparados = empacotar(reparador.reparar(gerar_individuos_aleatorios(pop_size // 2),
+                                                   preencher=preencher_reparo))
             
-            return individuo_reparado
+            return np.vstack((aleatorios, reparados))
         
-        def selecao_torneio(populacao, fitness_populacao, k=k_torneio):
-            """Seleção por torneio: escolhe k indivíduos aleatórios e retorna o melhor"""
-            indices_torneio = random.sample(range(len(populacao)), k)
-            melhor_indice = max(indices_torneio, key=lambda i: fitness_populacao[i])
-            return populacao[melhor_indice].copy()
+        def selecao_torneio(fitness_populacao, quantidade, k=k_torneio):
+            """
+            Seleção por torneio em lote: sorteia k competidores para cada uma das
+            'quantidade' vagas e retorna os índices dos vencedores
+            """
+            competidores = rng.integers(0, len(fitness_populacao), size=(quantidade, k))
+            vencedores = np.argmax(fitness_populacao[competidores], axis=1)
+            return competidores[np.arange(quantidade), vencedores]
         
-        def crossover_um_ponto(pai1, pai2):
-            """Crossover de um ponto: troca genes após ponto aleatório"""
-            if random.random() > p_cross:
-                # Não faz crossover, retorna os pais
-                return pai1.copy(), pai2.copy()
+        def crossover_um_ponto(pais1, pais2):
+            """Crossover de um ponto em lote: troca genes após ponto aleatório de cada par"""
+            n_pares = len(pais1)
+            if n_itens < 2:
+                return pais1.copy(), pais2.copy()
             
-            # Escolhe ponto de corte aleatório
-            ponto_corte = random.randint(1, len(pai1) - 1)
+            # Pares sem crossover recebem ponto de corte n_itens, ou seja, copiam os pais
+            pontos_corte = rng.integers(1, n_itens, size=n_pares)
+            pontos_corte[rng.random(n_pares) > p_cross] = n_itens
             
-            # Cria filhos
-            filho1 = pai1[:ponto_corte] + pai2[ponto_corte:]
-            filho2 = pai2[:ponto_corte] + pai1[ponto_corte:]
+            # Crossover por máscara sobre os bytes empacotados
+            antes_do_corte = mascaras_prefixo(pontos_corte, n_itens)
+            filhos1 = (pais1 & antes_do_corte) | (pais2 & ~antes_do_corte)
+            filhos2 = (pais2 & antes_do_corte) | (pais1 & ~antes_do_corte)
             
-            return filho1, filho2
+            return filhos1, filhos2
         
-        def mutacao_bit(individuo):
-            """Mutação por inversão de bit: inverte bits com probabilidade p_mut"""
-            individuo_mutado = individuo.copy()
+        def mutacao_bit(individuos):
+            """
+            Mutação por inversão de bit: inverte cada bit com probabilidade p_mut.
+            As posições invertidas são sorteadas por saltos geométricos ao longo de todos
+            os bits do lote, então o custo é proporcional às mutações, não a pop x n_itens
+            """
+            mutados = individuos.copy()
+            total_bits = len(individuos) * n_itens
+            if p_mut <= 0 or total_bits == 0:
+                return mutados
             
-            for i in range(len(individuo_mutado)):
-                if random.random() < p_mut:
-                    # Inverte o bit (0->1 ou 1->0)
-                    individuo_mutado[i] = 1 - individuo_mutado[i]
+            lote = int(total_bits * min(p_mut, 1.0) * 1.1) + 64
+            blocos = []
+            ultima_posicao = -1
+            while ultima_posicao < total_bits:
+                posicoes = ultima_posicao + np.cumsum(rng.geometric(min(p_mut, 1.0), lote))
+                blocos.append(posicoes)
+                ultima_posicao = int(posicoes[-1])
             
-            return individuo_mutado
+            posicoes = np.concatenate(blocos)
+            return inverter_posicoes(mutados, posicoes[posicoes < total_bits], n_itens)
         
         def obter_elite(populacao, fitness_populacao, num_elite=elitismo):
             """Obtém os melhores indivíduos (elitismo)"""
-            indices_ordenados = sorted(range(len(populacao)), 
-                                     key=lambda i: fitness_populacao[i], 
-                                     reverse=True)
-            
-            elite = []
-            for i in range(min(num_elite, len(populacao))):
-                elite.append(populacao[indices_ordenados[i]].copy())
-            
-            return elite
+            indices_ordenados = np.argsort(-fitness_populacao, kind="stable")
+            return populacao[indices_ordenados[:min(num_elite, len(populacao))]]
         
-        def calcular_estatisticas(populacao, fitness_populacao):
+        def calcular_estatisticas(fitness_populacao, pesos_populacao):
             """Calcula estatísticas da população"""
-            melhor_fitness = max(fitness_populacao)
-            pior_fitness = min(fitness_populacao)
-            fitness_medio = sum(fitness_populacao) / len(fitness_populacao)
+            melhor_indice = int(np.argmax(fitness_populacao))
+            melhor_fitness = float(fitness_populacao[melhor_indice])
+            pior_fitness = float(fitness_populacao.min())
+            fitness_medio = float(fitness_populacao.mean())
+            melhor_peso = float(pesos_populacao[melhor_indice])
             
-            melhor_indice = fitness_populacao.index(melhor_fitness)
-            melhor_individuo = populacao[melhor_indice]
-            melhor_peso = calcular_peso(melhor_individuo)
+            return melhor_fitness, melhor_peso, fitness_medio, pior_fitness, melhor_indice
+        
+        def calcular_diversidade(populacao):
+            """
+            Entropia de Hamming da população: entropia binária média (em bits) da frequência
+            de 1s em cada gene. Vale 0 quando todos os indivíduos são iguais
+            """
+            if n_itens == 0:
+                return 0.0
             
-            return melhor_fitness, melhor_peso, fitness_medio, pior_fitness
+            uns = np.zeros(n_itens)
+            for inicio in range(0, len(populacao), linhas_por_bloco):
+                uns += desempacotar(populacao[inicio:inicio + linhas_por_bloco], n_itens).sum(axis=0)
+            
+            p = uns / len(populacao)
+            p = p[(p > 0) & (p < 1)]
+            return float(-(p * np.log2(p) + (1 - p) * np.log2(1 - p)).sum() / n_itens)
+        
+        def verificar_parada(geracao, diversidade):
+            """Motivo de parada ao fim da geração, ou None para continuar"""
+            if valor_alvo is not None and melhor_fitness_global >= valor_alvo:
+                return "valor_alvo"
+            if geracoes_sem_melhoria is not None and geracao - geracao_ultima_melhoria >= geracoes_sem_melhoria:
+                return "estagnacao"
+            if diversidade is not None and diversidade < diversidade_minima:
+                return "diversidade"
+            if tempo_limite is not None and time.perf_counter() - inicio_execucao >= tempo_limite:
+                return "tempo_limite"
+            if geracao == geracoes - 1:
+                return "geracoes"
+            return None
         
         # ========== INICIALIZAÇÃO ==========
-        if mostrar_processo:
-            print("🧬 ALGORITMO GENÉTICO - PROBLEMA DA MOCHILA")
-            print(f"📊 Configuração: {len(itens)} itens, {capacidade_maxima}kg")
-            print(f"🧬 População: {pop_size} indivíduos, {geracoes} gerações")
-            print(f"⚔️  Seleção: Torneio k={k_torneio}")
-            print(f"💏 Crossover: 1 ponto, p={p_cross}")
-            print(f"🎲 Mutação: Flip bit, p={p_mut}")
-            print(f"👑 Elitismo: {elitismo} melhores")
-            print("=" * 70)
+        emissor.emitir(INICIO, dados={"itens": itens, "capacidade": capacidade_maxima, "pop_size": pop_size,
+                                      "geracoes": geracoes, "k_torneio": k_torneio, "p_cross": p_cross,
+                                      "p_mut": p_mut, "elitismo": elitismo})
         
         # Gera população inicial
-        if mostrar_processo:
-            print("🌱 Gerando população inicial...")
-        
         populacao = gerar_populacao_inicial()
+        if solucao_inicial is not None and len(populacao) > 0:
+            semeada = reparador.reparar(np.array(solucao_inicial, dtype=np.uint8)[np.newaxis])
+            populacao[-1] = empacotar(semeada)[0]
         
         # Inicializa controle de melhor solução global
         melhor_solucao_global = None
         melhor_fitness_global = 0
         melhor_peso_global = 0
+        geracao_ultima_melhoria = 0
+        geracoes_executadas = 0
+        motivo_parada = "geracoes"
+        
+        # Histórico: (geração, melhor_fitness, fitness_medio, pior_fitness, melhor_peso,
+        #             acertos_cache, falhas_cache) - contadores do cache acumulados
+        historico = Historico(("geracao", "melhor", "medio", "pior", "melhor_peso", "acertos_cache",
+                               "falhas_cache"), **(opcoes_historico or {}))
         
-        # Histórico: (geração, melhor_fitness, fitness_medio, pior_fitness, melhor_peso)
-        historico = []
+        relatar_geracoes = emissor.escuta(ITERACAO)
+        relatar_melhorias = emissor.escuta(MELHORIA)
+        estatisticas.marcar("inicializacao")
         
         # ========== LOOP PRINCIPAL DO ALGORITMO GENÉTICO ==========
         for geracao in range(geracoes):
-            
+        
             # 1. AVALIAÇÃO: Calcula fitness de toda população
-            fitness_populacao = [calcular_fitness(individuo) for individuo in populacao]
+            fitness_populacao, pesos_populacao = avaliar_populacao(populacao)
+            
+            # MIGRAÇÃO (modelo de ilhas): só as linhas substituídas por imigrantes são reavaliadas
+            if migracao is not None:
+                nova_populacao = migracao(geracao, populacao, fitness_populacao)
+                if nova_populacao is not populacao:
+                    if nova_populacao.shape == populacao.shape:
+                        substituidos = np.flatnonzero((nova_populacao != populacao).any(axis=1))
+                        if len(substituidos) > 0:
+                            fitness_populacao = fitness_populacao.copy()
+                            pesos_populacao = pesos_populacao.copy()
+                            fitness_populacao[substituidos], pesos_populacao[substituidos] = \
+                                avaliar_populacao(nova_populacao[substituidos])
+                    else:
+                        fitness_populacao, pesos_populacao = avaliar_populacao(nova_populacao)
+                    populacao = nova_populacao
+            
+            estatisticas.marcar("avaliacao")
+            geracoes_executadas = geracao + 1
             
             # 2. ESTATÍSTICAS da geração atual
-            melhor_fitness, melhor_peso, fitness_medio, pior_fitness = calcular_estatisticas(populacao, fitness_populacao)
+            melhor_fitness, melhor_peso, fitness_medio, pior_fitness, melhor_indice = calcular_estatisticas(fitness_populacao, pesos_populacao)
             
             # 3. ATUALIZA melhor solução global
             if melhor_fitness > melhor_fitness_global:
-                melhor_indice = fitness_populacao.index(melhor_fitness)
-                melhor_solucao_global = populacao[melhor_indice].copy()
+                melhor_solucao_global = SolucaoBits(populacao[melhor_indice].copy(), n_itens)
                 melhor_fitness_global = melhor_fitness
                 melhor_peso_global = melhor_peso
+                geracao_ultima_melhoria = geracao
+                if relatar_melhorias:
+                    emissor.emitir(MELHORIA, iteracao=geracao, fitness=melhor_fitness, peso=melhor_peso)
             
             # 4. ADICIONA ao histórico
-            historico.append((geracao, melhor_fitness, fitness_medio, pior_fitness, melhor_peso))
+            acertos_cache = cache.acertos if cache is not None else 0
+            falhas_cache = cache.falhas if cache is not None else 0
+            historico.registrar(geracao, melhor_fitness, fitness_medio, pior_fitness, melhor_peso,
+                                acertos_cache, falhas_cache)
             
             # 5. RELATÓRIO da geração
-            if mostrar_processo and (geracao == 0 or (geracao + 1) % 20 == 0 or geracao == geracoes - 1):
-                print(f"Gen {geracao+1:3d}: Melhor=R${melhor_fitness:3.0f} | Médio=R${fitness_medio:5.1f} | Pior=R${pior_fitness:3.0f} | Peso={melhor_peso:4.1f}kg")
+            diversidade = calcular_diversidade(populacao) if diversidade_minima is not None else None
+            if relatar_geracoes:
+                emissor.emitir(ITERACAO, iteracao=geracao, fitness=melhor_fitness, peso=melhor_peso,
+                               dados={"medio": fitness_medio, "pior": pior_fitness, "diversidade": diversidade})
             
-            # 6. CONDIÇÃO DE PARADA (opcional: se não há melhoria por muitas gerações)
-            if geracao == geracoes - 1:
+            # 6. CONDIÇÃO DE PARADA: última geração, estagnação, convergência, alvo ou tempo
+            motivo = verificar_parada(geracao, diversidade)
+            estatisticas.marcar("registro")
+            if motivo is not None:
+                motivo_parada = motivo
                 break
             
             # ========== CRIAÇÃO DA NOVA GERAÇÃO ==========
             
             # 7. ELITISMO: Preserva os melhores
-            nova_populacao = obter_elite(populacao, fitness_populacao, elitismo)
+            elite = obter_elite(populacao, fitness_populacao, elitismo)
             
-            # 8. REPRODUÇÃO: Completa população com novos indivíduos
-            while len(nova_populacao) < pop_size:
-                
-                # SELEÇÃO: Escolhe dois pais por torneio
-                pai1 = selecao_torneio(populacao, fitness_populacao)
-                pai2 = selecao_torneio(populacao, fitness_populacao)
-                
-                # CROSSOVER: Gera dois filhos
-                filho1, filho2 = crossover_um_ponto(pai1, pai2)
-                
-                # MUTAÇÃO: Aplica mutação nos filhos
-                filho1 = mutacao_bit(filho1)
-                filho2 = mutacao_bit(filho2)
-                
-                # ADICIONA filhos à nova população
-                nova_populacao.append(filho1)
-                if len(nova_populacao) < pop_size:
-                    nova_populacao.append(filho2)
+            # 8. REPRODUÇÃO: Completa população com novos indivíduos, todos de uma vez
+            n_filhos = max(pop_size - len(elite), 0)
+            n_pares = (n_filhos + 1) // 2
+            
+            # SELEÇÃO: Escolhe os dois pais de cada par por torneio
+            pais1 = populacao[selecao_torneio(fitness_populacao, n_pares)]
+            pais2 = populacao[selecao_torneio(fitness_populacao, n_pares)]
+            estatisticas.marcar("selecao")
+            
+            # CROSSOVER: Gera dois filhos por par
+            filhos1, filhos2 = crossover_um_ponto(pais1, pais2)
+            
+            # Intercala filho1/filho2 de cada par, como na inserção sequencial
+            filhos = np.stack((filhos1, filhos2), axis=1).reshape(-1, n_bytes)[:n_filhos]
+            estatisticas.marcar("cruzamento")
+            
+            # MUTAÇÃO: Aplica mutação nos filhos
+            filhos = mutacao_bit(filhos)
+            estatisticas.marcar("mutacao")
             
             # 9. SUBSTITUI população antiga pela nova
-            populacao = nova_populacao[:pop_size]  # Garante tamanho exato
+            populacao = np.vstack((elite, filhos))[:pop_size]  # Garante tamanho exato
         
         # ========== RESULTADO FINAL ==========
+        # 'avaliacoes' já conta só os genomas realmente calculados (as falhas do cache)
+        estatisticas.contar("acertos_cache", cache.acertos if cache is not None else 0)
+        historico.finalizar()
+        historico.estatisticas = estatisticas.finalizar()
+        emissor.emitir(FIM, iteracao=geracoes_executadas, fitness=melhor_fitness_global, peso=melhor_peso_global,
+                       dados={"solucao": melhor_solucao_global, "motivo_parada": motivo_parada,
+                              "acertos_cache": cache.acertos if cache is not None else 0,
+                              "falhas_cache": cache.falhas if cache is not None else 0,
+                              "fitness_inicial": historico[0][1], "fitness_final": historico[-1][1],
+                              "estatisticas": estatisticas})
+        
+        return melhor_solucao_global, melhor_fitness_global, melhor_peso_global, historico
+
+    @classmethod
+    def executa_ag_ilhas(cls, itens, n_ilhas=4, intervalo_migracao=10, n_migrantes=2,
+                         topologia="anel", semente=None, mostrar_processo=False, **parametros):
+        """
+        Executa o Algoritmo Genético no modelo de ilhas: cada ilha evolui sua própria
+        população em um processo separado e, a cada 'intervalo_migracao' gerações,
+        envia seus melhores indivíduos às vizinhas através de memória compartilhada
+        
+        Args:
+            itens: Lista de ItemDataclass com nome, valor e peso (ou ItensArray)
+            n_ilhas: Número de ilhas, uma por processo (padrão: 4)
+            intervalo_migracao: Gerações entre migrações (padrão: 10)
+            n_migrantes: Indivíduos enviados por ilha a cada migração (padrão: 2)
+            topologia: "anel" (recebe da ilha anterior) ou "completa" (recebe os melhores de todas)
+            semente: Semente base; a ilha i usa semente + i (padrão: aleatória)
+            mostrar_processo: Se deve mostrar o resumo por ilha
+            **parametros: Parâmetros repassados ao executa_ag de cada ilha (pop_size, geracoes, ...)
+        
+        Returns:
+            tuple: (melhor_solucao, melhor_valor, melhor_peso, historicos)
+            historicos: lista com o histórico de cada ilha
+        """
+        if topologia not in ("anel", "completa"):
+            raise ValueError(f"Topologia desconhecida: {topologia}")
+        if intervalo_migracao <= 0:
+            raise ValueError("intervalo_migracao deve ser positivo")
+        if n_migrantes > parametros.get("pop_size", 50):
+            raise ValueError("n_migrantes não pode exceder o tamanho da população de cada ilha")
+        # As ilhas migram em sincronia (barreira): uma ilha não pode parar antes das outras
+        criterios_parada = ("geracoes_sem_melhoria", "diversidade_minima", "valor_alvo", "tempo_limite")
+        if any(parametros.get(criterio) is not None for criterio in criterios_parada):
+            raise ValueError("Critérios de parada antecipada não são suportados no modelo de ilhas")
+        
+        itens = ItensArray.de_itens(itens)
+        n_itens = len(itens)
+        
+        if semente is None:
+            semente = random.getrandbits(32)
+        
+        # Memória compartilhada: emigrantes empacotados (ilha x migrante x byte) seguidos de seus fitness
+        tamanho_genes = n_ilhas * n_migrantes * bytes_por_solucao(n_itens)
+        tamanho_fitness = n_ilhas * n_migrantes * np.dtype(np.float64).itemsize
+        memoria = shared_memory.SharedMemory(create=True, size=max(tamanho_genes + tamanho_fitness, 1))
+        
+        contexto = multiprocessing.get_context()
+        barreira = contexto.Barrier(n_ilhas)
+        fila = contexto.Queue()
+        
+        processos = [
+            contexto.Process(target=_evoluir_ilha,
+                             args=(ilha, n_ilhas, memoria.name, barreira, fila,
+                                   itens.nomes, itens.valores, itens.pesos_dimensoes, itens.grupos,
+                                   semente + ilha,
+                                   intervalo_migracao, n_migrantes, topologia, parametros))
+            for ilha in range(n_ilhas)
+        ]
+        
+        try:
+            for processo in processos:
+                processo.start()
+            
+            resultados = {}
+            while len(resultados) < n_ilhas:
+                try:
+                    ilha, resultado = fila.get(timeout=1)
+                    resultados[ilha] = resultado
+                except queue.Empty:
+                    if any(p.exitcode not in (None, 0) for p in processos):
+                        raise RuntimeError("Uma das ilhas do Algoritmo Genético falhou")
+            
+            for processo in processos:
+                processo.join()
+        finally:
+            for processo in processos:
+                if processo.is_alive():
+                    processo.terminate()
+            memoria.close()
+            memoria.unlink()
+        
+        melhor_ilha = max(range(n_ilhas), key=lambda i: resultados[i][1])
+        melhor_solucao, melhor_valor, melhor_peso, _ = resultados[melhor_ilha]
+        historicos = [resultados[i][3] for i in range(n_ilhas)]
+        
         if mostrar_processo:
-            print("\n" + "=" * 70)
-            print("🧬 RESULTADO FINAL DO ALGORITMO GENÉTICO")
+            print("🏝️  ALGORITMO GENÉTICO - MODELO DE ILHAS")
+            print(f"📊 {n_ilhas} ilhas, topologia {topologia}, {n_migrantes} migrantes a cada {intervalo_migracao} gerações")
             print("=" * 70)
+            for i in range(n_ilhas):
+                print(f"Ilha {i+1:2d}: Melhor=R${resultados[i][1]:6.0f} | Peso={resultados[i][2]:5.1f}kg")
+            print(f"\n✅ Melhor valor encontrado: R$ {melhor_valor:.2f} (ilha {melhor_ilha+1})")
         
-        itens_selecionados = [itens[i] for i in range(len(melhor_solucao_global)) if melhor_solucao_global[i] == 1]
+        return melhor_solucao, melhor_valor, melhor_peso, historicos
+
+def _evoluir_ilha(ilha, n_ilhas, nome_memoria, barreira, fila, nomes, valores, pesos, grupos, semente,
+                  intervalo_migracao, n_migrantes, topologia, parametros):
+    """Processo de uma ilha: executa o AG trocando elites pela memória compartilhada"""
+    memoria = shared_memory.SharedMemory(name=nome_memoria)
+    emigrantes = fitness_emigrantes = None
+    try:
+        n_bytes = bytes_por_solucao(len(pesos))
+        emigrantes = np.ndarray((n_ilhas, n_migrantes, n_bytes), dtype=np.uint8, buffer=memoria.buf)
+        fitness_emigrantes = np.ndarray((n_ilhas, n_migrantes), dtype=np.float64,
+                                        buffer=memoria.buf, offset=emigrantes.nbytes)
         
-        if mostrar_processo:
-            print(f"✅ Melhor valor encontrado: R$ {melhor_fitness_global:.2f}")
-            print(f"⚖️  Peso utilizado: {melhor_peso_global:.2f}kg / {capacidade_maxima}kg ({(melhor_peso_global/capacidade_maxima)*100:.1f}%)")
-            print(f"📈 Eficiência: {(melhor_fitness_global/melhor_peso_global):.2f} valor/kg")
-            print(f"🧬 Total de gerações: {geracoes}")
-            print(f"👥 Tamanho da população: {pop_size}")
-            print(f"🎒 Itens selecionados: {len(itens_selecionados)}")
-            
-            # Análise da evolução
-            fitness_inicial = historico[0][1]
-            fitness_final = historico[-1][1] 
-            melhoria = fitness_final - fitness_inicial
-            print(f"📊 Evolução: R$ {fitness_inicial:.0f} → R$ {fitness_final:.0f} (+{melhoria:.0f})")
-            
-            print(f"\n📋 COMPOSIÇÃO FINAL DA MOCHILA:")
-            valor_check = 0
-            peso_check = 0
-            
-            for i, item in enumerate(itens_selecionados, 1):
-                print(f"{i:2d}. {item.nome:8s}: R${item.valor:6.2f} ({item.peso:5.1f}kg) | Ratio: {item.ratio_valor_peso():5.2f}")
-                valor_check += item.valor
-                peso_check += item.peso
-            
-            print(f"\n🧮 Verificação: R$ {valor_check:.2f} | {peso_check:.1f}kg")
+        if topologia == "anel":
+            origens = [(ilha - 1) % n_ilhas]
+        else:
+            origens = [j for j in range(n_ilhas) if j != ilha]
         
-        return melhor_solucao_global, melhor_fitness_global, melhor_peso_global, historico
+        def migracao(geracao, populacao, fitness_populacao):
+            if geracao == 0 or geracao % intervalo_migracao != 0 or n_ilhas < 2:
+                return populacao
+            
+            # Publica a elite desta ilha
+            elite = np.argsort(-fitness_populacao, kind="stable")[:n_migrantes]
+            emigrantes[ilha] = populacao[elite]
+            fitness_emigrantes[ilha] = fitness_populacao[elite]
+            barreira.wait()
+            
+            # Recebe os melhores emigrantes das ilhas de origem
+            candidatos = emigrantes[origens].reshape(-1, n_bytes)
+            fitness_candidatos = fitness_emigrantes[origens].reshape(-1)
+            escolhidos = np.argsort(-fitness_candidatos, kind="stable")[:n_migrantes]
+            imigrantes = candidatos[escolhidos].copy()
+            barreira.wait()  # ninguém sobrescreve a área antes de todos lerem
+            
+            # Imigrantes substituem os piores indivíduos
+            piores = np.argsort(fitness_populacao, kind="stable")[:len(imigrantes)]
+            nova_populacao = populacao.copy()
+            nova_populacao[piores] = imigrantes
+            return nova_populacao
+        
+        random.seed(semente)
+        resultado = AG.executa_ag(ItensArray(nomes, valores, pesos, grupos=grupos), migracao=migracao,
+                                  mostrar_processo=False, **parametros)
+        fila.put((ilha, resultado))
+    except BaseException:
+        barreira.abort()
+        raise
+    finally:
+        # As visões precisam ser soltas antes de fechar o segmento compartilhado
+        emigrantes = fitness_emigrantes = None
+        memoria.close()
@@ -0,0 +1,197 @@
+import heapq
+import time
+from bisect import bisect_right
+from itertools import accumulate
+
+import numpy as np
+
+from itens import ItensArray
+
+class BB:
+    @classmethod
+    def executa_bb(cls, itens, capacidade_maxima=50, ordem_nos="profundidade", max_nos=None,
+                   tempo_limite=None, solucao_inicial=None, mostrar_processo=False):
+        """
+        Executa Branch and Bound com limitante da mochila fracionária (solução EXATA
+        quando termina dentro do orçamento)
+        
+        Args:
+            itens: Lista de ItemDataclass com nome, valor e peso (ou ItensArray)
+            capacidade_maxima: Capacidade máxima da mochila (padrão: 50)
+            ordem_nos: "profundidade" (busca em profundidade) ou "melhor" (melhor limitante primeiro)
+            max_nos: Orçamento de nós explorados (padrão: sem limite)
+            tempo_limite: Orçamento de tempo em segundos (padrão: sem limite)
+            solucao_inicial: Solução incumbente para aquecer a poda (ex.: resultado do SA ou AG);
+                             ignorada se exceder a capacidade
+            mostrar_processo: Se deve mostrar o processo detalhado
+        
+        Returns:
+            tuple: (melhor_solucao, melhor_valor, melhor_peso, historico)
+            historico: (nós explorados, nós podados, melhor valor, limitante superior) a cada
+            nova incumbente (limitante None) e ao final; a última entrada traz o limitante
+            superior provado, ou seja, o gap de otimalidade.
+        """
+        
+        itens = ItensArray.de_itens(itens)
+        
+        if not itens.simples:
+            raise ValueError("O Branch and Bound resolve apenas a mochila simples (um recurso, sem grupos)")
+        if ordem_nos not in ("profundidade", "melhor"):
+            raise ValueError(f"Ordem de nós desconhecida: {ordem_nos}")
+        
+        n_itens = len(itens)
+        
+        # Ordenação ÚNICA por ratio valor/peso (decrescente, estável)
+        ordem = np.argsort(-itens.ratios, kind="stable")
+        ordem_lista = ordem.tolist()
+        pesos = itens.pesos[ordem].tolist()
+        valores = itens.valores[ordem].tolist()
+        ratios = itens.ratios[ordem].tolist()
+        
+        # Somas prefixadas na ordem do ratio: o limitante de um nó sai de uma busca binária
+        pesos_acumulados = [0.0] + list(accumulate(pesos))
+        valores_acumulados = [0.0] + list(accumulate(valores))
+        
+        def limitante_fracionario(k, valor, peso):
+            """
+            Limitante superior guloso fracionário para os itens k.. com a capacidade restante.
+            Retorna (limitante, j): os itens k..j-1 cabem inteiros e j é o item de quebra
+            """
+            restante = capacidade_maxima - peso
+            j = bisect_right(pesos_acumulados, pesos_acumulados[k] + restante) - 1
+            j = max(j, k)
+            limitante = valor + valores_acumulados[j] - valores_acumulados[k]
+            if j < n_itens:
+                sobra = restante - (pesos_acumulados[j] - pesos_acumulados[k])
+                if sobra > 0:
+                    limitante += sobra * ratios[j]
+            return limitante, j
+        
+        def reconstruir(caminho, extras=()):
+            """Converte o caminho encadeado (índice, pai) do nó em solução binária"""
+            solucao = np.zeros(n_itens, dtype=np.uint8)
+            while caminho is not None:
+                indice, caminho = caminho
+                solucao[indice] = 1
+            solucao[list(extras)] = 1
+            return solucao
+        
+        # ========== INICIALIZAÇÃO ==========
+        if mostrar_processo:
+            print("🌳 BRANCH AND BOUND - PROBLEMA DA MOCHILA")
+            print(f"📊 Configuração: {n_itens} itens, {capacidade_maxima}kg, ordem {ordem_nos}")
+            print("=" * 70)
+        
+        melhor_solucao = np.zeros(n_itens, dtype=np.uint8)
+        melhor_valor = 0.0
+        
+        if solucao_inicial is not None:
+            solucao_inicial = np.asarray(solucao_inicial, dtype=np.uint8)
+            valor_inicial, peso_inicial = itens.avaliar(solucao_inicial)
+            if peso_inicial <= capacidade_maxima and valor_inicial > melhor_valor:
+                melhor_solucao = solucao_inicial.copy()
+                melhor_valor = valor_inicial
+                if mostrar_processo:
+                    print(f"🔥 Incumbente inicial: R$ {melhor_valor:.0f}")
+        
+        nos_explorados = 0
+        nos_podados = 0
+        historico = []
+        inicio = time.perf_counter()
+        
+        # Nó: (k, valor, peso, caminho, limitante) — itens ordem[0..k-1] já decididos
+        limitante_raiz, _ = limitante_fracionario(0, 0.0, 0.0)
+        raiz = (0, 0.0, 0.0, None, limitante_raiz)
+        
+        profundidade = ordem_nos == "profundidade"
+        abertos = [raiz] if profundidade else [(-limitante_raiz, 0, raiz)]
+        contador = 1
+        interrompido = False
+        
+        # ========== LAÇO PRINCIPAL DO BRANCH AND BOUND ==========
+        while abertos:
+            if max_nos is not None and nos_explorados >= max_nos:
+                interrompido = True
+                break
+            if tempo_limite is not None and nos_explorados % 1024 == 0 and time.perf_counter() - inicio > tempo_limite:
+                interrompido = True
+                break
+            
+            no = abertos.pop() if profundidade else heapq.heappop(abertos)[2]
+            k, valor, peso, caminho, limitante = no
+            
+            # PODA: o limitante pode ter ficado obsoleto desde que o nó foi gerado
+            if limitante <= melhor_valor:
+                nos_podados += 1
+                continue
+            
+            nos_explorados += 1
+            
+            # Completa gulosamente os itens que cabem inteiros: solução viável barata
+            _, j = limitante_fracionario(k, valor, peso)
+            valor_guloso = valor + valores_acumulados[j] - valores_acumulados[k]
+            if valor_guloso > melhor_valor:
+                melhor_valor = valor_guloso
+                melhor_solucao = reconstruir(caminho, ordem_lista[k:j])
+                historico.append((nos_explorados, nos_podados, melhor_valor, None))
+                if mostrar_processo:
+                    print(f"   ⭐ NOVA INCUMBENTE após {nos_explorados} nós: R$ {melhor_valor:.0f}")
+            
+            # Todos os itens restantes couberam: a completação gulosa é ótima nesta subárvore
+            if j >= n_itens:
+                continue
+            
+            # RAMIFICAÇÃO no item k: inclusão (ramo guloso) e exclusão
+            filhos = []
+            
+            # Exclui o item k
+            limitante_exc, _ = limitante_fracionario(k + 1, valor, peso)
+            filhos.append((k + 1, valor, peso, caminho, limitante_exc))
+            
+            # Inclui o item k (se couber)
+            if peso + pesos[k] <= capacidade_maxima:
+                valor_inc, peso_inc = valor + valores[k], peso + pesos[k]
+                limitante_inc, _ = limitante_fracionario(k + 1, valor_inc, peso_inc)
+                filhos.append((k + 1, valor_inc, peso_inc, (ordem_lista[k], caminho), limitante_inc))
+            
+            for filho in filhos:
+                if filho[4] <= melhor_valor:
+                    nos_podados += 1
+                    continue
+                if profundidade:
+                    abertos.append(filho)  # o último empilhado (inclusão) é explorado primeiro
+                else:
+                    heapq.heappush(abertos, (-filho[4], contador, filho))
+                    contador += 1
+        
+        # ========== RESULTADO FINAL ==========
+        if interrompido and abertos:
+            limites_abertos = (no[4] for no in abertos) if profundidade else (-no[0] for no in abertos)
+            limite_superior = float(max(melhor_valor, max(limites_abertos)))
+        else:
+            limite_superior = melhor_valor
+        
+        melhor_valor, melhor_peso = itens.avaliar(melhor_solucao)
+        historico.append((nos_explorados, nos_podados, melhor_valor, limite_superior))
+        
+        if mostrar_processo:
+            gerados = nos_explorados + nos_podados
+            taxa_poda = nos_podados / gerados * 100 if gerados else 0.0
+            gap = (limite_superior - melhor_valor) / limite_superior * 100 if limite_superior > 0 else 0.0
+            
+            print("\n" + "=" * 70)
+            print("🌳 RESULTADO FINAL DO BRANCH AND BOUND")
+            print("=" * 70)
+            print(f"✅ Melhor valor encontrado: R$ {melhor_valor:.2f}")
+            print(f"⚖️  Peso utilizado: {melhor_peso:.2f}kg / {capacidade_maxima}kg ({(melhor_peso/capacidade_maxima)*100:.1f}%)")
+            print(f"🔢 Nós explorados: {nos_explorados}")
+            print(f"✂️  Nós podados: {nos_podados} ({taxa_poda:.1f}%)")
+            print(f"📏 Limitante superior: R$ {limite_superior:.2f} (gap {gap:.2f}%)")
+            print("🏆 Ótimo provado" if not interrompido else "⏱️  Orçamento esgotado antes da prova de otimalidade")
+            
+            itens_selecionados = [itens[i] for i in np.flatnonzero(melhor_solucao)]
+            print(f"\n📋 COMPOSIÇÃO FINAL DA MOCHILA:")
+            for i, item in enumerate(itens_selecionados, 1):
+                print(f"{i:2d}. {item.nome:8s}: R${item.valor:6.2f} ({item.peso:5.1f}kg) | Ratio: {item.ratio_valor_peso():5.2f}")
+        
+        return melhor_solucao, melhor_valor, melhor_peso, historico
@@ -1,145 +1,279 @@
 import random
 
+import numpy as np
+
+from bits import SolucaoBits
+from eventos import FIM, INICIO, ITERACAO, MELHORIA, REPARO, SOLUCAO_INICIAL, Emissor
+from historico import Historico
+from instrumentacao import Estatisticas
+from itens import ItensArray
+from lote import InstanciasLote
+from reparo import Reparador
+
 class HC:
     @classmethod
-    def executa_hc(cls, itens, capacidade_maxima=50, max_iteracoes=300, mostrar_processo=False):
+    def executa_hc(cls, itens, capacidade_maxima=50, max_iteracoes=300, modo_busca="melhor",
+                   preencher_reparo=False, solucao_inicial=None, opcoes_historico=None, observadores=None,
+                   perfilar=False, rastrear_memoria=False, mostrar_processo=False):
+        """
+        Executa Hill Climbing para o problema da mochila
+        
+        Args:
+            itens: Lista de ItemDataclass com nome, valor e peso (ou ItensArray)
+            capacidade_maxima: Capacidade máxima da mochila (padrão: 50); com vários recursos,
+                               um vetor com a capacidade de cada um (ver restricoes.py)
+            max_iteracoes: Número máximo de iterações (padrão: 300)
+            modo_busca: "melhor" (melhor vizinho, vetorizado) ou "primeira" (primeiro vizinho
+                        que melhora, gerado sob demanda) (padrão: "melhor")
+            preencher_reparo: Se o reparo guloso da solução inicial também preenche a folga
+                              com os itens de maior ratio que ainda cabem (padrão: False)
+            solucao_inicial: Solução de partida (array 0/1 ou SolucaoBits) no lugar da aleatória,
+                             reparada se não couber; permite partir de uma solução conhecida (padrão: None)
+            opcoes_historico: Opções do Historico devolvido (intervalo, apenas_melhorias, limite,
+                              arquivo); por padrão registra todos os passos (ver historico.py)
+            observadores: Chamáveis que recebem os Eventos da execução (ver eventos.py)
+            perfilar: Se a execução roda sob cProfile (historico.estatisticas.perfil) (padrão: False)
+            rastrear_memoria: Se mede o pico de memória com tracemalloc (padrão: False)
+            mostrar_processo: Se deve mostrar o processo detalhado (RelatorioConsole)
+        
+        Returns:
+            tuple: (melhor_solucao, melhor_valor, melhor_peso, historico) - tempos por fase e
+                   contadores em historico.estatisticas (ver instrumentacao.py)
+        """
+        if modo_busca not in ("melhor", "primeira"):
+            raise ValueError(f"Modo de busca desconhecido: {modo_busca}")
+        
+        itens = ItensArray.de_itens(itens)
+        if solucao_inicial is not None and len(solucao_inicial) != len(itens):
+            raise ValueError("solucao_inicial deve ter um valor por item")
+        estatisticas = Estatisticas("HC", perfilar, rastrear_memoria).iniciar()
+        emissor = Emissor("HC", observadores, mostrar_processo)
+        reparador = Reparador(itens, capacidade_maxima)
+        restricoes = reparador.restricoes
+        
         def calcular_fitness(solucao):
-            peso_total = sum(itens[i].peso for i in range(len(solucao)) if solucao[i] == 1)
+            valor_total, peso_total = itens.avaliar(solucao)
             
-            if peso_total > capacidade_maxima:
+            viavel = peso_total <= capacidade_maxima if restricoes.simples else restricoes.viavel(solucao)
+            if not viavel:
                 return 0
             
-            valor_total = sum(itens[i].valor for i in range(len(solucao)) if solucao[i] == 1)
             return valor_total
         
         def gerar_solucao_inicial_aleatoria():
-            print("Gerando solução inicial aleatória...")
-            
-            solucao = [random.randint(0, 1) for _ in range(len(itens))]
-            
-            if mostrar_processo:
-                peso_inicial = sum(itens[i].peso for i in range(len(solucao)) if solucao[i] == 1)
-                valor_inicial = sum(itens[i].valor for i in range(len(solucao)) if solucao[i] == 1)
-                print(f"   Solução aleatória: peso={peso_inicial:.1f}kg, valor=R${valor_inicial:.0f}")
+            if solucao_inicial is None:
+                # Gerador NumPy derivado do módulo random: random.seed continua controlando a execução
+                solucao = np.random.default_rng(random.getrandbits(64)).integers(0, 2, size=len(itens), dtype=np.uint8)
+            else:
+                solucao = np.array(solucao_inicial, dtype=np.uint8)
             
-            peso_atual = sum(itens[i].peso for i in range(len(solucao)) if solucao[i] == 1)
+            relatar_reparo = emissor.escuta(REPARO)
+            if relatar_reparo:
+                valor_inicial, peso_inicial = itens.avaliar(solucao)
             
-            while peso_atual > capacidade_maxima:
-                itens_selecionados = [i for i in range(len(solucao)) if solucao[i] == 1]
-                if not itens_selecionados:
-                    break
-                
-                item_a_remover = min(itens_selecionados, key=lambda i: itens[i].ratio_valor_peso())
-                solucao[item_a_remover] = 0
-                peso_atual -= itens[item_a_remover].peso
-                
-                if mostrar_processo:
-                    print(f"   Removendo {itens[item_a_remover].nome} (ratio baixo)")
+            # Reparo guloso pela ordem de ratio pré-calculada (e preenchimento da folga, se pedido)
+            solucao, removidos = reparador.reparar_solucao(solucao, preencher=preencher_reparo)
             
-            if mostrar_processo:
-                peso_final = sum(itens[i].peso for i in range(len(solucao)) if solucao[i] == 1)
-                valor_final = sum(itens[i].valor for i in range(len(solucao)) if solucao[i] == 1)
-                print(f"   Solução reparada: peso={peso_final:.1f}kg, valor=R${valor_final:.0f}")
+            if relatar_reparo:
+                valor_final, peso_final = itens.avaliar(solucao)
+                emissor.emitir(REPARO, peso=peso_final,
+                               dados={"valor_inicial": valor_inicial, "peso_inicial": peso_inicial,
+                                      "removidos": removidos, "valor_final": valor_final})
             
-            return solucao
+            return SolucaoBits.de_array(solucao)
+        
+        def avaliar_vizinhanca(solucao, peso_total, valor_total):
+            """
+            REGRA 2: Avalia de uma vez todos os vizinhos por flip de 1 item,
+            como deltas vetorizados sobre os totais correntes da solução
+            """
+            selecionado = solucao.desempacotar() == 1
+            pesos_vizinhos = peso_total + np.where(selecionado, -itens.pesos, itens.pesos)
+            valores_vizinhos = valor_total + np.where(selecionado, -itens.valores, itens.valores)
+            if estado is None:
+                fitness_vizinhos = np.where(pesos_vizinhos > capacidade_maxima, 0.0, valores_vizinhos)
+            else:
+                fitness_vizinhos = np.where(estado.vizinhos_viaveis(selecionado), valores_vizinhos, 0.0)
+            return fitness_vizinhos, pesos_vizinhos, valores_vizinhos
         
-        def gerar_vizinhos_por_flip(solucao_atual):
+        def vizinhos_por_flip(solucao, peso_total, valor_total, inicio=0):
             """
-            REGRA 2: Geração de vizinhos por flip de 1 item por vez
+            REGRA 2: Percorre preguiçosamente os vizinhos por flip de 1 item, a partir da
+            posição 'inicio' (circular). Nenhum vizinho é materializado: cada um é avaliado
+            por delta sobre a solução corrente e gerado sob demanda
             """
-            vizinhos = []
-            for i in range(len(solucao_atual)):
-                vizinho = solucao_atual.copy()
-                vizinho[i] = 1 - vizinho[i]
-                vizinhos.append(vizinho)
-            return vizinhos
+            n_itens = len(solucao)
+            restrito = estado is not None
+            for deslocamento in range(n_itens):
+                i = (inicio + deslocamento) % n_itens
+                if solucao[i] == 1:
+                    novo_peso = peso_total - pesos[i]
+                    novo_valor = valor_total - valores[i]
+                else:
+                    novo_peso = peso_total + pesos[i]
+                    novo_valor = valor_total + valores[i]
+                
+                if restrito:
+                    sinal = -1 if solucao[i] == 1 else 1
+                    fitness = novo_valor if estado.viavel_apos_flip(i, sinal) else 0
+                else:
+                    fitness = 0 if novo_peso > capacidade_maxima else novo_valor
+                yield i, fitness, novo_peso, novo_valor
         
         def calcular_peso(solucao):
             """Calcula o peso total de uma solução"""
-            return sum(itens[i].peso for i in range(len(solucao)) if solucao[i] == 1)
+            return float(itens.pesos @ np.asarray(solucao))
+        
+        def calcular_valor(solucao):
+            """Calcula o valor total de uma solução"""
+            return float(itens.valores @ np.asarray(solucao))
+        
+        # Acesso escalar da busca de primeira melhoria (listas, exceto em arquivos mapeados)
+        pesos, valores = itens.colunas_escalares()
         
-        print("🔍 HILL CLIMBING - PROBLEMA DA MOCHILA")
-        print(f"📊 Configuração: {len(itens)} itens, {capacidade_maxima}kg, máx {max_iteracoes} iterações")
-        print("📋 Regras: Solução aleatória reparada + Flip de 1 item + Parada por iteração/estagnação")
-        print("=" * 70)
+        emissor.emitir(INICIO, dados={"itens": itens, "capacidade": capacidade_maxima,
+                                      "max_iteracoes": max_iteracoes, "modo_busca": modo_busca})
         
         solucao_atual = gerar_solucao_inicial_aleatoria()
         fitness_atual = calcular_fitness(solucao_atual)
+        # Várias restrições: viabilidade dos flips por delta sobre o uso corrente de cada recurso
+        estado = None if restricoes.simples else restricoes.estado(solucao_atual)
         peso_atual = calcular_peso(solucao_atual)
+        valor_atual = calcular_valor(solucao_atual)
         
         melhor_solucao = solucao_atual.copy()
         melhor_fitness = fitness_atual
         melhor_peso = peso_atual
         
-        historico = [(0, fitness_atual, peso_atual)]
+        historico = Historico(("iteracao", "fitness", "peso"), **(opcoes_historico or {}))
+        historico.registrar(0, fitness_atual, peso_atual)
+        estatisticas.marcar("inicializacao")
         
-        if mostrar_processo:
-            itens_iniciais = [itens[i].nome for i in range(len(solucao_atual)) if solucao_atual[i] == 1]
-            print(f"\n🏁 Solução inicial:")
-            print(f"Item  0: Valor=R${fitness_atual:6.0f}, Peso={peso_atual:5.1f}kg, Itens={len(itens_iniciais)}")
-            if len(itens_iniciais) <= 8:
-                print(f"         Itens: {', '.join(itens_iniciais)}")
-            print()
+        emissor.emitir(SOLUCAO_INICIAL, fitness=fitness_atual, peso=peso_atual, dados={"solucao": solucao_atual})
         
-        iteracao_atual = 0
+        # Consultados uma vez: sem observadores, o laço não monta nenhum evento
+        relatar_iteracoes = emissor.escuta(ITERACAO)
+        relatar_melhorias = emissor.escuta(MELHORIA)
+        
+        posicao_inicio = 0
+        iteracoes_executadas = 0
+        vizinhos_avaliados = 0
+        n_itens = len(itens)
+        motivo_parada = "limite_iteracoes"
         
         for iteracao in range(1, max_iteracoes + 1):
-            iteracao_atual = iteracao
-            
-            vizinhos = gerar_vizinhos_por_flip(solucao_atual)
-
-            melhor_vizinho = None
-            melhor_fitness_vizinho = fitness_atual
-            
-            for vizinho in vizinhos:
-                fitness_vizinho = calcular_fitness(vizinho)
-                if fitness_vizinho > melhor_fitness_vizinho:
-                    melhor_vizinho = vizinho
-                    melhor_fitness_vizinho = fitness_vizinho
+            if modo_busca == "melhor":
+                fitness_vizinhos, pesos_vizinhos, valores_vizinhos = avaliar_vizinhanca(solucao_atual, peso_atual, valor_atual)
+                melhor_posicao = int(np.argmax(fitness_vizinhos))
+                vizinhos_avaliados += n_itens
+                
+                if fitness_vizinhos[melhor_posicao] > fitness_atual:
+                    movimento = (melhor_posicao, float(fitness_vizinhos[melhor_posicao]),
+                                 float(pesos_vizinhos[melhor_posicao]), float(valores_vizinhos[melhor_posicao]))
+                else:
+                    movimento = None
+            else:
+                # Primeira melhoria: a varredura continua de onde o último movimento parou
+                movimento = next((vizinho for vizinho in vizinhos_por_flip(solucao_atual, peso_atual, valor_atual, posicao_inicio)
+                                  if vizinho[1] > fitness_atual), None)
+                # A varredura para no vizinho aceito: conta só os gerados até ele
+                vizinhos_avaliados += n_itens if movimento is None else (movimento[0] - posicao_inicio) % n_itens + 1
             
-            if melhor_vizinho is None:
-                print(f"ESTAGNAÇÃO na iteração {iteracao-1}")
-                print("   Nenhum vizinho oferece melhoria no fitness!")
+            if movimento is None:
+                motivo_parada = "estagnacao"
                 break
             
-            solucao_atual = melhor_vizinho
-            fitness_atual = melhor_fitness_vizinho
-            peso_atual = calcular_peso(solucao_atual)
+            posicao, fitness_atual, peso_atual, valor_atual = movimento
+            solucao_atual.inverter(posicao)
+            if estado is not None:
+                estado.aplicar_flip(posicao, 1 if solucao_atual[posicao] == 1 else -1)
+            posicao_inicio = posicao + 1
+            iteracoes_executadas = iteracao
             
             if fitness_atual > melhor_fitness:
                 melhor_solucao = solucao_atual.copy()
                 melhor_fitness = fitness_atual
                 melhor_peso = peso_atual
+                if relatar_melhorias:
+                    emissor.emitir(MELHORIA, iteracao=iteracao, fitness=fitness_atual, peso=peso_atual,
+                                   dados={"posicao": posicao})
             
-            historico.append((iteracao, fitness_atual, peso_atual))
+            historico.registrar(iteracao, fitness_atual, peso_atual)
             
-            if mostrar_processo and (iteracao <= 5 or iteracao % 50 == 0):
-                print(f"Item {iteracao:3d}: Valor=R${fitness_atual:6.0f}, Peso={peso_atual:5.1f}kg")
+            if relatar_iteracoes:
+                emissor.emitir(ITERACAO, iteracao=iteracao, fitness=fitness_atual, peso=peso_atual,
+                               aceito=True, dados={"posicao": posicao})
+        
+        estatisticas.marcar("busca")
+        # Cada vizinho avaliado é um movimento proposto; só os de melhoria são aceitos
+        estatisticas.contar("avaliacoes", 1 + vizinhos_avaliados)
+        estatisticas.contar("propostos", vizinhos_avaliados)
+        estatisticas.contar("aceitos", iteracoes_executadas)
+        historico.finalizar()
+        historico.estatisticas = estatisticas.finalizar()
+        emissor.emitir(FIM, iteracao=iteracoes_executadas, fitness=melhor_fitness, peso=melhor_peso,
+                       dados={"solucao": melhor_solucao, "motivo_parada": motivo_parada,
+                              "estatisticas": estatisticas})
         
-        if iteracao_atual == max_iteracoes:
-            print(f"⏱️  LIMITE DE ITERAÇÕES atingido ({max_iteracoes})")
+        return melhor_solucao, melhor_fitness, melhor_peso, historico
+
+    @classmethod
+    def executa_hc_lote(cls, instancias, max_iteracoes=300, solucoes_iniciais=None):
+        """
+        Executa Hill Climbing (melhor melhoria) em muitas instâncias pequenas de uma vez: a
+        vizinhança de todas é avaliada em um único passo matricial por iteração, e cada
+        instância sai do lote ao atingir seu ótimo local. Com as mesmas soluções iniciais, o
+        resultado de cada instância é o mesmo de executa_hc com modo_busca="melhor"
         
-        print("\n" + "=" * 70)
-        print("🏆 RESULTADO FINAL DO HILL CLIMBING")
-        print("=" * 70)
+        Args:
+            instancias: Lista de (itens, capacidade) - mochilas simples, de tamanhos quaisquer
+            max_iteracoes: Número máximo de iterações por instância (padrão: 300)
+            solucoes_iniciais: Uma solução de partida por instância, reparada se não couber;
+                               None sorteia soluções aleatórias (padrão: None)
         
-        itens_selecionados = [itens[i] for i in range(len(melhor_solucao)) if melhor_solucao[i] == 1]
+        Returns:
+            list: (melhor_solucao, melhor_valor, melhor_peso, iteracoes) de cada instância
+        """
+        lote = InstanciasLote(instancias)
+        linhas_lote = np.arange(len(lote))
         
-        print(f"Melhor valor encontrado: R$ {melhor_fitness:.2f}")
-        print(f"Peso utilizado: {melhor_peso:.2f}kg / {capacidade_maxima}kg ({(melhor_peso/capacidade_maxima)*100:.1f}%)")
-        print(f"Eficiência: {(melhor_fitness/melhor_peso):.2f} valor/kg")
-        print(f"Total de iterações executadas: {len(historico)-1}")
-        print(f"Quantidade de itens selecionados: {len(itens_selecionados)}")
+        if solucoes_iniciais is None:
+            # Gerador NumPy derivado do módulo random: random.seed continua controlando a execução
+            estados = lote.aleatorias(np.random.default_rng(random.getrandbits(64)))
+        else:
+            estados = lote.empilhar(solucoes_iniciais)
+        estados = lote.reparar(estados)
+        valores_atuais, pesos_atuais = lote.totais(estados)
+        fitness_atuais = np.where(pesos_atuais > lote.capacidades, 0.0, valores_atuais)
         
-        print(f"\n📋 COMPOSIÇÃO FINAL DA MOCHILA:")
-        valor_check = 0
-        peso_check = 0
+        ativas = np.ones(len(lote), dtype=bool)
+        iteracoes = np.zeros(len(lote), dtype=np.int64)
         
-        for i, item in enumerate(itens_selecionados, 1):
-            print(f"{i:2d}. {item.nome:8s}: R${item.valor:6.2f} ({item.peso:5.1f}kg) | Ratio: {item.ratio_valor_peso():5.2f}")
-            valor_check += item.valor
-            peso_check += item.peso
+        for iteracao in range(1, max_iteracoes + 1):
+            linhas = linhas_lote[ativas]
+            if len(linhas) == 0:
+                break
+            
+            # REGRA 2 em lote: todos os vizinhos por flip de todas as instâncias ativas
+            selecionado = estados[linhas] == 1
+            pesos_vizinhos = pesos_atuais[linhas, np.newaxis] + np.where(selecionado, -lote.pesos[linhas], lote.pesos[linhas])
+            valores_vizinhos = valores_atuais[linhas, np.newaxis] + np.where(selecionado, -lote.valores[linhas], lote.valores[linhas])
+            fitness_vizinhos = np.where(pesos_vizinhos > lote.capacidades[linhas, np.newaxis], 0.0, valores_vizinhos)
+            fitness_vizinhos[~lote.validos[linhas]] = -np.inf
+            
+            posicoes = np.argmax(fitness_vizinhos, axis=1)
+            indices = np.arange(len(linhas))
+            melhora = fitness_vizinhos[indices, posicoes] > fitness_atuais[linhas]
+            # Sem vizinho melhor: ótimo local, a instância para (estagnação)
+            ativas[linhas[~melhora]] = False
+            
+            movidas, posicoes, indices = linhas[melhora], posicoes[melhora], indices[melhora]
+            estados[movidas, posicoes] ^= 1
+            fitness_atuais[movidas] = fitness_vizinhos[indices, posicoes]
+            pesos_atuais[movidas] = pesos_vizinhos[indices, posicoes]
+            valores_atuais[movidas] = valores_vizinhos[indices, posicoes]
+            iteracoes[movidas] = iteracao
         
-        print(f"\n🧮 Verificação: R$ {valor_check:.2f} | {peso_check:.1f}kg")
-
-        return melhor_solucao, melhor_fitness, melhor_peso, historico
+        # Só movimentos de melhoria: a solução corrente de cada instância é a melhor
+        return [(solucao, float(fitness), float(peso), int(n))
+                for solucao, fitness, peso, n in zip(lote.separar(estados), fitness_atuais, pesos_atuais, iteracoes)]
@@ -0,0 +1,146 @@
+import numpy as np
+
+from itens import ItensArray
+
+class PD:
+    @classmethod
+    def executa_pd(cls, itens, capacidade_maxima=50, modo="hirschberg", limite_tabela=1 << 20,
+                   mostrar_processo=False):
+        """
+        Executa Programação Dinâmica (solução EXATA) para o problema da mochila 0/1
+        
+        Args:
+            itens: Lista de ItemDataclass com nome, valor e peso (ou ItensArray); pesos inteiros
+            capacidade_maxima: Capacidade máxima da mochila (padrão: 50)
+            modo: "valor" (tabela 1-D rolante, apenas valor ótimo) ou
+                  "hirschberg" (divisão e conquista, reconstrói os itens em memória O(capacidade))
+            limite_tabela: Nº máximo de células (itens x capacidade) para resolver um subproblema
+                           com tabela completa de decisões no modo hirschberg (padrão: 2^20)
+            mostrar_processo: Se deve mostrar o processo detalhado
+        
+        Returns:
+            tuple: (melhor_solucao, melhor_valor, melhor_peso, historico)
+            No modo "valor", melhor_solucao é None e melhor_peso é o menor peso
+            com que o valor ótimo é atingido.
+        """
+        
+        itens = ItensArray.de_itens(itens)
+        
+        if not itens.simples:
+            raise ValueError("A Programação Dinâmica resolve apenas a mochila simples (um recurso, sem grupos)")
+        if modo not in ("valor", "hirschberg"):
+            raise ValueError(f"Modo de PD desconhecido: {modo}")
+        
+        pesos = np.rint(itens.pesos).astype(np.int64)
+        if not np.array_equal(pesos, itens.pesos) or (pesos < 0).any():
+            raise ValueError("A Programação Dinâmica exige pesos inteiros não negativos")
+        
+        capacidade = int(np.floor(capacidade_maxima))
+        valores = itens.valores
+        
+        def tabela_rolante(indices, capacidade):
+            """
+            Tabela 1-D rolante: melhor[c] = maior valor com peso <= c usando os itens dados.
+            Cada item atualiza a tabela inteira de uma vez (vetorizado sobre a capacidade)
+            """
+            melhor = np.zeros(capacidade + 1)
+            for i in indices:
+                peso, valor = pesos[i], valores[i]
+                if peso > capacidade:
+                    continue
+                candidato = melhor[:capacidade + 1 - peso] + valor
+                np.maximum(melhor[peso:], candidato, out=melhor[peso:])
+            return melhor
+        
+        def resolver_com_tabela(indices, capacidade, solucao):
+            """Caso base: tabela completa de decisões (itens x capacidade) com reconstrução"""
+            melhor = np.zeros(capacidade + 1)
+            decisoes = np.zeros((len(indices), capacidade + 1), dtype=bool)
+            for linha, i in enumerate(indices):
+                peso, valor = pesos[i], valores[i]
+                if peso > capacidade:
+                    continue
+                candidato = melhor[:capacidade + 1 - peso] + valor
+                pega = candidato > melhor[peso:]
+                decisoes[linha, peso:] = pega
+                melhor[peso:] = np.where(pega, candidato, melhor[peso:])
+            
+            c = capacidade
+            for linha in range(len(indices) - 1, -1, -1):
+                if decisoes[linha, c]:
+                    solucao[indices[linha]] = 1
+                    c -= pesos[indices[linha]]
+        
+        def hirschberg(indices, capacidade, solucao, profundidade):
+            """
+            Divisão e conquista de Hirschberg: as tabelas rolantes da primeira metade
+            (para frente) e da segunda metade (de trás para frente) indicam como dividir
+            a capacidade entre as metades; cada metade é então resolvida recursivamente
+            """
+            if len(indices) == 0 or capacidade < 0:
+                return
+            if len(indices) * (capacidade + 1) <= limite_tabela or len(indices) == 1:
+                resolver_com_tabela(indices, capacidade, solucao)
+                return
+            
+            meio = len(indices) // 2
+            primeira, segunda = indices[:meio], indices[meio:]
+            
+            frente = tabela_rolante(primeira, capacidade)
+            tras = tabela_rolante(segunda, capacidade)
+            capacidade_primeira = int(np.argmax(frente + tras[::-1]))
+            
+            historico.append((profundidade, len(indices), capacidade, capacidade_primeira))
+            
+            hirschberg(primeira, capacidade_primeira, solucao, profundidade + 1)
+            hirschberg(segunda, capacidade - capacidade_primeira, solucao, profundidade + 1)
+        
+        # ========== INICIALIZAÇÃO ==========
+        if mostrar_processo:
+            print("📐 PROGRAMAÇÃO DINÂMICA - PROBLEMA DA MOCHILA")
+            print(f"📊 Configuração: {len(itens)} itens, {capacidade_maxima}kg, modo {modo}")
+            print("=" * 70)
+        
+        if capacidade < 0:
+            melhor_solucao = np.zeros(len(itens), dtype=np.uint8)
+            return melhor_solucao, 0.0, 0.0, []
+        
+        # Itens de peso zero e valor positivo sempre entram; o resto vai para a PD
+        gratuitos = np.flatnonzero((pesos == 0) & (valores > 0))
+        indices = np.flatnonzero((pesos > 0) & (pesos <= capacidade) & (valores > 0))
+        
+        if modo == "valor":
+            # Histórico: (nº de itens processados, melhor valor na capacidade máxima)
+            historico = [(0, 0.0)]
+            melhor = np.zeros(capacidade + 1)
+            for k, i in enumerate(indices, 1):
+                candidato = melhor[:capacidade + 1 - pesos[i]] + valores[i]
+                np.maximum(melhor[pesos[i]:], candidato, out=melhor[pesos[i]:])
+                historico.append((k, float(melhor[capacidade])))
+            
+            melhor_valor = float(melhor[capacidade] + valores[gratuitos].sum())
+            # A tabela é não decrescente: o primeiro c que atinge o ótimo é o menor peso ótimo
+            melhor_peso = float(np.argmax(melhor >= melhor[capacidade]))
+            melhor_solucao = None
+        
+        else:
+            # Histórico: (profundidade, nº de itens, capacidade, capacidade da 1ª metade) por divisão
+            historico = []
+            melhor_solucao = np.zeros(len(itens), dtype=np.uint8)
+            melhor_solucao[gratuitos] = 1
+            hirschberg(indices, capacidade, melhor_solucao, 0)
+            melhor_valor, melhor_peso = itens.avaliar(melhor_solucao)
+        
+        # ========== RESULTADO FINAL ==========
+        if mostrar_processo:
+            print(f"✅ Valor ótimo: R$ {melhor_valor:.2f}")
+            print(f"⚖️  Peso utilizado: {melhor_peso:.2f}kg / {capacidade_maxima}kg ({(melhor_peso/capacidade_maxima)*100:.1f}%)")
+            
+            if melhor_solucao is not None:
+                itens_selecionados = [itens[i] for i in np.flatnonzero(melhor_solucao)]
+                print(f"🎒 Itens selecionados: {len(itens_selecionados)}")
+                print(f"\n📋 COMPOSIÇÃO FINAL DA MOCHILA:")
+                for i, item in enumerate(itens_selecionados, 1):
+                    print(f"{i:2d}. {item.nome:8s}: R${item.valor:6.2f} ({item.peso:5.1f}kg) | Ratio: {item.ratio_valor_peso():5.2f}")
+        
+        return melhor_solucao, melhor_valor, melhor_peso, historico
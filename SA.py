@@ -1,90 +1,155 @@
 import random
 import math
+import time
+
+import numpy as np
+
+from bits import SolucaoBits, empacotar
+from eventos import (FIM, FIM_CICLO, INICIO, INICIO_CICLO, ITERACAO, MELHORIA, REAQUECIMENTO,
+                     REPARO, SOLUCAO_INICIAL, Emissor)
+from historico import Historico
+from instrumentacao import Estatisticas
+from itens import ItensArray
+from lote import InstanciasLote
+from reparo import Reparador
 
 class SA:
     @classmethod
     def executa_sa(cls, itens, capacidade_maxima=50, T0=50.0, Tmin=0.1, 
-                   alpha=0.95, passos_por_T=30, mostrar_processo=False):
+                   alpha=0.95, passos_por_T=30, resfriamento="geometrico", beta=None,
+                   aceitacao_inicial=0.8, reaquecer_apos=None, fator_reaquecimento=0.5,
+                   max_reaquecimentos=3, ciclos_congelados=None, tempo_limite=None,
+                   max_avaliacoes=None, preencher_reparo=False, solucao_inicial=None,
+                   opcoes_historico=None, observadores=None, perfilar=False, rastrear_memoria=False,
+                   mostrar_processo=False):
         """
         Executa algoritmo Simulated Annealing para o problema da mochila
         
         Args:
-            itens: Lista de ItemDataclass com nome, valor e peso
-            capacidade_maxima: Capacidade máxima da mochila (padrão: 50)
-            T0: Temperatura inicial (padrão: 50.0)
+            itens: Lista de ItemDataclass com nome, valor e peso (ou ItensArray)
+            capacidade_maxima: Capacidade máxima da mochila (padrão: 50); com vários recursos,
+                               um vetor com a capacidade de cada um (ver restricoes.py)
+            T0: Temperatura inicial, ou "auto" para calibrá-la por amostragem de vizinhos (padrão: 50.0)
             Tmin: Temperatura mínima (padrão: 0.1)
             alpha: Taxa de resfriamento (padrão: 0.95)
             passos_por_T: Passos por temperatura (padrão: 30)
-            mostrar_processo: Se deve mostrar o processo detalhado
+            resfriamento: "geometrico" (T *= alpha), "lundy_mees" (T /= 1 + beta*T) ou
+                          "adaptativo" (T ajustada a cada ciclo para seguir uma taxa de aceitação
+                          alvo decrescente, de Lam modificado) (padrão: "geometrico")
+            beta: Parâmetro de Lundy-Mees; None chega a Tmin no mesmo nº de ciclos do geométrico
+            aceitacao_inicial: Probabilidade de aceitar a piora média quando T0="auto" (padrão: 0.8)
+            reaquecer_apos: Ciclos sem melhorar a melhor solução até reaquecer, voltando à melhor
+                            solução com T = fator_reaquecimento * T0; None desativa (padrão: None)
+            fator_reaquecimento: Fração de T0 usada no reaquecimento (padrão: 0.5)
+            max_reaquecimentos: Máximo de reaquecimentos por execução (padrão: 3)
+            ciclos_congelados: Para após esse nº de ciclos seguidos sem nenhum movimento aceito;
+                               None desativa (padrão: None)
+            tempo_limite: Orçamento em segundos, verificado ao fim de cada ciclo (padrão: None)
+            max_avaliacoes: Orçamento de vizinhos avaliados (passos) (padrão: None)
+            preencher_reparo: Se o reparo guloso da solução inicial também preenche a folga
+                              com os itens de maior ratio que ainda cabem (padrão: False)
+            solucao_inicial: Solução de partida (array 0/1 ou SolucaoBits) no lugar da aleatória,
+                             reparada se não couber; permite partir de uma solução conhecida (padrão: None)
+            opcoes_historico: Opções do Historico devolvido (intervalo, apenas_melhorias, limite,
+                              arquivo); por padrão registra todos os passos (ver historico.py)
+            observadores: Chamáveis que recebem os Eventos da execução (ver eventos.py)
+            perfilar: Se a execução roda sob cProfile (historico.estatisticas.perfil) (padrão: False)
+            rastrear_memoria: Se mede o pico de memória com tracemalloc (padrão: False)
+            mostrar_processo: Se deve mostrar o processo detalhado (RelatorioConsole)
         
         Returns:
-            tuple: (melhor_solucao, melhor_valor, melhor_peso, historico)
+            tuple: (melhor_solucao, melhor_valor, melhor_peso, historico) - tempos por fase,
+                   avaliações e taxa de aceitação em historico.estatisticas (ver instrumentacao.py)
         """
         
+        if resfriamento not in ("geometrico", "lundy_mees", "adaptativo"):
+            raise ValueError(f"Resfriamento desconhecido: {resfriamento}")
+        if passos_por_T < 1:
+            raise ValueError("passos_por_T deve ser pelo menos 1")
+        if not 0 < aceitacao_inicial < 1:
+            raise ValueError("aceitacao_inicial deve estar entre 0 e 1")
+        
+        inicio_execucao = time.perf_counter()
+        itens = ItensArray.de_itens(itens)
+        if solucao_inicial is not None and len(solucao_inicial) != len(itens):
+            raise ValueError("solucao_inicial deve ter um valor por item")
+        estatisticas = Estatisticas("SA", perfilar, rastrear_memoria).iniciar()
+        emissor = Emissor("SA", observadores, mostrar_processo)
+        reparador = Reparador(itens, capacidade_maxima)
+        restricoes = reparador.restricoes
+        
+        # Gerador NumPy derivado do módulo random: random.seed continua controlando a execução
+        rng = np.random.default_rng(random.getrandbits(64))
+        
         def calcular_fitness(solucao):
             """Calcula o fitness (valor total) de uma solução - IGUAL ao HC"""
-            peso_total = sum(itens[i].peso for i in range(len(solucao)) if solucao[i] == 1)
+            valor_total, peso_total = itens.avaliar(solucao)
             
-            if peso_total > capacidade_maxima:
+            viavel = peso_total <= capacidade_maxima if restricoes.simples else restricoes.viavel(solucao)
+            if not viavel:
                 return 0
             
-            valor_total = sum(itens[i].valor for i in range(len(solucao)) if solucao[i] == 1)
             return valor_total
         
         def gerar_solucao_inicial_aleatoria():
             """Gera solução inicial aleatória e reparada - IGUAL ao HC"""
-            if mostrar_processo:
-                print("🎲 Gerando solução inicial aleatória...")
-            
-            solucao = [random.randint(0, 1) for _ in range(len(itens))]
-            
-            if mostrar_processo:
-                peso_inicial = sum(itens[i].peso for i in range(len(solucao)) if solucao[i] == 1)
-                valor_inicial = sum(itens[i].valor for i in range(len(solucao)) if solucao[i] == 1)
-                print(f"   Solução aleatória: peso={peso_inicial:.1f}kg, valor=R${valor_inicial:.0f}")
+            if solucao_inicial is None:
+                solucao = rng.integers(0, 2, size=len(itens), dtype=np.uint8)
+            else:
+                solucao = np.array(solucao_inicial, dtype=np.uint8)
             
-            # Processo de reparo
-            peso_atual = sum(itens[i].peso for i in range(len(solucao)) if solucao[i] == 1)
+            relatar_reparo = emissor.escuta(REPARO)
+            if relatar_reparo:
+                valor_inicial, peso_inicial = itens.avaliar(solucao)
             
-            while peso_atual > capacidade_maxima:
-                itens_selecionados = [i for i in range(len(solucao)) if solucao[i] == 1]
-                if not itens_selecionados:
-                    break
-                
-                item_a_remover = min(itens_selecionados, key=lambda i: itens[i].ratio_valor_peso())
-                solucao[item_a_remover] = 0
-                peso_atual -= itens[item_a_remover].peso
-                
-                if mostrar_processo:
-                    print(f"   Removendo {itens[item_a_remover].nome} (ratio baixo)")
+            # Reparo guloso pela ordem de ratio pré-calculada (e preenchimento da folga, se pedido)
+            solucao, removidos = reparador.reparar_solucao(solucao, preencher=preencher_reparo)
             
-            if mostrar_processo:
-                peso_final = sum(itens[i].peso for i in range(len(solucao)) if solucao[i] == 1)
-                valor_final = sum(itens[i].valor for i in range(len(solucao)) if solucao[i] == 1)
-                print(f"   Solução reparada: peso={peso_final:.1f}kg, valor=R${valor_final:.0f}")
+            if relatar_reparo:
+                valor_final, peso_final = itens.avaliar(solucao)
+                emissor.emitir(REPARO, peso=peso_final,
+                               dados={"valor_inicial": valor_inicial, "peso_inicial": peso_inicial,
+                                      "removidos": removidos, "valor_final": valor_final})
             
-            return solucao
+            return SolucaoBits.de_array(solucao)
         
-        def gerar_vizinho_aleatorio(solucao_atual):
+        def sortear_flip(solucao_atual, peso_total, valor_total, posicao):
             """
-            DIFERENÇA PRINCIPAL: Gera apenas 1 vizinho aleatório (não todos os 15)
+            DIFERENÇA PRINCIPAL: Avalia apenas 1 vizinho aleatório (não todos os 15), o do
+            flip na posição sorteada, em O(1) pelo delta do item invertido, sem copiar a solução
             """
-            vizinho = solucao_atual.copy()
-            posicao = random.randint(0, len(solucao_atual) - 1)
-            vizinho[posicao] = 1 - vizinho[posicao]  # Flip
-            return vizinho, posicao
+            if solucao_atual[posicao] == 1:
+                novo_peso = peso_total - pesos[posicao]
+                novo_valor = valor_total - valores[posicao]
+            else:
+                novo_peso = peso_total + pesos[posicao]
+                novo_valor = valor_total + valores[posicao]
+            
+            fitness = 0 if novo_peso > capacidade_maxima else novo_valor
+            return posicao, fitness, novo_peso, novo_valor
         
-        def aceitar_solucao(fitness_atual, fitness_vizinho, temperatura):
+        def sortear_flip_restrito(solucao_atual, peso_total, valor_total, posicao):
+            """sortear_flip com vários recursos / grupos: viabilidade pelo delta de todas as restrições"""
+            sinal = -1 if solucao_atual[posicao] == 1 else 1
+            
+            novo_peso = peso_total + sinal * pesos[posicao]
+            novo_valor = valor_total + sinal * valores[posicao]
+            fitness = novo_valor if estado.viavel_apos_flip(posicao, sinal) else 0
+            return posicao, fitness, novo_peso, novo_valor
+        
+        def aceitar_solucao(fitness_atual, fitness_vizinho, temperatura, sorteio):
             """
-            CORAÇÃO DO SIMULATED ANNEALING: Critério de aceitação probabilístico
+            CORAÇÃO DO SIMULATED ANNEALING: Critério de aceitação probabilístico, contra o
+            uniforme 'sorteio' do passo. Retorna (aceita, probabilidade); a probabilidade é
+            None quando o sorteio não foi usado
             """
             if fitness_vizinho > fitness_atual:
                 # Sempre aceita se melhor
-                return True, "MELHOR"
+                return True, None
             
             if temperatura <= 0:
                 # Se temperatura zero, não aceita pior
-                return False, "T_ZERO"
+                return False, None
             
             # Calcula probabilidade de aceitar solução PIOR
             delta = fitness_vizinho - fitness_atual  # Será negativo (pior)
@@ -94,26 +159,67 @@ class SA:
                 probabilidade = 0.0
             
             # Decisão probabilística
-            if random.random() < probabilidade:
-                return True, f"PROB_{probabilidade:.3f}"
+            return sorteio < probabilidade, probabilidade
+        
+        def calibrar_temperatura(solucao, peso_total, valor_total, amostras=200):
+            """
+            T0 automático: a temperatura em que a piora média entre vizinhos sorteados
+            é aceita com probabilidade 'aceitacao_inicial'. Vizinhos inviáveis (fitness 0
+            pela penalização) só entram se não houver piora viável na amostra
+            """
+            posicoes = rng.integers(0, len(solucao), size=amostras)
+            estatisticas.contar("avaliacoes", amostras)
+            sinal = np.where(solucao.desempacotar()[posicoes] == 1, -1.0, 1.0)
+            pesos_vizinhos = peso_total + sinal * itens.pesos[posicoes]
+            valores_vizinhos = valor_total + sinal * itens.valores[posicoes]
+            if estado is None:
+                viaveis = pesos_vizinhos <= capacidade_maxima
+                fitness_solucao = 0 if peso_total > capacidade_maxima else valor_total
+            else:
+                viaveis = estado.vizinhos_viaveis(solucao.desempacotar() == 1)[posicoes]
+                fitness_solucao = valor_total if estado.violacoes == 0 else 0
+            pioras = fitness_solucao - np.where(viaveis, valores_vizinhos, 0.0)
+            pioras_viaveis = pioras[(pioras > 0) & viaveis]
+            if len(pioras_viaveis) > 0:
+                piora_media = pioras_viaveis.mean()
+            elif (pioras > 0).any():
+                piora_media = pioras[pioras > 0].mean()
             else:
-                return False, f"REJ_{probabilidade:.3f}"
+                piora_media = max(float(itens.valores[posicoes].mean()), 1.0)
+            
+            return float(piora_media / -math.log(aceitacao_inicial))
+        
+        def taxa_alvo(progresso):
+            """Taxa de aceitação alvo do resfriamento adaptativo (Lam modificado) no progresso [0, 1]"""
+            if progresso < 0.15:
+                return 0.44 + 0.56 * 560 ** (-progresso / 0.15)
+            if progresso < 0.65:
+                return 0.44
+            return 0.44 * 440 ** (-(progresso - 0.65) / 0.35)
         
         def calcular_peso(solucao):
             """Calcula o peso total de uma solução"""
-            return sum(itens[i].peso for i in range(len(solucao)) if solucao[i] == 1)
+            return float(itens.pesos @ np.asarray(solucao))
+        
+        def calcular_valor(solucao):
+            """Calcula o valor total de uma solução"""
+            return float(itens.valores @ np.asarray(solucao))
+        
+        # Acesso escalar do passo O(1) (listas, exceto em arquivos mapeados)
+        pesos, valores = itens.colunas_escalares()
         
         # ========== INICIALIZAÇÃO ==========
-        if mostrar_processo:
-            print("🔥 SIMULATED ANNEALING - PROBLEMA DA MOCHILA")
-            print(f"📊 Configuração: {len(itens)} itens, {capacidade_maxima}kg")
-            print(f"🌡️  Temperatura: {T0:.1f} → {Tmin:.1f} (α={alpha}, {passos_por_T} passos/T)")
-            print("=" * 70)
+        emissor.emitir(INICIO, dados={"itens": itens, "capacidade": capacidade_maxima, "T0": T0,
+                                      "Tmin": Tmin, "alpha": alpha, "passos_por_T": passos_por_T,
+                                      "resfriamento": resfriamento})
         
         # Gera solução inicial
         solucao_atual = gerar_solucao_inicial_aleatoria()
         fitness_atual = calcular_fitness(solucao_atual)
+        # Várias restrições: viabilidade dos flips por delta sobre o uso corrente de cada recurso
+        estado = None if restricoes.simples else restricoes.estado(solucao_atual)
         peso_atual = calcular_peso(solucao_atual)
+        valor_atual = calcular_valor(solucao_atual)
         
         # Inicializa melhor solução
         melhor_solucao = solucao_atual.copy()
@@ -121,48 +227,86 @@ class SA:
         melhor_peso = peso_atual
         
         # Controle de temperatura
+        if T0 == "auto":
+            T0 = calibrar_temperatura(solucao_atual, peso_atual, valor_atual)
+        
+        # Ciclos que o resfriamento geométrico levaria de T0 a Tmin: calibra o beta de
+        # Lundy-Mees e o horizonte do adaptativo quando não há orçamento
+        ciclos_previstos = max(1, math.ceil(math.log(Tmin / T0) / math.log(alpha))) if T0 > Tmin else 1
+        if resfriamento == "lundy_mees" and beta is None:
+            beta = (1 / Tmin - 1 / T0) / ciclos_previstos
+        horizonte = ciclos_previstos * passos_por_T
+        
         temperatura = T0
         iteracao_global = 0
         aceitos_total = 0
         rejeitados_total = 0
         
         # Histórico
-        historico = [(iteracao_global, fitness_atual, peso_atual, temperatura)]
+        historico = Historico(("iteracao", "fitness", "peso", "temperatura"), **(opcoes_historico or {}))
+        historico.registrar(iteracao_global, fitness_atual, peso_atual, temperatura)
+        estatisticas.marcar("inicializacao")
         
-        if mostrar_processo:
-            print(f"\n🏁 Solução inicial:")
-            print(f"   Valor: R$ {fitness_atual:.0f}, Peso: {peso_atual:.1f}kg")
-            print(f"   Temperatura: {temperatura:.2f}")
-            print()
+        emissor.emitir(SOLUCAO_INICIAL, fitness=fitness_atual, peso=peso_atual, temperatura=temperatura,
+                       dados={"solucao": solucao_atual})
+        
+        # Consultados uma vez: sem observadores, o laço não monta nenhum evento
+        relatar_ciclos = emissor.escuta(INICIO_CICLO) or emissor.escuta(FIM_CICLO)
+        relatar_passos = emissor.escuta(ITERACAO)
+        relatar_melhorias = emissor.escuta(MELHORIA)
+        sortear = sortear_flip if estado is None else sortear_flip_restrito
         
         # ========== LOOP PRINCIPAL DO SIMULATED ANNEALING ==========
         ciclo_temperatura = 0
+        ciclos_sem_melhoria = 0
+        ciclos_sem_aceite = 0
+        reaquecimentos = 0
+        motivo_parada = None
         
-        while temperatura > Tmin:
+        while motivo_parada is None:
+            # O adaptativo não para por Tmin: segue até o horizonte ou o orçamento
+            if resfriamento != "adaptativo" and temperatura <= Tmin:
+                motivo_parada = "temperatura_minima"
+                break
+            
             ciclo_temperatura += 1
+            melhor_antes_do_ciclo = melhor_fitness
             
-            if mostrar_processo:
-                print(f"🌡️  CICLO {ciclo_temperatura}: T = {temperatura:.2f}")
+            if relatar_ciclos:
+                emissor.emitir(INICIO_CICLO, iteracao=iteracao_global, temperatura=temperatura,
+                               dados={"ciclo": ciclo_temperatura})
             
             aceitos_neste_ciclo = 0
             rejeitados_neste_ciclo = 0
+            passos_do_ciclo = []
+            
+            # Executa 'passos_por_T' iterações nesta temperatura (menos, se o orçamento acabar)
+            passos_neste_ciclo = passos_por_T
+            if max_avaliacoes is not None:
+                passos_neste_ciclo = max(0, min(passos_por_T, max_avaliacoes - iteracao_global))
             
-            # Executa 'passos_por_T' iterações nesta temperatura
-            for passo in range(passos_por_T):
+            # Sorteios do ciclo em bloco: uma posição de flip e um uniforme de aceitação por passo
+            posicoes_ciclo = rng.integers(0, len(itens), size=passos_neste_ciclo).tolist()
+            sorteios_ciclo = rng.random(passos_neste_ciclo).tolist()
+            
+            for passo in range(passos_neste_ciclo):
                 iteracao_global += 1
                 
                 # Gera UM vizinho aleatório
-                vizinho, posicao_flip = gerar_vizinho_aleatorio(solucao_atual)
-                fitness_vizinho = calcular_fitness(vizinho)
+                posicao_flip, fitness_vizinho, peso_vizinho, valor_vizinho = sortear(solucao_atual, peso_atual, valor_atual,
+                                                                                     posicoes_ciclo[passo])
                 
                 # DECISÃO: Aceita ou rejeita usando critério SA?
-                aceita, motivo = aceitar_solucao(fitness_atual, fitness_vizinho, temperatura)
+                aceita, probabilidade = aceitar_solucao(fitness_atual, fitness_vizinho, temperatura, sorteios_ciclo[passo])
                 
                 if aceita:
                     # ACEITA a solução (pode ser pior!)
-                    solucao_atual = vizinho
+                    solucao_atual.inverter(posicao_flip)
+                    if estado is not None:
+                        estado.aplicar_flip(posicao_flip, 1 if solucao_atual[posicao_flip] == 1 else -1)
                     fitness_atual = fitness_vizinho
-                    peso_atual = calcular_peso(solucao_atual)
+                    peso_atual = peso_vizinho
+                    valor_atual = valor_vizinho
                     aceitos_total += 1
                     aceitos_neste_ciclo += 1
                     
@@ -172,59 +316,375 @@ class SA:
                         melhor_fitness = fitness_atual
                         melhor_peso = peso_atual
                         
-                        if mostrar_processo:
-                            acao = "ADD" if solucao_atual[posicao_flip] == 1 else "REM"
-                            print(f"   ⭐ NOVO MELHOR! {acao} Item {posicao_flip+1}: R$ {fitness_atual:.0f} ({motivo})")
-                    
-                    elif mostrar_processo and motivo.startswith("PROB"):
-                        acao = "ADD" if solucao_atual[posicao_flip] == 1 else "REM"
-                        print(f"   🎲 Aceita pior! {acao} Item {posicao_flip+1}: R$ {fitness_atual:.0f} ({motivo})")
+                        if relatar_melhorias:
+                            emissor.emitir(MELHORIA, iteracao=iteracao_global, fitness=fitness_atual,
+                                           peso=peso_atual, temperatura=temperatura,
+                                           dados={"posicao": posicao_flip, "probabilidade": probabilidade,
+                                                  "adicionado": solucao_atual[posicao_flip] == 1})
                 
                 else:
                     # REJEITA a solução
                     rejeitados_total += 1
                     rejeitados_neste_ciclo += 1
                 
-                # Adiciona ao histórico
-                historico.append((iteracao_global, fitness_atual, peso_atual, temperatura))
+                if relatar_passos:
+                    emissor.emitir(ITERACAO, iteracao=iteracao_global, fitness=fitness_atual, peso=peso_atual,
+                                   temperatura=temperatura, aceito=aceita,
+                                   dados={"posicao": posicao_flip, "probabilidade": probabilidade,
+                                          "adicionado": solucao_atual[posicao_flip] == 1})
+                
+                # Adiciona ao histórico (entregue ao Historico em lote, ao fim do ciclo)
+                passos_do_ciclo.append((iteracao_global, fitness_atual, peso_atual, temperatura))
+            
+            historico.registrar_lote(passos_do_ciclo)
             
             # Relatório do ciclo de temperatura
-            taxa_aceitacao = (aceitos_neste_ciclo / passos_por_T) * 100
-            if mostrar_processo:
-                print(f"   📊 Aceitos: {aceitos_neste_ciclo}/{passos_por_T} ({taxa_aceitacao:.1f}%)")
+            if relatar_ciclos:
+                emissor.emitir(FIM_CICLO, iteracao=iteracao_global, temperatura=temperatura,
+                               dados={"ciclo": ciclo_temperatura, "aceitos": aceitos_neste_ciclo,
+                                      "passos": passos_neste_ciclo})
+            
+            # ========== CRITÉRIOS DE PARADA ==========
+            ciclos_sem_melhoria = 0 if melhor_fitness > melhor_antes_do_ciclo else ciclos_sem_melhoria + 1
+            ciclos_sem_aceite = 0 if aceitos_neste_ciclo > 0 else ciclos_sem_aceite + 1
+            tempo_decorrido = time.perf_counter() - inicio_execucao
+            
+            if max_avaliacoes is not None and iteracao_global >= max_avaliacoes:
+                motivo_parada = "max_avaliacoes"
+            elif tempo_limite is not None and tempo_decorrido >= tempo_limite:
+                motivo_parada = "tempo_limite"
+            elif ciclos_congelados is not None and ciclos_sem_aceite >= ciclos_congelados:
+                motivo_parada = "congelamento"
+            
+            # Progresso do adaptativo: fração do orçamento mais consumido (ou do horizonte)
+            if max_avaliacoes is None and tempo_limite is None:
+                progresso = iteracao_global / horizonte
+            else:
+                progresso = max(iteracao_global / max_avaliacoes if max_avaliacoes else 0.0,
+                                tempo_decorrido / tempo_limite if tempo_limite else 0.0)
+            if motivo_parada is None and resfriamento == "adaptativo" and progresso >= 1:
+                motivo_parada = "horizonte"
+            
+            if motivo_parada is not None:
+                break
+            
+            # ========== REAQUECIMENTO ==========
+            if (reaquecer_apos is not None and ciclos_sem_melhoria >= reaquecer_apos
+                    and reaquecimentos < max_reaquecimentos):
+                reaquecimentos += 1
+                ciclos_sem_melhoria = 0
+                temperatura = max(temperatura, fator_reaquecimento * T0)
+                
+                # Recomeça da melhor solução conhecida
+                solucao_atual = melhor_solucao.copy()
+                fitness_atual = melhor_fitness
+                peso_atual = calcular_peso(solucao_atual)
+                valor_atual = calcular_valor(solucao_atual)
+                if estado is not None:
+                    estado = restricoes.estado(solucao_atual)
+                
+                emissor.emitir(REAQUECIMENTO, iteracao=iteracao_global, fitness=fitness_atual,
+                               peso=peso_atual, temperatura=temperatura,
+                               dados={"reaquecimentos": reaquecimentos})
+                continue
             
             # ========== RESFRIAMENTO ==========
-            temperatura *= alpha
-        
-        if mostrar_processo:
-            print(f"\n❄️  RESFRIAMENTO COMPLETO (T final = {temperatura:.3f})")
-        
-        # ========== RESULTADO FINAL ==========
-        if mostrar_processo:
-            print("\n" + "=" * 70)
-            print("🔥 RESULTADO FINAL DO SIMULATED ANNEALING")
-            print("=" * 70)
-        
-        itens_selecionados = [itens[i] for i in range(len(melhor_solucao)) if melhor_solucao[i] == 1]
-        
-        print(f"\n✅ Melhor valor encontrado: R$ {melhor_fitness:.2f}")
-        print(f"⚖️  Peso utilizado: {melhor_peso:.2f}kg / {capacidade_maxima}kg ({(melhor_peso/capacidade_maxima)*100:.1f}%)")
-        print(f"📈 Eficiência: {(melhor_fitness/melhor_peso):.2f} valor/kg")
-        print(f"🔢 Total de iterações: {iteracao_global}")
-        print(f"🌡️  Ciclos de temperatura: {ciclo_temperatura}")
-        print(f"✅ Soluções aceitas: {aceitos_total} ({(aceitos_total/iteracao_global)*100:.1f}%)")
-        print(f"❌ Soluções rejeitadas: {rejeitados_total} ({(rejeitados_total/iteracao_global)*100:.1f}%)")
-        print(f"🎒 Itens selecionados: {len(itens_selecionados)}")
+            if resfriamento == "geometrico":
+                temperatura *= alpha
+            elif resfriamento == "lundy_mees":
+                temperatura /= 1 + beta * temperatura
+            elif passos_neste_ciclo > 0:
+                # Adaptativo: esfria se aceita mais que o alvo, aquece se aceita menos
+                if aceitos_neste_ciclo / passos_neste_ciclo > taxa_alvo(progresso):
+                    temperatura *= alpha
+                else:
+                    temperatura /= alpha
+        
+        estatisticas.marcar("busca")
+        # Um vizinho avaliado por passo, mais a solução inicial
+        estatisticas.contar("avaliacoes", 1 + iteracao_global)
+        estatisticas.contar("propostos", iteracao_global)
+        estatisticas.contar("aceitos", aceitos_total)
+        historico.finalizar()
+        historico.estatisticas = estatisticas.finalizar()
+        emissor.emitir(FIM, iteracao=iteracao_global, fitness=melhor_fitness, peso=melhor_peso,
+                       temperatura=temperatura,
+                       dados={"solucao": melhor_solucao, "ciclos": ciclo_temperatura,
+                              "aceitos": aceitos_total, "rejeitados": rejeitados_total,
+                              "motivo_parada": motivo_parada, "reaquecimentos": reaquecimentos,
+                              "estatisticas": estatisticas})
+        
+        return melhor_solucao, melhor_fitness, melhor_peso, historico
 
-        print(f"\n📋 COMPOSIÇÃO FINAL DA MOCHILA:")
-        valor_check = 0
-        peso_check = 0
+    @classmethod
+    def executa_sa_replicas(cls, itens, capacidade_maxima=50, n_replicas=16, Tmin=0.1, Tmax=50.0,
+                            passos=2000, intervalo_troca=10, tempo_limite=None, opcoes_historico=None,
+                            observadores=None, perfilar=False, rastrear_memoria=False, mostrar_processo=False):
+        """
+        Executa Simulated Annealing por troca de réplicas (parallel tempering): n_replicas
+        cadeias em uma escada geométrica de temperaturas fixas entre Tmin e Tmax avançam
+        juntas, um flip por réplica por passo, como operações vetorizadas sobre a matriz de
+        estados empacotados. A cada 'intervalo_troca' passos, réplicas em degraus vizinhos
+        trocam de temperatura pelo critério de Metropolis, levando boas soluções para o frio
+        
+        Args:
+            itens: Lista de ItemDataclass com nome, valor e peso (ou ItensArray)
+            capacidade_maxima: Capacidade máxima da mochila (padrão: 50)
+            n_replicas: Número de réplicas / degraus da escada (padrão: 16)
+            Tmin: Temperatura do degrau mais frio (padrão: 0.1)
+            Tmax: Temperatura do degrau mais quente (padrão: 50.0)
+            passos: Passos de cada réplica (padrão: 2000)
+            intervalo_troca: Passos entre tentativas de troca (padrão: 10)
+            tempo_limite: Orçamento em segundos, verificado a cada bloco de passos (padrão: None)
+            opcoes_historico: Opções do Historico devolvido (ver historico.py); registra por passo
+                              o estado da réplica mais fria e a melhor solução
+            observadores: Chamáveis que recebem os Eventos da execução (ver eventos.py)
+            perfilar: Se a execução roda sob cProfile (historico.estatisticas.perfil) (padrão: False)
+            rastrear_memoria: Se mede o pico de memória com tracemalloc (padrão: False)
+            mostrar_processo: Se deve mostrar o processo detalhado (RelatorioConsole)
         
-        for i, item in enumerate(itens_selecionados, 1):
-            print(f"{i:2d}. {item.nome:8s}: R${item.valor:6.2f} ({item.peso:5.1f}kg) | Ratio: {item.ratio_valor_peso():5.2f}")
-            valor_check += item.valor
-            peso_check += item.peso
+        Returns:
+            tuple: (melhor_solucao, melhor_valor, melhor_peso, historico) - tempos por fase,
+                   avaliações e taxas de aceitação em historico.estatisticas (ver instrumentacao.py)
+        """
+        if n_replicas < 1:
+            raise ValueError("n_replicas deve ser pelo menos 1")
+        if not 0 < Tmin <= Tmax:
+            raise ValueError("A escada exige 0 < Tmin <= Tmax")
+        if intervalo_troca < 1:
+            raise ValueError("intervalo_troca deve ser pelo menos 1")
+        
+        inicio_execucao = time.perf_counter()
+        itens = ItensArray.de_itens(itens)
+        n_itens = len(itens)
+        if not itens.simples:
+            raise ValueError("A troca de réplicas ainda só resolve a mochila simples (um recurso, sem grupos)")
+        estatisticas = Estatisticas("SA_PT", perfilar, rastrear_memoria).iniciar()
+        emissor = Emissor("SA_PT", observadores, mostrar_processo)
+        reparador = Reparador(itens, capacidade_maxima)
+        
+        # Gerador NumPy derivado do módulo random: random.seed continua controlando a execução
+        rng = np.random.default_rng(random.getrandbits(64))
+        
+        # Sorteios em blocos: posições e uniformes de vários passos de todas as réplicas de uma vez
+        passos_por_bloco = 256
+        linhas = np.arange(n_replicas)
+        
+        def gerar_estados_iniciais():
+            """Uma solução aleatória reparada por réplica (remove os itens de menor ratio)"""
+            estados = reparador.reparar(rng.integers(0, 2, size=(n_replicas, n_itens), dtype=np.uint8))
+            return empacotar(estados), estados @ itens.pesos, estados @ itens.valores
+        
+        def passo_metropolis(estados, pesos_replicas, valores_replicas, fitness_replicas,
+                             temperaturas, posicoes, sorteios):
+            """Um flip proposto por réplica, avaliado por delta e aceito por Metropolis, em lote"""
+            indices_byte = posicoes >> 3
+            mascaras = (0x80 >> (posicoes & 7)).astype(np.uint8)
+            sinal = np.where(estados[linhas, indices_byte] & mascaras, -1.0, 1.0)
+            
+            novos_pesos = pesos_replicas + sinal * itens.pesos[posicoes]
+            novos_valores = valores_replicas + sinal * itens.valores[posicoes]
+            novos_fitness = np.where(novos_pesos > capacidade_maxima, 0.0, novos_valores)
+            
+            # Melhora (ou empate) sempre aceita: exp(0) = 1 > sorteio
+            delta = np.minimum(novos_fitness - fitness_replicas, 0.0)
+            aceitos = sorteios < np.exp(delta / temperaturas)
+            
+            estados[linhas[aceitos], indices_byte[aceitos]] ^= mascaras[aceitos]
+            return (np.where(aceitos, novos_pesos, pesos_replicas),
+                    np.where(aceitos, novos_valores, valores_replicas),
+                    np.where(aceitos, novos_fitness, fitness_replicas),
+                    int(aceitos.sum()))
+        
+        # ========== INICIALIZAÇÃO ==========
+        if n_replicas > 1:
+            escada = Tmin * (Tmax / Tmin) ** (np.arange(n_replicas) / (n_replicas - 1))
+        else:
+            escada = np.array([Tmin])
+        
+        emissor.emitir(INICIO, dados={"itens": itens, "capacidade": capacidade_maxima, "n_replicas": n_replicas,
+                                      "Tmin": Tmin, "Tmax": Tmax, "passos": passos,
+                                      "intervalo_troca": intervalo_troca})
         
-        print(f"\n🧮 Verificação: R$ {valor_check:.2f} | {peso_check:.1f}kg")
+        estados, pesos_replicas, valores_replicas = gerar_estados_iniciais()
+        fitness_replicas = np.where(pesos_replicas > capacidade_maxima, 0.0, valores_replicas)
+        
+        # replica_no_degrau[d]: réplica que está no degrau d (0 = mais frio); trocar de
+        # temperatura é só permutar esse vetor, sem copiar estados
+        replica_no_degrau = np.arange(n_replicas)
+        temperaturas = escada.copy()
+        trocas_tentadas = np.zeros(max(n_replicas - 1, 0), dtype=np.int64)
+        trocas_aceitas = np.zeros(max(n_replicas - 1, 0), dtype=np.int64)
+        aceitos_total = 0
+        
+        melhor_replica = int(np.argmax(fitness_replicas))
+        melhor_solucao = SolucaoBits(estados[melhor_replica].copy(), n_itens)
+        melhor_fitness = float(fitness_replicas[melhor_replica])
+        melhor_peso = float(pesos_replicas[melhor_replica])
+        
+        historico = Historico(("passo", "fitness", "peso", "melhor_fitness"), **(opcoes_historico or {}))
+        historico.registrar(0, float(fitness_replicas[0]), float(pesos_replicas[0]), melhor_fitness)
+        estatisticas.marcar("inicializacao")
+        
+        emissor.emitir(SOLUCAO_INICIAL, fitness=melhor_fitness, peso=melhor_peso, temperatura=Tmin,
+                       dados={"solucao": melhor_solucao})
+        
+        relatar_passos = emissor.escuta(ITERACAO)
+        relatar_melhorias = emissor.escuta(MELHORIA)
+        
+        # ========== LOOP PRINCIPAL: TODAS AS RÉPLICAS EM LOTE ==========
+        passo = 0
+        motivo_parada = "passos"
+        while passo < passos:
+            if tempo_limite is not None and time.perf_counter() - inicio_execucao >= tempo_limite:
+                motivo_parada = "tempo_limite"
+                break
+            
+            tamanho_bloco = min(passos_por_bloco, passos - passo)
+            bloco_posicoes = rng.integers(0, n_itens, size=(tamanho_bloco, n_replicas))
+            bloco_sorteios = rng.random((tamanho_bloco, n_replicas))
+            
+            for k in range(tamanho_bloco):
+                passo += 1
+                pesos_replicas, valores_replicas, fitness_replicas, aceitos = passo_metropolis(
+                    estados, pesos_replicas, valores_replicas, fitness_replicas, temperaturas,
+                    bloco_posicoes[k], bloco_sorteios[k])
+                aceitos_total += aceitos
+                
+                # TROCA DE RÉPLICAS: degraus pares e ímpares alternados
+                if n_replicas > 1 and passo % intervalo_troca == 0:
+                    inicio = (passo // intervalo_troca) % 2
+                    degraus_frios = np.arange(inicio, n_replicas - 1, 2)
+                    frias = replica_no_degrau[degraus_frios]
+                    quentes = replica_no_degrau[degraus_frios + 1]
+                    log_aceite = ((fitness_replicas[quentes] - fitness_replicas[frias])
+                                  * (1 / temperaturas[frias] - 1 / temperaturas[quentes]))
+                    trocar = rng.random(len(frias)) < np.exp(np.minimum(log_aceite, 0.0))
+                    
+                    trocas_tentadas[degraus_frios] += 1
+                    trocas_aceitas[degraus_frios[trocar]] += 1
+                    replica_no_degrau[degraus_frios[trocar]] = quentes[trocar]
+                    replica_no_degrau[degraus_frios[trocar] + 1] = frias[trocar]
+                    temperaturas[replica_no_degrau] = escada
+                
+                melhor_replica = int(np.argmax(fitness_replicas))
+                if fitness_replicas[melhor_replica] > melhor_fitness:
+                    melhor_solucao = SolucaoBits(estados[melhor_replica].copy(), n_itens)
+                    melhor_fitness = float(fitness_replicas[melhor_replica])
+                    melhor_peso = float(pesos_replicas[melhor_replica])
+                    if relatar_melhorias:
+                        emissor.emitir(MELHORIA, iteracao=passo, fitness=melhor_fitness, peso=melhor_peso,
+                                       temperatura=float(temperaturas[melhor_replica]))
+                
+                mais_fria = replica_no_degrau[0]
+                historico.registrar(passo, float(fitness_replicas[mais_fria]), float(pesos_replicas[mais_fria]),
+                                    melhor_fitness)
+                
+                if relatar_passos:
+                    emissor.emitir(ITERACAO, iteracao=passo, fitness=float(fitness_replicas[mais_fria]),
+                                   peso=float(pesos_replicas[mais_fria]), temperatura=Tmin,
+                                   dados={"melhor_fitness": melhor_fitness, "aceitos": aceitos})
+        
+        estatisticas.marcar("busca")
+        estatisticas.contar("avaliacoes", n_replicas + passo * n_replicas)
+        estatisticas.contar("propostos", passo * n_replicas)
+        estatisticas.contar("aceitos", aceitos_total)
+        estatisticas.contar("trocas_tentadas", int(trocas_tentadas.sum()))
+        estatisticas.contar("trocas_aceitas", int(trocas_aceitas.sum()))
+        historico.finalizar()
+        historico.estatisticas = estatisticas.finalizar()
+        taxas_troca = np.divide(trocas_aceitas, trocas_tentadas, out=np.zeros(len(trocas_tentadas)),
+                                where=trocas_tentadas > 0)
+        emissor.emitir(FIM, iteracao=passo, fitness=melhor_fitness, peso=melhor_peso, temperatura=Tmin,
+                       dados={"solucao": melhor_solucao, "motivo_parada": motivo_parada,
+                              "aceitos": aceitos_total, "movimentos": passo * n_replicas,
+                              "taxas_troca": taxas_troca, "escada": escada, "estatisticas": estatisticas})
         
         return melhor_solucao, melhor_fitness, melhor_peso, historico
+
+    @classmethod
+    def executa_sa_lote(cls, instancias, T0=50.0, Tmin=0.1, alpha=0.95, passos_por_T=30,
+                        solucoes_iniciais=None):
+        """
+        Executa Simulated Annealing em muitas instâncias pequenas de uma vez: todas seguem o
+        mesmo resfriamento geométrico, em lockstep, com um flip proposto por instância por
+        passo, avaliado por delta e aceito por Metropolis como operações sobre a matriz de
+        estados do lote (instâncias x itens). Elimina o custo de chamada e preparação por
+        instância, que domina em instâncias de 15 a 200 itens
+        
+        Args:
+            instancias: Lista de (itens, capacidade) - mochilas simples, de tamanhos quaisquer
+            T0: Temperatura inicial (escalar ou uma por instância) (padrão: 50.0)
+            Tmin: Temperatura mínima (escalar ou uma por instância) (padrão: 0.1)
+            alpha: Fator de resfriamento geométrico (padrão: 0.95)
+            passos_por_T: Passos por patamar de temperatura (padrão: 30)
+            solucoes_iniciais: Uma solução de partida por instância, reparada se não couber;
+                               None sorteia soluções aleatórias (padrão: None)
+        
+        Returns:
+            list: (melhor_solucao, melhor_valor, melhor_peso, aceitos) de cada instância
+        """
+        if not 0 < alpha < 1:
+            raise ValueError("alpha deve estar entre 0 e 1")
+        
+        lote = InstanciasLote(instancias)
+        n_instancias = len(lote)
+        linhas = np.arange(n_instancias)
+        
+        # Gerador NumPy derivado do módulo random: random.seed continua controlando a execução
+        rng = np.random.default_rng(random.getrandbits(64))
+        
+        if solucoes_iniciais is None:
+            estados = lote.aleatorias(rng)
+        else:
+            estados = lote.empilhar(solucoes_iniciais)
+        estados = lote.reparar(estados)
+        valores_atuais, pesos_atuais = lote.totais(estados)
+        fitness_atuais = np.where(pesos_atuais > lote.capacidades, 0.0, valores_atuais)
+        
+        melhores_estados = estados.copy()
+        melhores_fitness = fitness_atuais.copy()
+        melhores_pesos = pesos_atuais.copy()
+        aceitos = np.zeros(n_instancias, dtype=np.int64)
+        
+        temperaturas = np.broadcast_to(np.asarray(T0, dtype=np.float64), (n_instancias,)).copy()
+        minimas = np.broadcast_to(np.asarray(Tmin, dtype=np.float64), (n_instancias,))
+        
+        # ========== LOOP PRINCIPAL: UM PATAMAR DE TODAS AS INSTÂNCIAS POR VEZ ==========
+        while True:
+            # Instância que chegou a Tmin congela: seus passos passam a não aceitar nada
+            quentes = temperaturas > minimas
+            if not quentes.any():
+                break
+            
+            # Sorteios do patamar inteiro: uma posição válida e um uniforme por instância por passo
+            bloco_posicoes = rng.integers(0, lote.tamanhos, size=(passos_por_T, n_instancias))
+            bloco_sorteios = rng.random((passos_por_T, n_instancias))
+            
+            for posicoes, sorteios in zip(bloco_posicoes, bloco_sorteios):
+                sinal = np.where(estados[linhas, posicoes] == 1, -1.0, 1.0)
+                novos_pesos = pesos_atuais + sinal * lote.pesos[linhas, posicoes]
+                novos_valores = valores_atuais + sinal * lote.valores[linhas, posicoes]
+                novos_fitness = np.where(novos_pesos > lote.capacidades, 0.0, novos_valores)
+                
+                # Melhora sempre aceita; piora com probabilidade exp(delta / T)
+                delta = np.minimum(novos_fitness - fitness_atuais, 0.0)
+                aceita = quentes & ((novos_fitness > fitness_atuais) | (sorteios < np.exp(delta / temperaturas)))
+                
+                estados[linhas[aceita], posicoes[aceita]] ^= 1
+                pesos_atuais = np.where(aceita, novos_pesos, pesos_atuais)
+                valores_atuais = np.where(aceita, novos_valores, valores_atuais)
+                fitness_atuais = np.where(aceita, novos_fitness, fitness_atuais)
+                aceitos += aceita
+                
+                melhorou = fitness_atuais > melhores_fitness
+                if melhorou.any():
+                    melhores_estados[melhorou] = estados[melhorou]
+                    melhores_fitness[melhorou] = fitness_atuais[melhorou]
+                    melhores_pesos[melhorou] = pesos_atuais[melhorou]
+            
+            temperaturas[quentes] *= alpha
+        
+        return [(solucao, float(fitness), float(peso), int(n))
+                for solucao, fitness, peso, n in zip(lote.separar(melhores_estados), melhores_fitness,
+                                                      melhores_pesos, aceitos)]
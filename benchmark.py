@@ -0,0 +1,228 @@
+import argparse
+import contextlib
+import csv
+import io
+import random
+import sys
+import time
+import tracemalloc
+
+import numpy as np
+
+from itens import ItensArray
+from PD import PD
+from BB import BB
+from resultados import ALGORITMOS
+
+FAMILIAS = (
+    "nao_correlacionada",
+    "fracamente_correlacionada",
+    "fortemente_correlacionada",
+    "inversa_fortemente_correlacionada",
+    "soma_subconjuntos",
+)
+
+COLUNAS = ("familia", "n_itens", "capacidade", "algoritmo", "tempo_s", "avaliacoes_estimadas",
+           "avaliacoes_por_s", "pico_memoria_mb", "valor", "peso", "viavel",
+           "referencia", "otimo_provado", "gap")
+
+class Benchmark:
+    @classmethod
+    def gerar_instancia(cls, familia, n_itens, semente=0, amplitude=1000, fracao_capacidade=0.5):
+        """
+        Gera uma instância sintética clássica (famílias de Pisinger) com pesos inteiros
+        
+        Args:
+            familia: Uma das FAMILIAS
+            n_itens: Quantidade de itens
+            semente: Semente da instância; mesma semente -> mesma instância
+            amplitude: Faixa R dos pesos/valores, sorteados em [1, R] (padrão: 1000)
+            fracao_capacidade: Capacidade como fração do peso total (padrão: 0.5)
+        
+        Returns:
+            tuple: (itens, capacidade)
+        """
+        if familia not in FAMILIAS:
+            raise ValueError(f"Família de instância desconhecida: {familia}")
+        
+        rng = np.random.default_rng([semente, FAMILIAS.index(familia), n_itens])
+        R = amplitude
+        
+        if familia == "nao_correlacionada":
+            pesos = rng.integers(1, R + 1, n_itens)
+            valores = rng.integers(1, R + 1, n_itens)
+        elif familia == "fracamente_correlacionada":
+            pesos = rng.integers(1, R + 1, n_itens)
+            valores = np.maximum(pesos + rng.integers(-(R // 10), R // 10 + 1, n_itens), 1)
+        elif familia == "fortemente_correlacionada":
+            pesos = rng.integers(1, R + 1, n_itens)
+            valores = pesos + R // 10
+        elif familia == "inversa_fortemente_correlacionada":
+            valores = rng.integers(1, R + 1, n_itens)
+            pesos = valores + R // 10
+        else:
+            pesos = rng.integers(1, R + 1, n_itens)
+            valores = pesos.copy()
+        
+        capacidade = int(pesos.sum() * fracao_capacidade)
+        return ItensArray(None, valores, pesos), capacidade
+
+    @classmethod
+    def valor_referencia(cls, itens, capacidade, limite_celulas_pd=2 * 10**8, tempo_limite_bb=10.0):
+        """
+        Valor de referência para o gap: ótimo da PD quando a tabela cabe no limite,
+        senão o limitante superior provado pelo Branch and Bound dentro do tempo dado
+        
+        Returns:
+            tuple: (referencia, otimo_provado)
+        """
+        if len(itens) * (capacidade + 1) <= limite_celulas_pd:
+            _, valor, _, _ = PD.executa_pd(itens, capacidade, modo="valor")
+            return valor, True
+        
+        _, valor, _, historico = BB.executa_bb(itens, capacidade, tempo_limite=tempo_limite_bb)
+        limite_superior = historico[-1][3]
+        return limite_superior, limite_superior <= valor
+
+    @classmethod
+    def executa_benchmark(cls, familias=FAMILIAS, tamanhos=(10, 100, 1000, 10000),
+                          algoritmos=("HC", "SA", "AG"), semente=0, medir_memoria=True,
+                          parametros=None, tempo_limite_bb=10.0, mostrar_processo=False):
+        """
+        Executa cada algoritmo em cada família e tamanho de instância
+        
+        Args:
+            familias: Famílias de instância (padrão: todas)
+            tamanhos: Quantidades de itens (padrão: 10 a 10^4)
+            algoritmos: Algoritmos avaliados (chaves de ALGORITMOS)
+            semente: Semente das instâncias e das execuções
+            medir_memoria: Se faz uma segunda execução sob tracemalloc para o pico de memória
+            parametros: Dicionário algoritmo -> parâmetros extras do algoritmo
+            tempo_limite_bb: Orçamento em segundos do BB, tanto na referência quanto na
+                             linha do próprio BB quando 'tempo_limite' não é informado (padrão: 10.0)
+            mostrar_processo: Se imprime cada linha assim que é medida
+        
+        Returns:
+            list: Uma linha (dict com as COLUNAS) por combinação família x tamanho x algoritmo
+        """
+        parametros = parametros or {}
+        linhas = []
+        
+        for familia in familias:
+            for n_itens in tamanhos:
+                itens, capacidade = cls.gerar_instancia(familia, n_itens, semente)
+                referencia, otimo_provado = cls.valor_referencia(itens, capacidade, tempo_limite_bb=tempo_limite_bb)
+                
+                for algoritmo in algoritmos:
+                    kwargs = dict(parametros.get(algoritmo, {}))
+                    kwargs["capacidade_maxima"] = capacidade
+                    if algoritmo == "BB":
+                        kwargs.setdefault("tempo_limite", tempo_limite_bb)
+                    
+                    random.seed(semente)
+                    inicio = time.perf_counter()
+                    with contextlib.redirect_stdout(io.StringIO()):
+                        solucao, _, _, historico = ALGORITMOS[algoritmo](itens, **kwargs)
+                    tempo = time.perf_counter() - inicio
+                    
+                    pico_memoria = None
+                    if medir_memoria:
+                        random.seed(semente)
+                        tracemalloc.start()
+                        with contextlib.redirect_stdout(io.StringIO()):
+                            ALGORITMOS[algoritmo](itens, **kwargs)
+                        _, pico = tracemalloc.get_traced_memory()
+                        tracemalloc.stop()
+                        pico_memoria = pico / 2**20
+                    
+                    # Valor e peso reais da solução (o AG reporta fitness penalizado)
+                    valor, peso = itens.avaliar(solucao) if solucao is not None else (referencia, None)
+                    viavel = peso is None or peso <= capacidade
+                    avaliacoes = cls._estimar_avaliacoes(algoritmo, n_itens, capacidade, historico, kwargs)
+                    gap = (referencia - valor) / referencia if viavel and referencia > 0 else None
+                    
+                    # O BB prova (ou não) a própria otimalidade: o gap da linha é contra o seu limitante
+                    otimo_provado_linha = otimo_provado
+                    if algoritmo == "BB":
+                        limite_superior = historico[-1][3]
+                        otimo_provado_linha = limite_superior <= valor
+                        gap = (limite_superior - valor) / limite_superior if limite_superior > 0 else 0.0
+                    
+                    linha = {
+                        "familia": familia,
+                        "n_itens": n_itens,
+                        "capacidade": capacidade,
+                        "algoritmo": algoritmo,
+                        "tempo_s": tempo,
+                        "avaliacoes_estimadas": avaliacoes,
+                        "avaliacoes_por_s": avaliacoes / tempo if tempo > 0 else None,
+                        "pico_memoria_mb": pico_memoria,
+                        "valor": valor,
+                        "peso": peso,
+                        "viavel": viavel,
+                        "referencia": referencia,
+                        "otimo_provado": otimo_provado_linha,
+                        "gap": gap,
+                    }
+                    linhas.append(linha)
+                    
+                    if mostrar_processo:
+                        print(cls.formatar_linha(linha))
+        
+        return linhas
+
+    @classmethod
+    def _estimar_avaliacoes(cls, algoritmo, n_itens, capacidade, historico, parametros):
+        """
+        Avaliações de solução (ou células/nós, nos exatos). HC, SA e AG trazem a contagem
+        real em historico.estatisticas (ver instrumentacao.py); sem ela, a estimativa sai do
+        histórico: exata para SA, AG (falhas do cache = fitness realmente calculados), PD e BB,
+        e um limitante superior no HC (a primeira melhoria para antes de varrer tudo)
+        """
+        estatisticas = getattr(historico, "estatisticas", None)
+        if estatisticas is not None:
+            return estatisticas.avaliacoes
+        if algoritmo == "HC":
+            return int(historico[-1][0] + 1) * n_itens  # cada iteração varre até n vizinhos
+        if algoritmo == "SA":
+            return int(historico[-1][0])
+        if algoritmo == "AG":
+            return int(historico[-1][6])
+        if algoritmo == "PD":
+            return n_itens * (capacidade + 1)
+        return historico[-1][0]  # BB: nós explorados
+
+    @classmethod
+    def formatar_linha(cls, linha):
+        gap = f"{linha['gap'] * 100:7.3f}%" if linha["gap"] is not None else "      -"
+        memoria = f"{linha['pico_memoria_mb']:8.1f}MB" if linha["pico_memoria_mb"] is not None else "         -"
+        return (f"{linha['familia']:<34} {linha['n_itens']:>8} {linha['algoritmo']:<3} "
+                f"{linha['tempo_s']:9.3f}s {linha['avaliacoes_por_s'] or 0:14.0f} aval/s "
+                f"{memoria} gap {gap}")
+
+    @classmethod
+    def salvar_csv(cls, linhas, arquivo):
+        """Grava as linhas do benchmark em CSV (caminho ou arquivo aberto)"""
+        with contextlib.ExitStack() as pilha:
+            if isinstance(arquivo, str):
+                arquivo = pilha.enter_context(open(arquivo, "w", newline="", encoding="utf-8"))
+            escritor = csv.DictWriter(arquivo, fieldnames=COLUNAS)
+            escritor.writeheader()
+            escritor.writerows(linhas)
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark dos algoritmos da mochila")
+    parser.add_argument("--familias", nargs="+", default=list(FAMILIAS), choices=FAMILIAS)
+    parser.add_argument("--tamanhos", nargs="+", type=int, default=[10, 100, 1000, 10000])
+    parser.add_argument("--algoritmos", nargs="+", default=["HC", "SA", "AG"], choices=list(ALGORITMOS))
+    parser.add_argument("--semente", type=int, default=0)
+    parser.add_argument("--sem-memoria", action="store_true", help="não mede o pico de memória")
+    parser.add_argument("--tempo-limite-bb", type=float, default=10.0, help="orçamento do BB em segundos")
+    parser.add_argument("--saida", help="arquivo CSV de saída (padrão: stdout)")
+    args = parser.parse_args()
+
+    linhas = Benchmark.executa_benchmark(args.familias, args.tamanhos, args.algoritmos, args.semente,
+                                         medir_memoria=not args.sem_memoria,
+                                         tempo_limite_bb=args.tempo_limite_bb,
+                                         mostrar_processo=args.saida is not None)
+    Benchmark.salvar_csv(linhas, args.saida or sys.stdout)
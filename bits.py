@@ -0,0 +1,116 @@
+import numpy as np
+
+# Nº de bits ligados em cada valor de byte (popcount por tabela)
+_BITS_POR_BYTE = np.array([bin(b).count("1") for b in range(256)], dtype=np.uint8)
+
+class SolucaoBits:
+    """
+    Solução binária empacotada: 1 bit por item em um array uint8 (layout de np.packbits,
+    bit mais significativo primeiro). Os bits de preenchimento do último byte ficam em zero
+    """
+
+    __slots__ = ("bits", "n_itens")
+
+    def __init__(self, bits, n_itens):
+        self.bits = bits
+        self.n_itens = n_itens
+
+    @classmethod
+    def de_array(cls, solucao) -> "SolucaoBits":
+        """Empacota uma solução 0/1 (lista ou array)"""
+        solucao = np.asarray(solucao, dtype=np.uint8)
+        return cls(np.packbits(solucao), len(solucao))
+
+    @classmethod
+    def zeros(cls, n_itens) -> "SolucaoBits":
+        return cls(np.zeros(bytes_por_solucao(n_itens), dtype=np.uint8), n_itens)
+
+    def inverter(self, i):
+        """Flip do bit i em O(1)"""
+        self.bits[i >> 3] ^= 0x80 >> (i & 7)
+
+    def contar(self):
+        """Popcount: quantidade de itens selecionados"""
+        return int(_BITS_POR_BYTE[self.bits].sum(dtype=np.int64))
+
+    def desempacotar(self):
+        """Retorna a solução como array uint8 de 0/1"""
+        return np.unpackbits(self.bits, count=self.n_itens)
+
+    def indices(self):
+        """Índices dos itens selecionados"""
+        return np.flatnonzero(self.desempacotar())
+
+    def cruzar(self, outra, mascara) -> "SolucaoBits":
+        """Crossover por máscara: bits de self onde a máscara é 1, de 'outra' onde é 0"""
+        return SolucaoBits((self.bits & mascara.bits) | (outra.bits & ~mascara.bits), self.n_itens)
+
+    def copy(self) -> "SolucaoBits":
+        return SolucaoBits(self.bits.copy(), self.n_itens)
+
+    def __len__(self):
+        return self.n_itens
+
+    def __getitem__(self, i):
+        if i < 0:
+            i += self.n_itens
+        if not 0 <= i < self.n_itens:
+            raise IndexError("índice fora da solução")
+        return (int(self.bits[i >> 3]) >> (7 - (i & 7))) & 1
+
+    def __array__(self, dtype=None, copy=None):
+        solucao = self.desempacotar()
+        return solucao if dtype is None else solucao.astype(dtype)
+
+    def __eq__(self, outra):
+        if not isinstance(outra, SolucaoBits):
+            return NotImplemented
+        return self.n_itens == outra.n_itens and np.array_equal(self.bits, outra.bits)
+
+    def __hash__(self):
+        return hash((self.n_itens, self.bits.tobytes()))
+
+    def __repr__(self):
+        return f"SolucaoBits({''.join(map(str, self.desempacotar()))})"
+
+def bytes_por_solucao(n_itens):
+    return (n_itens + 7) // 8
+
+def empacotar(matriz):
+    """Empacota uma matriz 0/1 (linhas x n_itens) em (linhas x bytes_por_solucao)"""
+    return np.packbits(matriz, axis=1)
+
+def desempacotar(matriz_bits, n_itens):
+    """Desempacota uma matriz de soluções empacotadas em (linhas x n_itens) uint8"""
+    return np.unpackbits(matriz_bits, axis=1, count=n_itens)
+
+def contar_bits(matriz_bits):
+    """Popcount de cada linha de uma matriz de soluções empacotadas"""
+    return _BITS_POR_BYTE[matriz_bits].sum(axis=1, dtype=np.int64)
+
+def mascaras_prefixo(pontos_corte, n_itens):
+    """
+    Máscaras empacotadas com os bits [0, ponto_corte) ligados, uma linha por ponto de corte,
+    montadas byte a byte (sem materializar a matriz de bits)
+    """
+    pontos_corte = np.asarray(pontos_corte)[:, None]
+    posicao_byte = np.arange(bytes_por_solucao(n_itens)) * 8
+    bits_no_byte = np.clip(pontos_corte - posicao_byte, 0, 8)
+    return ((0xFF00 >> bits_no_byte) & 0xFF).astype(np.uint8)
+
+def inverter_posicoes(matriz_bits, posicoes, n_itens):
+    """
+    Inverte, no lugar, os bits de uma matriz de soluções empacotadas nas posições planas
+    (linha * n_itens + item) dadas em ordem crescente e sem repetição. Bits do mesmo byte
+    são combinados por OR antes de um único XOR por byte
+    """
+    linhas, bits = np.divmod(np.asarray(posicoes, dtype=np.int64), n_itens)
+    if len(bits) == 0:
+        return matriz_bits
+    
+    indices_byte = linhas * matriz_bits.shape[1] + (bits >> 3)
+    mascaras = (0x80 >> (bits & 7)).astype(np.uint8)
+    inicio_grupo = np.flatnonzero(np.r_[True, indices_byte[1:] != indices_byte[:-1]])
+    plana = matriz_bits.reshape(-1)
+    plana[indices_byte[inicio_grupo]] ^= np.bitwise_or.reduceat(mascaras, inicio_grupo)
+    return matriz_bits
@@ -0,0 +1,39 @@
+from collections import OrderedDict
+
+class CacheFitness:
+    """
+    Cache LRU de avaliações indexado pelo cromossomo empacotado em bits.
+    A chave é o próprio genoma empacotado, então não há colisões entre indivíduos
+    """
+
+    def __init__(self, tamanho_maximo=10000):
+        self.tamanho_maximo = tamanho_maximo
+        self._entradas = OrderedDict()
+        self.acertos = 0
+        self.falhas = 0
+
+    @staticmethod
+    def chaves(populacao):
+        """Gera as chaves (bytes) de cada linha de uma matriz de indivíduos empacotados em bits"""
+        return [linha.tobytes() for linha in populacao]
+
+    def obter(self, chave):
+        """Retorna a avaliação guardada (ou None), marcando-a como usada recentemente"""
+        avaliacao = self._entradas.get(chave)
+        if avaliacao is None:
+            self.falhas += 1
+            return None
+        
+        self._entradas.move_to_end(chave)
+        self.acertos += 1
+        return avaliacao
+
+    def guardar(self, chave, avaliacao):
+        """Guarda uma avaliação, descartando a menos usada se o cache estiver cheio"""
+        self._entradas[chave] = avaliacao
+        self._entradas.move_to_end(chave)
+        if len(self._entradas) > self.tamanho_maximo:
+            self._entradas.popitem(last=False)
+
+    def __len__(self):
+        return len(self._entradas)
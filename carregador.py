@@ -0,0 +1,121 @@
+import csv
+import os
+import shutil
+import struct
+import tempfile
+from itertools import islice
+
+import numpy as np
+
+from itens import ItensArray, calcular_ratios
+
+# Formato binário: cabeçalho de 64 bytes (assinatura + nº de itens) seguido das colunas
+# valores, pesos e ratios, cada uma float64 contígua - prontas para np.memmap
+ASSINATURA = b"MOCHILA\x01"
+TAMANHO_CABECALHO = 64
+
+class CarregadorItens:
+    @classmethod
+    def salvar_binario(cls, itens, caminho):
+        """Grava uma coleção de itens (lista de ItemDataclass ou ItensArray) no formato binário"""
+        itens = ItensArray.de_itens(itens)
+        with open(caminho, "wb") as arquivo:
+            arquivo.write(cls._cabecalho(len(itens)))
+            for coluna in (itens.valores, itens.pesos, itens.ratios):
+                np.ascontiguousarray(coluna, dtype="<f8").tofile(arquivo)
+
+    @classmethod
+    def abrir_binario(cls, caminho):
+        """
+        Abre um arquivo binário de itens como ItensArray com colunas mapeadas em memória:
+        nada é lido do disco até que o algoritmo acesse os dados
+        """
+        with open(caminho, "rb") as arquivo:
+            cabecalho = arquivo.read(TAMANHO_CABECALHO)
+        if len(cabecalho) < TAMANHO_CABECALHO or cabecalho[:len(ASSINATURA)] != ASSINATURA:
+            raise ValueError(f"{caminho} não é um arquivo binário de itens válido")
+        
+        (n_itens,) = struct.unpack_from("<Q", cabecalho, len(ASSINATURA))
+        if n_itens == 0:
+            vazio = np.zeros(0)
+            return ItensArray(None, vazio, vazio, vazio)
+        
+        colunas = np.memmap(caminho, dtype="<f8", mode="r", offset=TAMANHO_CABECALHO, shape=(3, n_itens))
+        valores, pesos, ratios = colunas
+        return ItensArray(None, valores, pesos, ratios)
+
+    @classmethod
+    def converter_csv(cls, caminho_csv, caminho_binario, tamanho_bloco=100000, delimitador=","):
+        """
+        Converte um CSV de itens (colunas 'valor' e 'peso'; demais colunas, como 'nome',
+        são ignoradas) para o formato binário, lendo 'tamanho_bloco' linhas por vez.
+        Apenas um bloco fica em memória: os valores vão direto ao destino e pesos/ratios
+        passam por arquivos temporários até serem anexados como colunas contíguas
+        
+        Returns:
+            int: Quantidade de itens convertidos
+        """
+        # Escreve em um arquivo temporário no mesmo diretório e só o move para o destino
+        # ao final: uma conversão interrompida nunca deixa um .bin parcial para trás
+        diretorio = os.path.dirname(os.path.abspath(caminho_binario))
+        descritor, caminho_temporario = tempfile.mkstemp(dir=diretorio, suffix=".tmp")
+        n_itens = 0
+        try:
+            with open(caminho_csv, newline="", encoding="utf-8") as origem, \
+                    os.fdopen(descritor, "w+b") as destino, \
+                    tempfile.TemporaryFile() as temp_pesos, \
+                    tempfile.TemporaryFile() as temp_ratios:
+                leitor = csv.reader(origem, delimiter=delimitador)
+                cabecalho = [coluna.strip().lower() for coluna in next(leitor, [])]
+                try:
+                    coluna_valor = cabecalho.index("valor")
+                    coluna_peso = cabecalho.index("peso")
+                except ValueError:
+                    raise ValueError(f"{caminho_csv} precisa das colunas 'valor' e 'peso'") from None
+                
+                destino.write(cls._cabecalho(0))
+                while True:
+                    linhas = [linha for linha in islice(leitor, tamanho_bloco) if linha]
+                    if not linhas:
+                        break
+                    
+                    valores = np.array([linha[coluna_valor] for linha in linhas], dtype="<f8")
+                    pesos = np.array([linha[coluna_peso] for linha in linhas], dtype="<f8")
+                    valores.tofile(destino)
+                    pesos.tofile(temp_pesos)
+                    calcular_ratios(valores, pesos).astype("<f8").tofile(temp_ratios)
+                    n_itens += len(linhas)
+                
+                for temporario in (temp_pesos, temp_ratios):
+                    temporario.seek(0)
+                    shutil.copyfileobj(temporario, destino)
+                
+                destino.seek(0)
+                destino.write(cls._cabecalho(n_itens))
+            
+            os.replace(caminho_temporario, caminho_binario)
+        except BaseException:
+            if os.path.exists(caminho_temporario):
+                os.remove(caminho_temporario)
+            raise
+        
+        return n_itens
+
+    @classmethod
+    def ler_csv(cls, caminho_csv, caminho_binario=None, tamanho_bloco=100000, delimitador=","):
+        """
+        Carrega um CSV de itens como ItensArray mapeado em memória. A conversão para o
+        formato binário (por padrão, caminho_csv + '.bin') é refeita só se o CSV for mais novo
+        """
+        if caminho_binario is None:
+            caminho_binario = caminho_csv + ".bin"
+        
+        if (not os.path.exists(caminho_binario)
+                or os.path.getmtime(caminho_binario) < os.path.getmtime(caminho_csv)):
+            cls.converter_csv(caminho_csv, caminho_binario, tamanho_bloco, delimitador)
+        
+        return cls.abrir_binario(caminho_binario)
+
+    @staticmethod
+    def _cabecalho(n_itens):
+        return struct.pack("<8sQ", ASSINATURA, n_itens).ljust(TAMANHO_CABECALHO, b"\0")
@@ -0,0 +1,38 @@
+# Presente na raiz para que os testes importem os módulos do projeto (HC, PD, bits, ...)
+import random
+
+import pytest
+
+from benchmark import Benchmark
+
+class Coletor(list):
+    """Observador dos testes: guarda os eventos recebidos, só dos 'tipos' pedidos (todos, se None)"""
+    
+    def __init__(self, tipos=None):
+        super().__init__()
+        if tipos is not None:
+            self.tipos = set(tipos)
+    
+    def __call__(self, evento):
+        self.append(evento)
+
+def executar_coletando(executa, instancia, tipos=None, semente=0, **parametros):
+    """
+    Executa um algoritmo (HC.executa_hc, SA.executa_sa, ...) na instância com random.seed(semente)
+    
+    Returns:
+        tuple: (solucao, valor, peso, historico, eventos) - eventos dos 'tipos' pedidos
+    """
+    itens, capacidade = instancia
+    eventos = Coletor(tipos)
+    random.seed(semente)
+    solucao, valor, peso, historico = executa(itens, capacidade, observadores=[eventos], **parametros)
+    return solucao, valor, peso, historico, eventos
+
+@pytest.fixture(scope="module")
+def instancia(request):
+    """
+    Instância sintética do módulo de teste: INSTANCIA no módulo traz os argumentos de
+    Benchmark.gerar_instancia (familia, n_itens, semente, ...)
+    """
+    return Benchmark.gerar_instancia(**request.module.INSTANCIA)
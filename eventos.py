@@ -0,0 +1,343 @@
+from dataclasses import dataclass, field
+from typing import Optional
+
+import numpy as np
+
+# Tipos de evento emitidos pelos algoritmos
+INICIO = "inicio"                    # configuração da execução (dados: itens, capacidade, parâmetros)
+REPARO = "reparo"                    # reparo da solução inicial (dados: antes/depois, removidos)
+SOLUCAO_INICIAL = "solucao_inicial"  # solução de partida avaliada
+INICIO_CICLO = "inicio_ciclo"        # SA: início de um patamar de temperatura
+ITERACAO = "iteracao"                # HC: movimento; SA: passo (aceito ou não); AG: geração
+MELHORIA = "melhoria"                # nova melhor solução global
+FIM_CICLO = "fim_ciclo"              # SA: fim de um patamar (dados: aceitos, passos)
+REAQUECIMENTO = "reaquecimento"      # SA: temperatura elevada após estagnação
+FIM = "fim"                          # resultado final (dados: solução, motivo da parada, totais)
+
+@dataclass
+class Evento:
+    tipo: str
+    algoritmo: str
+    iteracao: int = 0
+    fitness: float = 0.0
+    peso: float = 0.0
+    temperatura: Optional[float] = None
+    aceito: Optional[bool] = None
+    dados: dict = field(default_factory=dict)
+
+
+class Emissor:
+    """
+    Distribui os eventos de uma execução aos observadores. Um observador é qualquer
+    chamável que recebe um Evento; se tiver o atributo 'tipos', recebe apenas esses tipos.
+    Os laços internos consultam escuta() uma vez e só montam eventos que alguém vai ler
+    """
+
+    def __init__(self, algoritmo, observadores=None, mostrar_processo=False):
+        self.algoritmo = algoritmo
+        self.observadores = list(observadores or [])
+        if mostrar_processo:
+            self.observadores.append(RelatorioConsole())
+        self._por_tipo = {}
+
+    def _interessados(self, tipo):
+        interessados = self._por_tipo.get(tipo)
+        if interessados is None:
+            interessados = [observador for observador in self.observadores
+                            if getattr(observador, "tipos", None) is None or tipo in observador.tipos]
+            self._por_tipo[tipo] = interessados
+        return interessados
+
+    def escuta(self, tipo):
+        """Se algum observador recebe eventos deste tipo"""
+        return bool(self._interessados(tipo))
+
+    def emitir(self, tipo, **campos):
+        interessados = self._interessados(tipo)
+        if not interessados:
+            return
+        
+        evento = Evento(tipo, self.algoritmo, **campos)
+        for observador in interessados:
+            observador(evento)
+
+
+class RelatorioConsole:
+    """
+    Observador que imprime o andamento no console, no formato histórico dos algoritmos.
+    'detalhado' inclui reparo, solução inicial e iterações amostradas (a cada 'intervalo':
+    padrão 50 no HC e 20 no AG); sem ele, só o resumo final (e o cabeçalho do HC)
+    """
+
+    def __init__(self, detalhado=True, intervalo=None):
+        self.detalhado = detalhado
+        self.intervalo = intervalo
+        self._execucao = {}
+        if detalhado:
+            self.tipos = None
+        else:
+            self.tipos = {INICIO, FIM}
+
+    def __call__(self, evento):
+        if evento.tipo == INICIO:
+            self._execucao = evento.dados
+        
+        metodo = getattr(self, f"_{evento.tipo}_{evento.algoritmo.lower()}", None)
+        if metodo is None:
+            metodo = getattr(self, f"_{evento.tipo}", None)
+        if metodo is not None:
+            metodo(evento)
+
+    # ========== HILL CLIMBING ==========
+    def _inicio_hc(self, evento):
+        dados = evento.dados
+        print("🔍 HILL CLIMBING - PROBLEMA DA MOCHILA")
+        print(f"📊 Configuração: {len(dados['itens'])} itens, {dados['capacidade']}kg, máx {dados['max_iteracoes']} iterações")
+        print(f"📋 Regras: Solução aleatória reparada + Flip de 1 item ({dados['modo_busca']} melhoria) + Parada por iteração/estagnação")
+        print("=" * 70)
+        print("Gerando solução inicial aleatória...")
+
+    def _solucao_inicial_hc(self, evento):
+        nomes = self._execucao["itens"].nomes
+        itens_iniciais = [nomes[i] for i in evento.dados["solucao"].indices()]
+        print(f"\n🏁 Solução inicial:")
+        print(f"Item  0: Valor=R${evento.fitness:6.0f}, Peso={evento.peso:5.1f}kg, Itens={len(itens_iniciais)}")
+        if len(itens_iniciais) <= 8:
+            print(f"         Itens: {', '.join(itens_iniciais)}")
+        print()
+
+    def _iteracao_hc(self, evento):
+        intervalo = self.intervalo or 50
+        if evento.iteracao <= 5 or evento.iteracao % intervalo == 0:
+            print(f"Item {evento.iteracao:3d}: Valor=R${evento.fitness:6.0f}, Peso={evento.peso:5.1f}kg")
+
+    def _fim_hc(self, evento):
+        dados = evento.dados
+        if dados["motivo_parada"] == "estagnacao":
+            print(f"ESTAGNAÇÃO na iteração {evento.iteracao}")
+            print("   Nenhum vizinho oferece melhoria no fitness!")
+        else:
+            print(f"⏱️  LIMITE DE ITERAÇÕES atingido ({self._execucao['max_iteracoes']})")
+        
+        print("\n" + "=" * 70)
+        print("🏆 RESULTADO FINAL DO HILL CLIMBING")
+        print("=" * 70)
+        
+        itens_selecionados = self._itens_selecionados(dados["solucao"])
+        print(f"Melhor valor encontrado: R$ {evento.fitness:.2f}")
+        print(f"Peso utilizado: {self._uso_capacidade(evento.peso)}")
+        print(f"Eficiência: {self._eficiencia(evento.fitness, evento.peso):.2f} valor/kg")
+        print(f"Total de iterações executadas: {evento.iteracao}")
+        print(f"Quantidade de itens selecionados: {len(itens_selecionados)}")
+        self._imprimir_composicao(itens_selecionados)
+
+    # ========== SIMULATED ANNEALING ==========
+    def _inicio_sa(self, evento):
+        if not self.detalhado:
+            return
+        
+        dados = evento.dados
+        print("🔥 SIMULATED ANNEALING - PROBLEMA DA MOCHILA")
+        print(f"📊 Configuração: {len(dados['itens'])} itens, {dados['capacidade']}kg")
+        T0 = dados["T0"] if isinstance(dados["T0"], str) else f"{dados['T0']:.1f}"
+        resfriamento = "" if dados["resfriamento"] == "geometrico" else f", {dados['resfriamento']}"
+        print(f"🌡️  Temperatura: {T0} → {dados['Tmin']:.1f} (α={dados['alpha']}, {dados['passos_por_T']} passos/T{resfriamento})")
+        print("=" * 70)
+        print("🎲 Gerando solução inicial aleatória...")
+
+    def _solucao_inicial_sa(self, evento):
+        print(f"\n🏁 Solução inicial:")
+        print(f"   Valor: R$ {evento.fitness:.0f}, Peso: {evento.peso:.1f}kg")
+        print(f"   Temperatura: {evento.temperatura:.2f}")
+        print()
+
+    def _inicio_ciclo_sa(self, evento):
+        print(f"🌡️  CICLO {evento.dados['ciclo']}: T = {evento.temperatura:.2f}")
+
+    def _melhoria_sa(self, evento):
+        acao = "ADD" if evento.dados["adicionado"] else "REM"
+        print(f"   ⭐ NOVO MELHOR! {acao} Item {evento.dados['posicao']+1}: R$ {evento.fitness:.0f} "
+              f"({self._motivo(evento.dados['probabilidade'])})")
+
+    def _iteracao_sa(self, evento):
+        probabilidade = evento.dados["probabilidade"]
+        if evento.aceito and probabilidade is not None:
+            acao = "ADD" if evento.dados["adicionado"] else "REM"
+            print(f"   🎲 Aceita pior! {acao} Item {evento.dados['posicao']+1}: R$ {evento.fitness:.0f} "
+                  f"({self._motivo(probabilidade)})")
+
+    def _fim_ciclo_sa(self, evento):
+        aceitos, passos = evento.dados["aceitos"], evento.dados["passos"]
+        print(f"   📊 Aceitos: {aceitos}/{passos} ({aceitos / passos * 100:.1f}%)")
+
+    def _reaquecimento_sa(self, evento):
+        print(f"   🔥 REAQUECIMENTO {evento.dados['reaquecimentos']}: T = {evento.temperatura:.2f}, "
+              f"volta à melhor solução (R$ {evento.fitness:.0f})")
+
+    def _fim_sa(self, evento):
+        dados = evento.dados
+        if self.detalhado:
+            mensagens = {
+                "temperatura_minima": "❄️  RESFRIAMENTO COMPLETO",
+                "horizonte": "❄️  RESFRIAMENTO ADAPTATIVO COMPLETO",
+                "congelamento": "🧊 CONGELAMENTO: nenhum movimento aceito",
+                "tempo_limite": "⏱️  TEMPO LIMITE atingido",
+                "max_avaliacoes": "⏱️  LIMITE DE AVALIAÇÕES atingido",
+            }
+            print(f"\n{mensagens[dados['motivo_parada']]} (T final = {evento.temperatura:.3f})")
+            print("\n" + "=" * 70)
+            print("🔥 RESULTADO FINAL DO SIMULATED ANNEALING")
+            print("=" * 70)
+        
+        itens_selecionados = self._itens_selecionados(dados["solucao"])
+        iteracoes = max(evento.iteracao, 1)
+        print(f"\n✅ Melhor valor encontrado: R$ {evento.fitness:.2f}")
+        print(f"⚖️  Peso utilizado: {self._uso_capacidade(evento.peso)}")
+        print(f"📈 Eficiência: {self._eficiencia(evento.fitness, evento.peso):.2f} valor/kg")
+        print(f"🔢 Total de iterações: {evento.iteracao}")
+        print(f"🌡️  Ciclos de temperatura: {dados['ciclos']}")
+        print(f"✅ Soluções aceitas: {dados['aceitos']} ({(dados['aceitos']/iteracoes)*100:.1f}%)")
+        print(f"❌ Soluções rejeitadas: {dados['rejeitados']} ({(dados['rejeitados']/iteracoes)*100:.1f}%)")
+        print(f"🎒 Itens selecionados: {len(itens_selecionados)}")
+        self._imprimir_composicao(itens_selecionados)
+
+    # ========== SA POR TROCA DE RÉPLICAS ==========
+    def _inicio_sa_pt(self, evento):
+        if not self.detalhado:
+            return
+        
+        dados = evento.dados
+        print("🔥 SIMULATED ANNEALING POR TROCA DE RÉPLICAS - PROBLEMA DA MOCHILA")
+        print(f"📊 Configuração: {len(dados['itens'])} itens, {dados['capacidade']}kg")
+        print(f"🌡️  Escada: {dados['n_replicas']} réplicas de T={dados['Tmin']} a T={dados['Tmax']}")
+        print(f"🔁 Passos: {dados['passos']} por réplica, troca a cada {dados['intervalo_troca']}")
+        print("=" * 70)
+
+    def _melhoria_sa_pt(self, evento):
+        if self.detalhado:
+            print(f"   🎉 NOVA MELHOR SOLUÇÃO no passo {evento.iteracao}: R$ {evento.fitness:.0f} "
+                  f"(réplica em T = {evento.temperatura:.2f})")
+
+    def _iteracao_sa_pt(self, evento):
+        intervalo = self.intervalo or 200
+        if evento.iteracao % intervalo == 0:
+            print(f"Passo {evento.iteracao:5d}: Réplica fria=R${evento.fitness:4.0f} | "
+                  f"Melhor=R${evento.dados['melhor_fitness']:4.0f} | Aceitos={evento.dados['aceitos']}")
+
+    def _fim_sa_pt(self, evento):
+        dados = evento.dados
+        if self.detalhado:
+            if dados["motivo_parada"] == "tempo_limite":
+                print("\n⏱️  TEMPO LIMITE atingido")
+            print("\n" + "=" * 70)
+            print("🔥 RESULTADO FINAL DO SA POR TROCA DE RÉPLICAS")
+            print("=" * 70)
+        
+        itens_selecionados = self._itens_selecionados(dados["solucao"])
+        movimentos = max(dados["movimentos"], 1)
+        print(f"\n✅ Melhor valor encontrado: R$ {evento.fitness:.2f}")
+        print(f"⚖️  Peso utilizado: {self._uso_capacidade(evento.peso)}")
+        print(f"📈 Eficiência: {self._eficiencia(evento.fitness, evento.peso):.2f} valor/kg")
+        print(f"🔢 Passos por réplica: {evento.iteracao} ({dados['movimentos']} movimentos no total)")
+        print(f"✅ Movimentos aceitos: {dados['aceitos']} ({(dados['aceitos']/movimentos)*100:.1f}%)")
+        if len(dados["taxas_troca"]):
+            taxas = " ".join(f"{taxa:.2f}" for taxa in dados["taxas_troca"])
+            print(f"🔀 Taxas de troca entre degraus (frio → quente): {taxas}")
+        print(f"🎒 Itens selecionados: {len(itens_selecionados)}")
+        self._imprimir_composicao(itens_selecionados)
+
+    # ========== ALGORITMO GENÉTICO ==========
+    def _inicio_ag(self, evento):
+        if not self.detalhado:
+            return
+        
+        dados = evento.dados
+        print("🧬 ALGORITMO GENÉTICO - PROBLEMA DA MOCHILA")
+        print(f"📊 Configuração: {len(dados['itens'])} itens, {dados['capacidade']}kg")
+        print(f"🧬 População: {dados['pop_size']} indivíduos, {dados['geracoes']} gerações")
+        print(f"⚔️  Seleção: Torneio k={dados['k_torneio']}")
+        print(f"💏 Crossover: 1 ponto, p={dados['p_cross']}")
+        print(f"🎲 Mutação: Flip bit, p={dados['p_mut']}")
+        print(f"👑 Elitismo: {dados['elitismo']} melhores")
+        print("=" * 70)
+        print("🌱 Gerando população inicial...")
+
+    def _iteracao_ag(self, evento):
+        geracao = evento.iteracao
+        intervalo = self.intervalo or 20
+        if geracao == 0 or (geracao + 1) % intervalo == 0 or geracao == self._execucao["geracoes"] - 1:
+            print(f"Gen {geracao+1:3d}: Melhor=R${evento.fitness:3.0f} | Médio=R${evento.dados['medio']:5.1f} | "
+                  f"Pior=R${evento.dados['pior']:3.0f} | Peso={evento.peso:4.1f}kg")
+
+    def _fim_ag(self, evento):
+        dados = evento.dados
+        if self.detalhado:
+            mensagens = {
+                "estagnacao": "🛑 ESTAGNAÇÃO: sem melhoria nas últimas gerações",
+                "diversidade": "🧊 CONVERGÊNCIA: diversidade da população abaixo do mínimo",
+                "valor_alvo": "🎯 VALOR ALVO atingido",
+                "tempo_limite": "⏱️  TEMPO LIMITE atingido",
+            }
+            if dados["motivo_parada"] in mensagens:
+                print(f"\n{mensagens[dados['motivo_parada']]} (geração {evento.iteracao})")
+            print("\n" + "=" * 70)
+            print("🧬 RESULTADO FINAL DO ALGORITMO GENÉTICO")
+            print("=" * 70)
+        
+        itens_selecionados = self._itens_selecionados(dados["solucao"])
+        print(f"✅ Melhor valor encontrado: R$ {evento.fitness:.2f}")
+        print(f"⚖️  Peso utilizado: {self._uso_capacidade(evento.peso)}")
+        print(f"📈 Eficiência: {self._eficiencia(evento.fitness, evento.peso):.2f} valor/kg")
+        print(f"🧬 Total de gerações: {evento.iteracao}")
+        print(f"👥 Tamanho da população: {self._execucao['pop_size']}")
+        acertos, falhas = dados["acertos_cache"], dados["falhas_cache"]
+        if acertos + falhas > 0:
+            print(f"🗃️  Cache de fitness: {acertos} acertos, {falhas} falhas ({acertos / (acertos + falhas) * 100:.1f}%)")
+        print(f"🎒 Itens selecionados: {len(itens_selecionados)}")
+        
+        # Análise da evolução
+        fitness_inicial, fitness_final = dados["fitness_inicial"], dados["fitness_final"]
+        print(f"📊 Evolução: R$ {fitness_inicial:.0f} → R$ {fitness_final:.0f} (+{fitness_final - fitness_inicial:.0f})")
+        self._imprimir_composicao(itens_selecionados)
+
+    # ========== COMUNS ==========
+    def _reparo(self, evento):
+        dados = evento.dados
+        nomes = self._execucao["itens"].nomes
+        print(f"   Solução aleatória: peso={dados['peso_inicial']:.1f}kg, valor=R${dados['valor_inicial']:.0f}")
+        for i in dados["removidos"]:
+            print(f"   Removendo {nomes[i]} (ratio baixo)")
+        print(f"   Solução reparada: peso={evento.peso:.1f}kg, valor=R${dados['valor_final']:.0f}")
+
+    def _itens_selecionados(self, solucao):
+        itens = self._execucao["itens"]
+        return [itens[i] for i in solucao.indices()]
+
+    def _uso_capacidade(self, peso):
+        capacidade = self._execucao["capacidade"]
+        if np.ndim(capacidade) > 0:
+            # Vários recursos: o peso relatado é o do recurso principal
+            capacidade = capacidade[0]
+        uso = (peso / capacidade) * 100 if capacidade else 0.0
+        return f"{peso:.2f}kg / {capacidade}kg ({uso:.1f}%)"
+
+    @staticmethod
+    def _eficiencia(valor, peso):
+        return valor / peso if peso else 0.0
+
+    @staticmethod
+    def _motivo(probabilidade):
+        return "MELHOR" if probabilidade is None else f"PROB_{probabilidade:.3f}"
+
+    @staticmethod
+    def _imprimir_composicao(itens_selecionados):
+        print(f"\n📋 COMPOSIÇÃO FINAL DA MOCHILA:")
+        valor_check = 0
+        peso_check = 0
+        
+        for i, item in enumerate(itens_selecionados, 1):
+            print(f"{i:2d}. {item.nome:8s}: R${item.valor:6.2f} ({item.peso:5.1f}kg) | Ratio: {item.ratio_valor_peso():5.2f}")
+            valor_check += item.valor
+            peso_check += item.peso
+        
+        print(f"\n🧮 Verificação: R$ {valor_check:.2f} | {peso_check:.1f}kg")
@@ -0,0 +1,190 @@
+from itertools import chain
+
+import numpy as np
+
+class Historico:
+    """
+    Histórico de execução guardado em uma matriz float64 pré-alocada (uma linha por registro,
+    uma coluna por campo), no lugar de uma lista de tuplas. Os registros passam por um pequeno
+    bloco de tuplas e são copiados para a matriz em lote; laços muito quentes podem acumular
+    tuplas por conta própria e entregá-las com registrar_lote(). Continua indexável como
+    antes: historico[-1][1], len(historico), iteração.
+
+    Dizimação: 'intervalo' guarda 1 a cada k chamadas; 'apenas_melhorias' guarda só quando o
+    segundo campo (fitness / melhor valor) supera o melhor já registrado. O último estado
+    chamado é sempre registrado por finalizar().
+
+    Memória: com 'limite', ao encher a matriz metade das linhas é descartada (uma sim, outra
+    não) e o intervalo dobra; com 'arquivo', linhas cheias são anexadas ao arquivo binário e
+    só o bloco corrente fica em memória
+
+    Os algoritmos anexam a instrumentação da execução em 'estatisticas' (ver instrumentacao.py)
+    """
+
+    TAMANHO_BLOCO = 4096
+
+    def __init__(self, campos, intervalo=1, apenas_melhorias=False, limite=None, arquivo=None,
+                 capacidade_inicial=4096):
+        if intervalo < 1:
+            raise ValueError("intervalo deve ser pelo menos 1")
+        if limite is not None and limite < 2:
+            raise ValueError("limite deve ser pelo menos 2")
+        
+        self.campos = tuple(campos)
+        self.intervalo = intervalo
+        self.apenas_melhorias = apenas_melhorias
+        self.limite = limite
+        self.arquivo = arquivo
+        
+        capacidade = capacidade_inicial if limite is None else min(capacidade_inicial, limite)
+        self._dados = np.empty((max(capacidade, 1), len(self.campos)))
+        self._n = 0
+        self._n_disco = 0
+        self._bloco = []
+        self._chamadas = 0
+        self._melhor = -np.inf
+        self._descartado = None
+        self.estatisticas = None
+        
+        if arquivo is not None:
+            open(arquivo, "wb").close()
+
+    def registrar(self, *valores):
+        """Registra um estado (um valor por campo), respeitando a dizimação configurada"""
+        chamada = self._chamadas
+        self._chamadas = chamada + 1
+        
+        if self.apenas_melhorias:
+            if not valores[1] > self._melhor:
+                self._descartado = valores
+                return
+            self._melhor = valores[1]
+        elif chamada % self.intervalo:
+            self._descartado = valores
+            return
+        
+        self._descartado = None
+        self._bloco.append(valores)
+        if len(self._bloco) >= self.TAMANHO_BLOCO:
+            self._descarregar_bloco()
+
+    def registrar_lote(self, linhas):
+        """
+        Registra vários estados de uma vez (lista de tuplas, na ordem em que ocorreram),
+        com a mesma dizimação de registrar(), sem uma chamada Python por estado
+        """
+        if not linhas:
+            return
+        
+        self._descarregar_bloco()
+        primeira_chamada = self._chamadas
+        self._chamadas += len(linhas)
+        
+        if self.apenas_melhorias:
+            bloco = self._converter(linhas)
+            fitness = bloco[:, 1]
+            melhor_antes = np.maximum.accumulate(np.r_[self._melhor, fitness[:-1]])
+            selecionadas = fitness > melhor_antes
+            self._melhor = max(self._melhor, float(fitness.max()))
+            ultima_registrada = bool(selecionadas[-1])
+            bloco = bloco[selecionadas]
+        else:
+            inicio = -primeira_chamada % self.intervalo
+            bloco = self._converter(linhas[inicio::self.intervalo])
+            ultima_registrada = len(linhas) > inicio and (len(linhas) - 1 - inicio) % self.intervalo == 0
+        
+        self._descartado = None if ultima_registrada else linhas[-1]
+        self._anexar(bloco)
+
+    def finalizar(self):
+        """Registra o último estado descartado pela dizimação e grava tudo no arquivo, se houver"""
+        if self._descartado is not None:
+            self._bloco.append(self._descartado)
+            self._descartado = None
+        self._descarregar_bloco()
+        if self.arquivo is not None:
+            self._anexar_ao_arquivo()
+        return self
+
+    def como_array(self):
+        """Todos os registros como array float64 (registros x campos)"""
+        self._descarregar_bloco()
+        return np.concatenate((self._disco(), self._dados[:self._n]))
+
+    def coluna(self, campo):
+        """Valores de um campo ao longo da execução"""
+        return self.como_array()[:, self.campos.index(campo)]
+
+    def _converter(self, linhas):
+        n_campos = len(self.campos)
+        return np.fromiter(chain.from_iterable(linhas), np.float64, len(linhas) * n_campos).reshape(-1, n_campos)
+
+    def _descarregar_bloco(self):
+        if self._bloco:
+            bloco = self._converter(self._bloco)
+            self._bloco = []
+            self._anexar(bloco)
+
+    def _anexar(self, bloco):
+        inicio = 0
+        while inicio < len(bloco):
+            if self._n == len(self._dados):
+                self._abrir_espaco()
+            quantidade = min(len(bloco) - inicio, len(self._dados) - self._n)
+            self._dados[self._n:self._n + quantidade] = bloco[inicio:inicio + quantidade]
+            self._n += quantidade
+            inicio += quantidade
+
+    def _abrir_espaco(self):
+        if self.arquivo is not None:
+            self._anexar_ao_arquivo()
+        elif self.limite is not None and self._n >= self.limite:
+            # Afinamento: mantém um registro sim, outro não, e passa a registrar com metade da frequência
+            mantidos = self._dados[:self._n:2].copy()
+            self._n = len(mantidos)
+            self._dados[:self._n] = mantidos
+            self.intervalo *= 2
+        else:
+            nova_capacidade = 2 * len(self._dados)
+            if self.limite is not None:
+                nova_capacidade = min(nova_capacidade, self.limite)
+            novos_dados = np.empty((nova_capacidade, len(self.campos)))
+            novos_dados[:self._n] = self._dados[:self._n]
+            self._dados = novos_dados
+
+    def _anexar_ao_arquivo(self):
+        with open(self.arquivo, "ab") as arquivo:
+            self._dados[:self._n].tofile(arquivo)
+        self._n_disco += self._n
+        self._n = 0
+
+    def _disco(self):
+        if self._n_disco == 0:
+            return np.empty((0, len(self.campos)))
+        return np.memmap(self.arquivo, dtype=np.float64, mode="r", shape=(self._n_disco, len(self.campos)))
+
+    def __len__(self):
+        return self._n_disco + self._n + len(self._bloco)
+
+    def __getitem__(self, i):
+        if isinstance(i, slice):
+            return [self[j] for j in range(*i.indices(len(self)))]
+        
+        self._descarregar_bloco()
+        if i < 0:
+            i += len(self)
+        if not 0 <= i < len(self):
+            raise IndexError("índice fora do histórico")
+        
+        if i < self._n_disco:
+            return tuple(self._disco()[i].tolist())
+        return tuple(self._dados[i - self._n_disco].tolist())
+
+    def __iter__(self):
+        self._descarregar_bloco()
+        for parte in (self._disco(), self._dados[:self._n]):
+            for linha in parte:
+                yield tuple(linha.tolist())
+
+    def __repr__(self):
+        return f"Historico({len(self)} registros, campos={self.campos})"
@@ -0,0 +1,107 @@
+import cProfile
+import io
+import pstats
+import time
+import tracemalloc
+
+class Estatisticas:
+    """
+    Instrumentação leve de uma execução: tempo de parede por fase, contadores de avaliações
+    e movimentos, taxa de aceitação e avaliações por segundo. O algoritmo marca o fim de
+    cada fase com marcar() (uma chamada a perf_counter) e entrega os contadores que já
+    mantém em variáveis locais só no fim, com contar(); nada é feito por passo.
+
+    Com 'perfilar', a execução inteira roda sob cProfile (perfil em 'perfil', um
+    pstats.Stats); com 'rastrear_memoria', sob tracemalloc (pico em 'pico_memoria', bytes).
+    Ambos custam caro e ficam desligados por padrão.
+
+    Fica no histórico devolvido (historico.estatisticas) e nos dados do evento FIM
+    """
+
+    def __init__(self, algoritmo, perfilar=False, rastrear_memoria=False):
+        self.algoritmo = algoritmo
+        self.perfilar = perfilar
+        self.rastrear_memoria = rastrear_memoria
+        self.fases = {}
+        self.contadores = {}
+        self.tempo_total = 0.0
+        self.perfil = None
+        self.pico_memoria = None
+        self._perfilador = None
+        self._parar_tracemalloc = False
+        self._inicio = None
+        self._marca = None
+
+    def iniciar(self):
+        """Começa a contar o tempo (e liga o perfilador / o rastreio de memória, se pedidos)"""
+        if self.rastrear_memoria:
+            # Se o tracemalloc já estava ligado (ex.: benchmark), só mede o pico, sem desligá-lo
+            self._parar_tracemalloc = not tracemalloc.is_tracing()
+            if self._parar_tracemalloc:
+                tracemalloc.start()
+            tracemalloc.reset_peak()
+        if self.perfilar:
+            self._perfilador = cProfile.Profile()
+            self._perfilador.enable()
+        self._inicio = self._marca = time.perf_counter()
+        return self
+
+    def marcar(self, fase):
+        """Atribui à fase 'fase' o tempo decorrido desde a marcação anterior"""
+        agora = time.perf_counter()
+        self.fases[fase] = self.fases.get(fase, 0.0) + (agora - self._marca)
+        self._marca = agora
+
+    def contar(self, nome, quantidade=1):
+        """Soma 'quantidade' ao contador 'nome'"""
+        self.contadores[nome] = self.contadores.get(nome, 0) + quantidade
+
+    def finalizar(self):
+        """Fecha a contagem do tempo e desliga o perfilador / o rastreio de memória"""
+        self.tempo_total = time.perf_counter() - self._inicio
+        if self._perfilador is not None:
+            self._perfilador.disable()
+            self.perfil = pstats.Stats(self._perfilador)
+            self._perfilador = None
+        if self.rastrear_memoria:
+            self.pico_memoria = tracemalloc.get_traced_memory()[1]
+            if self._parar_tracemalloc:
+                tracemalloc.stop()
+        return self
+
+    @property
+    def avaliacoes(self):
+        """Soluções avaliadas (completas ou por delta de um flip)"""
+        return self.contadores.get("avaliacoes", 0)
+
+    @property
+    def avaliacoes_por_s(self):
+        return self.avaliacoes / self.tempo_total if self.tempo_total > 0 else None
+
+    @property
+    def taxa_aceitacao(self):
+        """Movimentos aceitos por movimento proposto; None se o algoritmo não propõe movimentos"""
+        propostos = self.contadores.get("propostos", 0)
+        return self.contadores.get("aceitos", 0) / propostos if propostos else None
+
+    def relatorio_perfil(self, ordenar="cumulative", linhas=20):
+        """As 'linhas' funções mais caras do perfil, como texto; None se não houve perfilamento"""
+        if self.perfil is None:
+            return None
+        saida = io.StringIO()
+        pstats.Stats(stream=saida).add(self.perfil).sort_stats(ordenar).print_stats(linhas)
+        return saida.getvalue()
+
+    def como_dict(self):
+        """Resumo plano (só números), para tabelas e serialização"""
+        resumo = {"algoritmo": self.algoritmo, "tempo_total_s": self.tempo_total,
+                  "avaliacoes_por_s": self.avaliacoes_por_s, "taxa_aceitacao": self.taxa_aceitacao,
+                  "pico_memoria": self.pico_memoria}
+        resumo.update(self.contadores)
+        resumo.update({f"tempo_{fase}_s": tempo for fase, tempo in self.fases.items()})
+        return resumo
+
+    def __repr__(self):
+        avaliacoes_por_s = self.avaliacoes_por_s
+        return (f"Estatisticas({self.algoritmo}: {self.tempo_total:.3f}s, {self.avaliacoes} avaliações"
+                + (f", {avaliacoes_por_s:,.0f}/s" if avaliacoes_por_s else "") + ")")
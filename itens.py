@@ -1,17 +1,156 @@
 from dataclasses import dataclass, field
-from typing import List, Optional
+from typing import List, Optional, Tuple
+
+import numpy as np
 
 @dataclass
 class ItemDataclass:
     nome: str
     valor: float
     peso: float
+    # Mochila multidimensional: consumo do item nos demais recursos (volume, custo, ...)
+    pesos_extras: Tuple[float, ...] = ()
+    # Escolha múltipla: no máximo um item de cada grupo entra na mochila
+    grupo: Optional[int] = None
 
     def ratio_valor_peso(self) -> float:
         if self.peso == 0:
             return float('inf')
         return self.valor / self.peso
+
+
+def calcular_ratios(valores, pesos):
+    """Ratios valor/peso com a convenção de ItemDataclass.ratio_valor_peso: peso zero -> infinito"""
+    ratios = np.full(len(pesos), np.inf)
+    np.divide(valores, pesos, out=ratios, where=pesos != 0)
+    return ratios
+
+
+class NomesPadrao:
+    """Sequência preguiçosa de nomes "Item 1", "Item 2", ... para instâncias sem nomes próprios"""
+    
+    def __init__(self, quantidade):
+        self.quantidade = quantidade
+    
+    def __len__(self):
+        return self.quantidade
+    
+    def __getitem__(self, i):
+        if isinstance(i, slice):
+            return [self[j] for j in range(*i.indices(self.quantidade))]
+        if i < 0:
+            i += self.quantidade
+        if not 0 <= i < self.quantidade:
+            raise IndexError("índice fora da coleção de itens")
+        return f"Item {i + 1}"
+
+
+class ItensArray:
+    """
+    Coleção de itens em arrays contíguos float64 (valores, pesos e ratios),
+    construída uma única vez e usada pelos laços internos dos algoritmos.
+    Sem nomes (nomes=None), os itens recebem "Item 1", "Item 2", ... sob demanda.
+    
+    Mochila multidimensional: 'pesos' pode ser uma matriz (itens x recursos); a primeira
+    coluna é o peso principal (self.pesos, usado em ratios e relatórios) e a matriz inteira
+    fica em self.pesos_dimensoes. Escolha múltipla: 'grupos' dá o grupo de cada item
+    (-1 = sem grupo). As restrições correspondentes ficam em restricoes.py
+    """
+    
+    def __init__(self, nomes, valores, pesos, ratios=None, grupos=None):
+        # Colunas mapeadas em memória (ver carregador.py) não devem ser copiadas para listas
+        self.mapeado_em_memoria = isinstance(valores, np.memmap) or isinstance(pesos, np.memmap)
+        self.valores = np.ascontiguousarray(valores, dtype=np.float64)
+        pesos = np.ascontiguousarray(pesos, dtype=np.float64)
+        if pesos.ndim == 2:
+            self.pesos_dimensoes = pesos
+            self.pesos = np.ascontiguousarray(pesos[:, 0])
+        else:
+            self.pesos = pesos
+            self.pesos_dimensoes = pesos[:, np.newaxis]
+        self.grupos = None if grupos is None else np.asarray(grupos, dtype=np.int64)
+        if nomes is None:
+            nomes = NomesPadrao(len(self.pesos))
+        self.nomes = nomes if isinstance(nomes, NomesPadrao) else list(nomes)
+        
+        if not (len(self.nomes) == len(self.valores) == len(self.pesos)):
+            raise ValueError("nomes, valores e pesos devem ter o mesmo tamanho")
+        if self.grupos is not None and len(self.grupos) != len(self.pesos):
+            raise ValueError("grupos deve ter um valor por item")
+        
+        if ratios is not None:
+            # Ratios já calculados (ex.: coluna de um arquivo mapeado em memória)
+            self.ratios = np.ascontiguousarray(ratios, dtype=np.float64)
+        else:
+            self.ratios = calcular_ratios(self.valores, self.pesos)
+        self._ordem_por_ratio = None
+    
+    @classmethod
+    def de_itens(cls, itens) -> "ItensArray":
+        """Constrói a coleção a partir de uma lista de ItemDataclass (ou a devolve se já for ItensArray)"""
+        if isinstance(itens, cls):
+            return itens
+        
+        pesos = [item.peso for item in itens]
+        if any(item.pesos_extras for item in itens):
+            pesos = [(item.peso, *item.pesos_extras) for item in itens]
+        grupos = None
+        if any(item.grupo is not None for item in itens):
+            grupos = [-1 if item.grupo is None else item.grupo for item in itens]
+        
+        return cls([item.nome for item in itens],
+                   [item.valor for item in itens],
+                   pesos, grupos=grupos)
+    
+    @property
+    def n_dimensoes(self):
+        """Quantidade de recursos (colunas de peso) da instância"""
+        return self.pesos_dimensoes.shape[1]
+    
+    @property
+    def simples(self):
+        """Se é a mochila 0/1 clássica: um único peso por item e nenhum grupo de escolha"""
+        return self.n_dimensoes == 1 and self.grupos is None
+    
+    def avaliar(self, solucao):
+        """Retorna (valor_total, peso_total) de uma solução binária por produto escalar"""
+        solucao = np.asarray(solucao)
+        return float(self.valores @ solucao), float(self.pesos @ solucao)
+    
+    def ordem_por_ratio(self):
+        """Índices dos itens do menor para o maior ratio (ordenação estável, calculada uma vez)"""
+        if self._ordem_por_ratio is None:
+            self._ordem_por_ratio = np.argsort(self.ratios, kind="stable")
+        return self._ordem_por_ratio
+    
+    def colunas_escalares(self):
+        """
+        Retorna (pesos, valores) para acesso item a item nos laços O(1): listas Python,
+        mais rápidas de indexar, ou os próprios arrays se estiverem mapeados em memória
+        """
+        if self.mapeado_em_memoria:
+            return self.pesos, self.valores
+        return self.pesos.tolist(), self.valores.tolist()
+    
+    def __len__(self):
+        return len(self.pesos)
     
+    def __getitem__(self, i) -> ItemDataclass:
+        item = ItemDataclass(self.nomes[i], float(self.valores[i]), float(self.pesos[i]))
+        if self.n_dimensoes > 1:
+            item.pesos_extras = tuple(self.pesos_dimensoes[i, 1:].tolist())
+        if self.grupos is not None and self.grupos[i] >= 0:
+            item.grupo = int(self.grupos[i])
+        return item
+    
+    def __iter__(self):
+        for i in range(len(self)):
+            yield self[i]
+    
+    def __repr__(self):
+        return f"ItensArray({len(self)} itens)"
+
+
 class ItensPreDefinidos:
     """Classe para gerenciar os 15 itens da tabela"""
     
@@ -24,6 +163,7 @@ class ItensPreDefinidos:
     ]
     
     _itens_criados: Optional[List[ItemDataclass]] = None
+    _itens_array: Optional[ItensArray] = None
     
     @classmethod
     def obter_todos_itens(cls) -> List[ItemDataclass]:
@@ -31,6 +171,13 @@ class ItensPreDefinidos:
             cls._criar_itens()
         return cls._itens_criados.copy()
 
+    @classmethod
+    def obter_itens_array(cls) -> ItensArray:
+        """Retorna os itens como ItensArray, construído uma única vez"""
+        if cls._itens_array is None:
+            cls._itens_array = ItensArray.de_itens(cls.obter_todos_itens())
+        return cls._itens_array
+
     @classmethod
     def _criar_itens(cls):
         """Cria os itens uma única vez"""
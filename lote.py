@@ -0,0 +1,78 @@
+import numpy as np
+
+from bits import SolucaoBits
+from itens import ItensArray, calcular_ratios
+
+class InstanciasLote:
+    """
+    Pilha de instâncias pequenas para os laços em lote (HC.executa_hc_lote, SA.executa_sa_lote):
+    valores e pesos em matrizes instâncias x itens, completadas com itens fantasma (valor e peso
+    zero, nunca selecionados) até o tamanho da maior instância, e uma capacidade por linha.
+    Também faz, para todas as instâncias de uma vez, o reparo guloso do Reparador: remove os
+    itens de menor ratio enquanto o peso excede a capacidade, com a mesma ordem estável
+    """
+
+    def __init__(self, instancias):
+        instancias = [(ItensArray.de_itens(itens), capacidade) for itens, capacidade in instancias]
+        if not instancias:
+            raise ValueError("O lote precisa de pelo menos uma instância")
+        if not all(itens.simples and np.ndim(capacidade) == 0 for itens, capacidade in instancias):
+            raise ValueError("O lote só resolve a mochila simples (um recurso, sem grupos)")
+        
+        self.itens = [itens for itens, _ in instancias]
+        self.tamanhos = np.array([len(itens) for itens in self.itens], dtype=np.int64)
+        self.capacidades = np.array([capacidade for _, capacidade in instancias], dtype=np.float64)
+        
+        n_instancias, n_maximo = len(instancias), int(self.tamanhos.max())
+        self.validos = np.arange(n_maximo) < self.tamanhos[:, np.newaxis]
+        self.valores = np.zeros((n_instancias, n_maximo))
+        self.pesos = np.zeros((n_instancias, n_maximo))
+        self.valores[self.validos] = np.concatenate([itens.valores for itens in self.itens])
+        self.pesos[self.validos] = np.concatenate([itens.pesos for itens in self.itens])
+        
+        # Fantasmas com ratio infinito ficam no fim da ordem, depois dos itens reais (estável)
+        ratios = np.where(self.validos, calcular_ratios(self.valores.ravel(), self.pesos.ravel())
+                          .reshape(self.valores.shape), np.inf)
+        self.ordem = np.argsort(ratios, axis=1, kind="stable")
+        self._pesos_ordenados = np.take_along_axis(self.pesos, self.ordem, axis=1)
+
+    def __len__(self):
+        return len(self.itens)
+
+    def aleatorias(self, rng):
+        """Uma solução 0/1 aleatória por instância (fantasmas em zero)"""
+        return rng.integers(0, 2, size=self.valores.shape, dtype=np.uint8) & self.validos
+
+    def empilhar(self, solucoes):
+        """Matriz de soluções a partir de uma solução (array 0/1 ou SolucaoBits) por instância"""
+        if len(solucoes) != len(self):
+            raise ValueError("Deve haver uma solução inicial por instância")
+        matriz = np.zeros(self.valores.shape, dtype=np.uint8)
+        for linha, (solucao, tamanho) in enumerate(zip(solucoes, self.tamanhos.tolist())):
+            if len(solucao) != tamanho:
+                raise ValueError(f"A solução inicial da instância {linha} deve ter um valor por item")
+            matriz[linha, :tamanho] = np.asarray(solucao, dtype=np.uint8)
+        return matriz
+
+    def reparar(self, populacao):
+        """Reparo guloso de uma solução por instância, como Reparador.remover_excesso linha a linha"""
+        ordenada = np.take_along_axis(populacao, self.ordem, axis=1)
+        pesos_ordenados = ordenada * self._pesos_ordenados
+        peso_total = pesos_ordenados.sum(axis=1, keepdims=True)
+        peso_antes = peso_total - (np.cumsum(pesos_ordenados, axis=1) - pesos_ordenados)
+        removidos = (ordenada == 1) & (peso_antes > self.capacidades[:, np.newaxis])
+        
+        reparada = np.empty_like(populacao)
+        np.put_along_axis(reparada, self.ordem, ordenada & ~removidos, axis=1)
+        return reparada
+
+    def totais(self, populacao):
+        """(valores, pesos) de cada solução da matriz"""
+        return (populacao * self.valores).sum(axis=1), (populacao * self.pesos).sum(axis=1)
+
+    def separar(self, populacao):
+        """Uma SolucaoBits por instância, sem os itens fantasma"""
+        return [SolucaoBits.de_array(linha[:tamanho]) for linha, tamanho in zip(populacao, self.tamanhos.tolist())]
+
+    def __repr__(self):
+        return f"InstanciasLote({len(self)} instâncias, até {self.valores.shape[1]} itens)"
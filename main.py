@@ -3,9 +3,20 @@ from itens import ItensPreDefinidos
 from HC import HC
 from SA import SA
 from AG import AG
+from PD import PD
+from BB import BB
+from multistart import MultiStart
+from eventos import RelatorioConsole
+from resultados import ALGORITMOS
 
-def executar_otimizacao(algoritmo):
+def executar_otimizacao(algoritmo, cache=None, semente=0):
+    """
+    Executa o algoritmo pedido sobre os itens pré-definidos. Com um CacheResultados
+    (resultados.py), HC, SA, AG, PD e BB passam pelo cache: a mesma instância com os mesmos
+    parâmetros e semente devolve o resultado guardado sem executar de novo
+    """
     todos_itens = ItensPreDefinidos.obter_todos_itens()
+    itens_array = ItensPreDefinidos.obter_itens_array()
 
     print(f"Algoritmo: {algoritmo.upper()}")
     print(f"Itens: {todos_itens}")
@@ -13,33 +24,47 @@ def executar_otimizacao(algoritmo):
     
     print()
     
+    if cache is not None and algoritmo.upper() in ALGORITMOS:
+        _, valor, peso, estatisticas = cache.executar(algoritmo, itens_array, semente=semente)
+        origem = "cache" if estatisticas["do_cache"] else f"execução em {estatisticas['tempo_s']:.3f}s"
+        print(f"💾 {algoritmo.upper()}: R$ {valor:.0f}, {peso:.0f}kg ({origem})")
+        return f"{algoritmo.upper()} executado com sucesso"
+    
     if algoritmo.upper() == 'HC':
-        HC.executa_hc(todos_itens)
+        HC.executa_hc(itens_array, observadores=[RelatorioConsole(detalhado=False)])
         return "HC executado com sucesso"
     
     elif algoritmo.upper() == 'SA':
-        SA.executa_sa(todos_itens, mostrar_processo=True)
+        SA.executa_sa(itens_array, mostrar_processo=True)
         return "SA executado com sucesso"
 
     elif algoritmo.upper() == 'AG':
-        AG.executa_ag(todos_itens, mostrar_processo=True)
+        AG.executa_ag(itens_array, mostrar_processo=True)
         return "SA executado com sucesso"
     
+    elif algoritmo.upper() == 'PD':
+        PD.executa_pd(itens_array, mostrar_processo=True)
+        return "PD executado com sucesso"
+    
+    elif algoritmo.upper() == 'BB':
+        BB.executa_bb(itens_array, mostrar_processo=True)
+        return "BB executado com sucesso"
+    
     elif algoritmo.upper() == 'COMPARACAO_DETALHADA':
         print("📊 COMPARAÇÃO DETALHADA DE TODOS OS ALGORITMOS")
         print("=" * 80)
         
         # Executa cada algoritmo uma vez para comparação
         print("\n🏔️ HILL CLIMBING:")
-        solucao_hc, valor_hc, peso_hc, hist_hc = HC.executa_hc(todos_itens, mostrar_processo=False)
+        solucao_hc, valor_hc, peso_hc, hist_hc = HC.executa_hc(itens_array, observadores=[RelatorioConsole(detalhado=False)])
         itens_hc = [todos_itens[i].nome for i in range(len(solucao_hc)) if solucao_hc[i] == 1]
         
         print("\n🔥 SIMULATED ANNEALING:")  
-        solucao_sa, valor_sa, peso_sa, hist_sa = SA.executa_sa(todos_itens, mostrar_processo=False)
+        solucao_sa, valor_sa, peso_sa, hist_sa = SA.executa_sa(itens_array, observadores=[RelatorioConsole(detalhado=False)])
         itens_sa = [todos_itens[i].nome for i in range(len(solucao_sa)) if solucao_sa[i] == 1]
         
         print("\n🧬 ALGORITMO GENÉTICO:")
-        solucao_ag, valor_ag, peso_ag, hist_ag = AG.executa_ag(todos_itens, mostrar_processo=False)
+        solucao_ag, valor_ag, peso_ag, hist_ag = AG.executa_ag(itens_array, mostrar_processo=False)
         itens_ag = [todos_itens[i].nome for i in range(len(solucao_ag)) if solucao_ag[i] == 1]
         
         # Tabela comparativa
@@ -84,12 +109,10 @@ def executar_otimizacao(algoritmo):
 
         return f"vencedor {vencedor}"
     elif algoritmo.upper() == 'ANALISE_HC':
-        resultados = []
-        for i in range(20):
-            _, valor, _, _ = HC.executa_hc(todos_itens)
-            resultados.append(valor)
+        _, _, _, resultados = MultiStart.executa('HC', itens_array, n_execucoes=20)
+        valores = [valor for _, valor, _ in resultados]
         
-        variacao = max(resultados) - min(resultados)
+        variacao = max(valores) - min(valores)
         
         if variacao > 50:
             return "SIM - Muitos ótimos locais (variação alta)"
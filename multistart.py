@@ -0,0 +1,76 @@
+import contextlib
+import io
+import os
+import random
+from concurrent.futures import ProcessPoolExecutor
+
+from itens import ItensArray
+from resultados import ALGORITMOS, METAHEURISTICAS
+
+# Itens do processo trabalhador: enviados uma única vez pelo inicializador do pool
+_itens_worker = None
+
+def _inicializar_worker(nomes, valores, pesos, grupos):
+    global _itens_worker
+    _itens_worker = ItensArray(nomes, valores, pesos, grupos=grupos)
+
+def _executar_uma(algoritmo, semente, parametros, itens=None):
+    """Executa uma rodada do algoritmo com semente própria (determinística)"""
+    random.seed(semente)
+    with contextlib.redirect_stdout(io.StringIO()):
+        solucao, valor, peso, _ = ALGORITMOS[algoritmo](itens if itens is not None else _itens_worker, **parametros)
+    return semente, solucao, valor, peso
+
+class MultiStart:
+    @classmethod
+    def executa(cls, algoritmo, itens, n_execucoes=20, n_processos=None, semente=None, **parametros):
+        """
+        Executa N rodadas independentes de HC, SA ou AG em um ProcessPoolExecutor
+        
+        Args:
+            algoritmo: 'HC', 'SA' ou 'AG'
+            itens: Lista de ItemDataclass com nome, valor e peso (ou ItensArray)
+            n_execucoes: Número de rodadas independentes (padrão: 20)
+            n_processos: Número de processos (padrão: todos os núcleos; 1 executa em série)
+            semente: Semente base; a rodada i usa semente + i (padrão: aleatória)
+            **parametros: Parâmetros repassados ao algoritmo (capacidade_maxima, etc.)
+        
+        Returns:
+            tuple: (melhor_solucao, melhor_valor, melhor_peso, resultados)
+            resultados: lista de (semente, valor, peso) de cada rodada
+        """
+        algoritmo = algoritmo.upper()
+        if algoritmo not in METAHEURISTICAS:
+            raise ValueError(f"Algoritmo {algoritmo} não suportado no multi-start")
+        
+        itens = ItensArray.de_itens(itens)
+        parametros['mostrar_processo'] = False
+        
+        if semente is None:
+            semente = random.getrandbits(32)
+        sementes = [semente + i for i in range(n_execucoes)]
+        
+        if n_processos is None:
+            n_processos = os.cpu_count() or 1
+        n_processos = max(1, min(n_processos, n_execucoes))
+        
+        if n_processos == 1:
+            rodadas = [_executar_uma(algoritmo, s, parametros, itens) for s in sementes]
+        else:
+            with ProcessPoolExecutor(max_workers=n_processos,
+                                     initializer=_inicializar_worker,
+                                     initargs=(itens.nomes, itens.valores, itens.pesos_dimensoes,
+                                               itens.grupos)) as executor:
+                # Cada tarefa leva apenas (algoritmo, semente, parâmetros); os itens já estão no worker
+                chunksize = max(1, n_execucoes // (4 * n_processos))
+                rodadas = list(executor.map(_executar_uma,
+                                            [algoritmo] * n_execucoes,
+                                            sementes,
+                                            [parametros] * n_execucoes,
+                                            chunksize=chunksize))
+        
+        # A ordem das rodadas segue as sementes, então o desempate também é determinístico
+        _, melhor_solucao, melhor_valor, melhor_peso = max(rodadas, key=lambda r: r[2])
+        resultados = [(s, valor, peso) for s, _, valor, peso in rodadas]
+        
+        return melhor_solucao, melhor_valor, melhor_peso, resultados
@@ -0,0 +1,172 @@
+import numpy as np
+
+from bits import SolucaoBits
+from itens import ItensArray
+from reparo import Reparador
+from resultados import ALGORITMOS
+
+class Reducao:
+    """
+    Pré-processamento da mochila simples: fixa os itens cuja decisão é óbvia e deixa aos
+    algoritmos só o núcleo ("core") em torno do item de quebra, onde o ratio é crítico.
+
+    1. Dominância trivial: item que não cabe sozinho ou sem valor fica fora; item de peso
+       zero e valor positivo fica dentro.
+    2. Fixação pelo limitante de Dantzig (redução de Dembo-Hammer): com os itens em ordem
+       decrescente de ratio, o item de quebra b dá o limitante U da relaxação linear. Forçar
+       um item j para o lado oposto ao da relaxação custa pelo menos |p_j - r_b * w_j|; se
+       nem assim U supera o limitante inferior L (solução gulosa ou incumbente informada),
+       nenhuma solução melhor que L inverte j, e j fica fixado.
+    3. Núcleo heurístico (opcional): só os 'tamanho_nucleo' itens livres mais próximos do
+       item de quebra seguem livres; os anteriores entram e os posteriores saem. Deixa de
+       garantir o ótimo (exata=False).
+
+    As fixações 1 e 2 preservam o ótimo: resolver o núcleo exatamente e comparar com a
+    incumbente (melhor_completa) dá o ótimo da instância original
+    """
+
+    def __init__(self, itens, capacidade, solucao_inicial=None, tamanho_nucleo=None):
+        self.itens = ItensArray.de_itens(itens)
+        if not self.itens.simples:
+            raise ValueError("A redução resolve apenas a mochila simples (um recurso, sem grupos)")
+        self.capacidade = capacidade
+        n_itens = len(self.itens)
+        valores, pesos = self.itens.valores, self.itens.pesos
+        
+        # Limitante inferior: preenchimento guloso por ratio, ou a incumbente se for melhor
+        self.incumbente = Reparador(self.itens, capacidade).preencher(np.zeros((1, n_itens), dtype=np.uint8))[0]
+        if solucao_inicial is not None:
+            if len(solucao_inicial) != n_itens:
+                raise ValueError("solucao_inicial deve ter um valor por item")
+            candidata = np.array(solucao_inicial, dtype=np.uint8)
+            valor, peso = self.itens.avaliar(candidata)
+            if peso <= capacidade and valor > self.itens.avaliar(self.incumbente)[0]:
+                self.incumbente = candidata
+        self.limite_inferior = self.itens.avaliar(self.incumbente)[0]
+        
+        # Estado de cada item: 1 dentro, 0 fora, -1 livre
+        fixacao = np.full(n_itens, -1, dtype=np.int8)
+        fixacao[(pesos > capacidade) | (valores <= 0)] = 0
+        fixacao[(pesos == 0) & (valores > 0)] = 1
+        
+        # Item de quebra: primeiro item (em ratio decrescente) que não cabe inteiro
+        ordem = self.itens.ordem_por_ratio()[::-1]
+        pesos_acumulados = np.cumsum(pesos[ordem])
+        quebra = int(np.searchsorted(pesos_acumulados, capacidade, side="right"))
+        self.limite_superior = float(valores[ordem].sum())
+        if quebra < n_itens:
+            antes = ordem[:quebra]
+            ratio_critico = self.itens.ratios[ordem[quebra]]
+            residual = capacidade - (pesos_acumulados[quebra - 1] if quebra > 0 else 0.0)
+            self.limite_superior = float(valores[antes].sum() + residual * ratio_critico)
+            
+            # Limitante de cada item forçado contra a relaxação: U - |p_j - r_b w_j|
+            limites = self.limite_superior - np.abs(valores - ratio_critico * pesos)
+            folga = 1e-9 * max(1.0, abs(self.limite_superior))
+            if np.array_equal(np.rint(valores), valores):
+                # Valores inteiros: qualquer solução vale no máximo o piso do limitante
+                limites = np.floor(limites + folga)
+            else:
+                limites = limites + folga
+            decididos = limites <= self.limite_inferior
+            
+            posicao = np.empty(n_itens, dtype=np.int64)
+            posicao[ordem] = np.arange(n_itens)
+            livres = fixacao == -1
+            fixacao[livres & decididos & (posicao < quebra)] = 1
+            fixacao[livres & decididos & (posicao > quebra)] = 0
+            
+            self.exata = True
+            if tamanho_nucleo is not None:
+                livres = np.flatnonzero(fixacao == -1)
+                if len(livres) > tamanho_nucleo:
+                    distancia = np.abs(posicao[livres] - quebra)
+                    fora_do_nucleo = livres[np.argsort(distancia, kind="stable")[tamanho_nucleo:]]
+                    fixacao[fora_do_nucleo] = (posicao[fora_do_nucleo] < quebra).astype(np.int8)
+                    self.exata = False
+        else:
+            # Tudo cabe: a solução é trivial
+            fixacao[fixacao == -1] = 1
+            self.exata = True
+        
+        self.fixacao = fixacao
+        self.livres = np.flatnonzero(fixacao == -1)
+        self.fixados_dentro = np.flatnonzero(fixacao == 1)
+        self.fixados_fora = np.flatnonzero(fixacao == 0)
+        self.valor_fixado = float(valores[self.fixados_dentro].sum())
+        self.capacidade_reduzida = capacidade - float(pesos[self.fixados_dentro].sum())
+        
+        nomes = self.itens.nomes
+        self.itens_reduzidos = ItensArray([nomes[i] for i in self.livres.tolist()],
+                                          valores[self.livres], pesos[self.livres])
+
+    def reduzir(self, solucao):
+        """Restrição de uma solução completa aos itens livres"""
+        return np.asarray(solucao, dtype=np.uint8)[self.livres]
+
+    def expandir(self, solucao_reduzida):
+        """Solução completa (array 0/1) a partir de uma solução dos itens livres"""
+        completa = (self.fixacao == 1).astype(np.uint8)
+        if len(self.livres):
+            completa[self.livres] = np.asarray(solucao_reduzida, dtype=np.uint8)
+        return completa
+
+    def melhor_completa(self, solucao_reduzida):
+        """
+        Expande a solução reduzida e a compara com a incumbente: quando ninguém supera o
+        limitante inferior, a própria incumbente é a resposta
+        
+        Returns:
+            tuple: (solucao, valor, peso)
+        """
+        completa = self.expandir(solucao_reduzida)
+        valor, peso = self.itens.avaliar(completa)
+        if peso > self.capacidade or valor < self.limite_inferior:
+            completa = self.incumbente
+            valor, peso = self.itens.avaliar(completa)
+        return SolucaoBits.de_array(completa), valor, peso
+
+    @classmethod
+    def executa(cls, algoritmo, itens, capacidade_maxima=50, tamanho_nucleo=None, solucao_inicial=None,
+                **parametros):
+        """
+        Reduz a instância, executa o algoritmo só no núcleo e devolve a solução completa
+        
+        Args:
+            algoritmo: Um dos algoritmos de resultados.ALGORITMOS ('HC', 'SA', 'AG', 'PD', 'BB')
+            itens: Lista de ItemDataclass com nome, valor e peso (ou ItensArray)
+            capacidade_maxima: Capacidade máxima da mochila (padrão: 50)
+            tamanho_nucleo: Máximo de itens livres (núcleo heurístico); None mantém só as
+                            fixações que preservam o ótimo (padrão: None)
+            solucao_inicial: Incumbente para o limitante inferior e partida dos algoritmos
+            **parametros: Parâmetros repassados ao algoritmo
+        
+        Returns:
+            tuple: (melhor_solucao, melhor_valor, melhor_peso, reducao) - 'reducao' é a
+                   instância de Reducao, com o histórico do algoritmo em reducao.historico
+        """
+        algoritmo = algoritmo.upper()
+        if algoritmo not in ALGORITMOS:
+            raise ValueError(f"Algoritmo {algoritmo} não suportado na redução")
+        
+        reducao = cls(itens, capacidade_maxima, solucao_inicial, tamanho_nucleo)
+        reducao.historico = None
+        if len(reducao.livres) == 0:
+            solucao, valor, peso = reducao.melhor_completa(())
+            return solucao, valor, peso, reducao
+        
+        if algoritmo != 'PD':
+            # O núcleo parte da incumbente restrita aos itens livres
+            parametros.setdefault("solucao_inicial", reducao.reduzir(reducao.incumbente))
+        solucao_reduzida, valor_reduzido, _, reducao.historico = ALGORITMOS[algoritmo](
+            reducao.itens_reduzidos, capacidade_maxima=reducao.capacidade_reduzida, **parametros)
+        if solucao_reduzida is None:
+            # PD no modo "valor": só o valor ótimo, sem os itens
+            return None, max(reducao.valor_fixado + valor_reduzido, reducao.limite_inferior), None, reducao
+        
+        solucao, valor, peso = reducao.melhor_completa(solucao_reduzida)
+        return solucao, valor, peso, reducao
+
+    def __repr__(self):
+        return (f"Reducao({len(self.itens)} itens: {len(self.fixados_dentro)} dentro, "
+                f"{len(self.fixados_fora)} fora, {len(self.livres)} livres)")
@@ -0,0 +1,153 @@
+import numpy as np
+
+from itens import ItensArray, calcular_ratios
+from restricoes import Restricoes
+
+class Reparador:
+    """
+    Reparo guloso compartilhado por HC, SA e AG. A ordem dos itens por ratio é calculada uma
+    única vez por instância (ItensArray.ordem_por_ratio) e reaproveitada: o reparo remove, em
+    uma passada vetorizada, os itens de menor ratio enquanto o peso excede a capacidade, e o
+    preenchimento adiciona, em uma passada linear do maior para o menor ratio, os itens que
+    ainda cabem. Opera sobre matrizes de soluções desempacotadas (uma linha por solução).
+
+    Com vários recursos o ratio é o valor sobre a soma dos pesos relativos às capacidades, e
+    um item sai enquanto qualquer recurso estiver excedido; com grupos de escolha múltipla,
+    antes disso fica só o item de maior ratio selecionado em cada grupo
+    """
+
+    def __init__(self, itens, capacidade):
+        self.itens = ItensArray.de_itens(itens)
+        self.capacidade = capacidade
+        self.restricoes = Restricoes(self.itens, capacidade)
+        if self.itens.simples:
+            # Menor ratio primeiro (estável: empates saem pelo menor índice, como o min item a item)
+            self.ordem = self.itens.ordem_por_ratio()
+            self._pesos_ordenados = self.itens.pesos[self.ordem]
+        else:
+            self.ordem = np.argsort(self.eficiencias(), kind="stable")
+            self._pesos_ordenados = self.restricoes.pesos[self.ordem]
+            self._preparar_grupos()
+
+    def eficiencias(self):
+        """Valor sobre a soma dos pesos relativos (peso / capacidade) de cada recurso"""
+        pesos, capacidade = self.restricoes.pesos, self.restricoes.capacidade
+        # Capacidade zero: qualquer consumo do recurso torna o item inútil (carga infinita)
+        relativos = np.where(pesos > 0, np.inf, 0.0)
+        np.divide(pesos, capacidade, out=relativos, where=capacidade > 0)
+        return calcular_ratios(self.itens.valores, relativos.sum(axis=1))
+
+    def _preparar_grupos(self):
+        """Itens com grupo na ordem (grupo, ratio) e o fim de cada grupo nessa ordem"""
+        grupos = self.restricoes.grupos
+        self._ordem_grupos = None
+        if grupos is None:
+            return
+        
+        posicao_na_ordem = np.empty(len(self.ordem), dtype=np.int64)
+        posicao_na_ordem[self.ordem] = np.arange(len(self.ordem))
+        com_grupo = np.flatnonzero(grupos >= 0)
+        self._ordem_grupos = com_grupo[np.lexsort((posicao_na_ordem[com_grupo], grupos[com_grupo]))]
+        grupos_ordenados = grupos[self._ordem_grupos]
+        fim_do_grupo = np.flatnonzero(np.r_[grupos_ordenados[1:] != grupos_ordenados[:-1], True])
+        # Para cada posição, o índice do último item do seu grupo
+        self._fim_do_grupo = np.repeat(fim_do_grupo, np.diff(np.r_[-1, fim_do_grupo]))
+
+    def remover_excesso(self, populacao):
+        """
+        Remove itens de menor ratio até cada solução caber na mochila. Um item selecionado sai
+        se, ao chegar sua vez na ordem de ratio, o peso restante ainda excede a capacidade -
+        equivalente ao laço item a item, sem buscar o mínimo a cada remoção
+        
+        Returns:
+            tuple: (reparada, removidos) - removidos é uma máscara na ordem de ratio
+        """
+        if not self.itens.simples:
+            return self._remover_excesso_restrito(populacao)
+        
+        ordenada = populacao[:, self.ordem]
+        pesos_ordenados = ordenada * self._pesos_ordenados
+        peso_total = pesos_ordenados.sum(axis=1, keepdims=True)
+        peso_antes = peso_total - (np.cumsum(pesos_ordenados, axis=1) - pesos_ordenados)
+        removidos = (ordenada == 1) & (peso_antes > self.capacidade)
+        
+        reparada = populacao.copy()
+        reparada[:, self.ordem] = ordenada & ~removidos
+        return reparada, removidos
+
+    def _remover_excesso_restrito(self, populacao):
+        reparada = populacao.copy()
+        
+        # Grupos: sai todo selecionado que tem outro selecionado de ratio maior no mesmo grupo
+        if self._ordem_grupos is not None and len(self._ordem_grupos) > 0:
+            agrupada = reparada[:, self._ordem_grupos].astype(np.int64)
+            acumulada = np.cumsum(agrupada, axis=1)
+            depois_no_grupo = acumulada[:, self._fim_do_grupo] - acumulada
+            reparada[:, self._ordem_grupos] = agrupada & (depois_no_grupo == 0)
+        
+        # Recursos: a mesma passada por prefixos, agora com um consumo restante por recurso
+        ordenada = reparada[:, self.ordem]
+        consumos = ordenada[:, :, np.newaxis] * self._pesos_ordenados
+        consumo_antes = consumos.sum(axis=1, keepdims=True) - (np.cumsum(consumos, axis=1) - consumos)
+        excede = (consumo_antes > self.restricoes.capacidade).any(axis=2)
+        reparada[:, self.ordem] = ordenada & ~((ordenada == 1) & excede)
+        
+        removidos = (populacao[:, self.ordem] == 1) & (reparada[:, self.ordem] == 0)
+        return reparada, removidos
+
+    def preencher(self, populacao):
+        """Adiciona, do maior para o menor ratio, cada item fora da solução que ainda cabe"""
+        if not self.itens.simples:
+            return self._preencher_restrito(populacao)
+        
+        preenchida = populacao.copy()
+        folgas = self.capacidade - preenchida @ self.itens.pesos
+        
+        for i, peso in zip(self.ordem[::-1].tolist(), self._pesos_ordenados[::-1].tolist()):
+            cabe = (preenchida[:, i] == 0) & (folgas >= peso)
+            if cabe.any():
+                preenchida[cabe, i] = 1
+                folgas[cabe] -= peso
+        
+        return preenchida
+
+    def _preencher_restrito(self, populacao):
+        restricoes = self.restricoes
+        preenchida = populacao.copy()
+        folgas = restricoes.capacidade - restricoes.usos(preenchida)
+        
+        grupos = restricoes.grupos.tolist() if restricoes.grupos is not None else None
+        ocupados = np.zeros((len(preenchida), restricoes.n_grupos), dtype=bool)
+        if grupos is not None:
+            linhas, colunas = np.nonzero(preenchida[:, restricoes.grupos >= 0])
+            ocupados[linhas, restricoes.grupos[restricoes.grupos >= 0][colunas]] = True
+        
+        for i, pesos in zip(self.ordem[::-1].tolist(), self._pesos_ordenados[::-1]):
+            cabe = (preenchida[:, i] == 0) & (folgas >= pesos).all(axis=1)
+            grupo = grupos[i] if grupos is not None else -1
+            if grupo >= 0:
+                cabe &= ~ocupados[:, grupo]
+            if cabe.any():
+                preenchida[cabe, i] = 1
+                folgas[cabe] -= pesos
+                if grupo >= 0:
+                    ocupados[cabe, grupo] = True
+        
+        return preenchida
+
+    def reparar(self, populacao, preencher=False):
+        """Reparo de uma matriz de soluções, seguido do preenchimento guloso se pedido"""
+        reparada, _ = self.remover_excesso(populacao)
+        return self.preencher(reparada) if preencher else reparada
+
+    def reparar_solucao(self, solucao, preencher=False):
+        """
+        Reparo de uma única solução (array 0/1)
+        
+        Returns:
+            tuple: (reparada, removidos) - índices removidos, na ordem de ratio
+        """
+        reparada, removidos = self.remover_excesso(np.asarray(solucao, dtype=np.uint8)[np.newaxis])
+        if preencher:
+            reparada = self.preencher(reparada)
+        return reparada[0], self.ordem[removidos[0]].tolist()
@@ -0,0 +1,118 @@
+import numpy as np
+
+from itens import ItensArray
+
+class Restricoes:
+    """
+    Restrições de uma instância: uma capacidade por recurso (mochila multidimensional) e
+    grupos de escolha múltipla (no máximo um item de cada grupo na solução). Na mochila
+    simples os algoritmos seguem pelos seus caminhos escalares de sempre; nos demais casos
+    avaliam viabilidade por aqui, em lote (matrizes de soluções) ou por delta (EstadoRestricoes)
+    """
+
+    def __init__(self, itens, capacidade):
+        self.itens = ItensArray.de_itens(itens)
+        self.pesos = self.itens.pesos_dimensoes
+        self.simples = self.itens.simples
+        
+        n_dimensoes = self.itens.n_dimensoes
+        capacidade = np.asarray(capacidade, dtype=np.float64)
+        if capacidade.ndim > 1 or (capacidade.ndim == 1 and len(capacidade) != n_dimensoes):
+            raise ValueError(f"A capacidade deve ser um número ou um vetor com {n_dimensoes} recursos")
+        # Uma capacidade escalar vale para todos os recursos
+        self.capacidade = np.broadcast_to(capacidade, (n_dimensoes,)).copy()
+        
+        self.grupos = self.itens.grupos
+        self.n_grupos = 0
+        if self.grupos is not None:
+            com_grupo = np.flatnonzero(self.grupos >= 0)
+            self.n_grupos = int(self.grupos[com_grupo].max()) + 1 if len(com_grupo) else 0
+            # Itens com grupo ordenados por grupo e o início de cada grupo: contagem por reduceat
+            self._agrupados = com_grupo[np.argsort(self.grupos[com_grupo], kind="stable")]
+            grupos_ordenados = self.grupos[self._agrupados]
+            self._inicios_grupos = np.flatnonzero(np.r_[True, grupos_ordenados[1:] != grupos_ordenados[:-1]])
+
+    def usos(self, matriz):
+        """Consumo de cada recurso por solução (matriz 0/1 soluções x itens -> soluções x recursos)"""
+        return matriz @ self.pesos
+
+    def excesso_grupos(self, matriz):
+        """Itens a mais nos grupos de escolha múltipla, por solução (0 = todos os grupos respeitados)"""
+        if self.grupos is None or len(self._agrupados) == 0:
+            return np.zeros(len(matriz))
+        contagens = np.add.reduceat(matriz[:, self._agrupados].astype(np.int64), self._inicios_grupos, axis=1)
+        return np.maximum(contagens - 1, 0).sum(axis=1)
+
+    def viaveis(self, matriz):
+        """Viabilidade de cada linha de uma matriz 0/1 de soluções"""
+        return (self.usos(matriz) <= self.capacidade).all(axis=1) & (self.excesso_grupos(matriz) == 0)
+
+    def viavel(self, solucao):
+        """Viabilidade de uma única solução (array 0/1 ou SolucaoBits)"""
+        return bool(self.viaveis(np.asarray(solucao)[np.newaxis])[0])
+
+    def estado(self, solucao):
+        """Uso corrente de uma solução, para avaliação de flips por delta"""
+        return EstadoRestricoes(self, solucao)
+
+
+class EstadoRestricoes:
+    """
+    Uso corrente de uma solução - consumo por recurso, itens por grupo e quantas restrições
+    estão violadas - atualizado a cada flip em O(recursos). Um flip é viável se deixa zero
+    restrições violadas; 'sinal' é +1 para adicionar o item e -1 para removê-lo
+    """
+
+    def __init__(self, restricoes, solucao):
+        solucao = np.asarray(solucao)
+        self.restricoes = restricoes
+        # Acesso escalar por flip: listas Python, mais rápidas de indexar que arrays pequenos
+        self._linhas = restricoes.pesos.tolist()
+        self._capacidade = restricoes.capacidade.tolist()
+        self._grupos = restricoes.grupos.tolist() if restricoes.grupos is not None else None
+        
+        self.uso = (solucao @ restricoes.pesos).tolist()
+        self.contagem = []
+        if restricoes.grupos is not None:
+            selecionados = (solucao == 1) & (restricoes.grupos >= 0)
+            self.contagem = np.bincount(restricoes.grupos[selecionados], minlength=restricoes.n_grupos).tolist()
+        
+        self.violacoes = (sum(uso > limite for uso, limite in zip(self.uso, self._capacidade))
+                          + sum(contagem > 1 for contagem in self.contagem))
+
+    def violacoes_apos_flip(self, i, sinal):
+        violacoes = self.violacoes
+        for uso, peso, limite in zip(self.uso, self._linhas[i], self._capacidade):
+            violacoes += (uso + sinal * peso > limite) - (uso > limite)
+        
+        if self._grupos is not None and self._grupos[i] >= 0:
+            contagem = self.contagem[self._grupos[i]]
+            violacoes += (contagem + sinal > 1) - (contagem > 1)
+        return violacoes
+
+    def viavel_apos_flip(self, i, sinal):
+        return self.violacoes_apos_flip(i, sinal) == 0
+
+    def aplicar_flip(self, i, sinal):
+        self.violacoes = self.violacoes_apos_flip(i, sinal)
+        self.uso = [uso + sinal * peso for uso, peso in zip(self.uso, self._linhas[i])]
+        if self._grupos is not None and self._grupos[i] >= 0:
+            self.contagem[self._grupos[i]] += sinal
+
+    def vizinhos_viaveis(self, selecionado):
+        """Viabilidade de todos os vizinhos por flip de 1 item de uma vez (máscara por item)"""
+        restricoes = self.restricoes
+        sinal = np.where(selecionado, -1, 1)
+        uso = np.array(self.uso)
+        
+        # Recursos: o flip do item i só muda a linha i; violações de grupo ficam como estão...
+        excedidos = (uso + sinal[:, np.newaxis] * restricoes.pesos > restricoes.capacidade).sum(axis=1)
+        violacoes = excedidos + (self.violacoes - int((uso > restricoes.capacidade).sum()))
+        
+        # ...exceto no grupo do próprio item
+        if restricoes.grupos is not None:
+            com_grupo = np.flatnonzero(restricoes.grupos >= 0)
+            contagem = np.array(self.contagem, dtype=np.int64)[restricoes.grupos[com_grupo]]
+            violacoes[com_grupo] += (contagem + sinal[com_grupo] > 1).astype(np.int64) - (contagem > 1)
+        
+        return violacoes == 0
@@ -0,0 +1,257 @@
+import hashlib
+import json
+import os
+import random
+import tempfile
+import time
+import zipfile
+
+import numpy as np
+
+from bits import SolucaoBits
+from eventos import FIM
+from itens import ItensArray
+from restricoes import Restricoes
+from HC import HC
+from SA import SA
+from AG import AG
+from PD import PD
+from BB import BB
+
+ALGORITMOS = {
+    'HC': HC.executa_hc,
+    'SA': SA.executa_sa,
+    'AG': AG.executa_ag,
+    'PD': PD.executa_pd,
+    'BB': BB.executa_bb,
+}
+
+# Metaheurísticas: aceitam 'solucao_inicial' (partida a quente pela melhor solução conhecida)
+# e emitem eventos; os exatos (PD, BB) só devolvem o resultado
+METAHEURISTICAS = ('HC', 'SA', 'AG')
+
+# Parâmetros que não mudam o resultado e ficam fora da chave
+FORA_DA_CHAVE = ('observadores', 'mostrar_processo', 'opcoes_historico', 'perfilar', 'rastrear_memoria')
+
+
+def _descrever_parametro(valor):
+    """
+    Forma serializável de um parâmetro na chave. Arrays e soluções entram pelo hash dos
+    seus bytes: o repr do NumPy resume arrays grandes com '...', e soluções iniciais
+    diferentes colidiriam na mesma chave
+    """
+    if isinstance(valor, SolucaoBits):
+        valor = valor.desempacotar()
+    if isinstance(valor, np.ndarray):
+        resumo = hashlib.sha256(np.ascontiguousarray(valor).tobytes()).hexdigest()
+        return {"array": resumo, "dtype": valor.dtype.str, "shape": list(valor.shape)}
+    return repr(valor)
+
+class _ColetorFim:
+    """Observador que guarda só o evento FIM (estatísticas finais: iterações, motivo da parada)"""
+    tipos = {FIM}
+
+    def __init__(self):
+        self.evento = None
+
+    def __call__(self, evento):
+        self.evento = evento
+
+
+class CacheResultados:
+    """
+    Cache persistente de resultados em disco, endereçado pelo conteúdo: a chave é o SHA-256
+    dos arrays da instância (valores, pesos, grupos), da capacidade, do algoritmo, dos
+    parâmetros e da semente. Cada resultado (melhor solução e estatísticas) é um .npz no
+    diretório; a melhor solução já vista de cada instância, de qualquer algoritmo, fica à
+    parte e serve de partida a quente para os demais. O total em disco é limitado a
+    'tamanho_maximo' bytes, descartando primeiro os arquivos usados há mais tempo
+    """
+
+    def __init__(self, diretorio, tamanho_maximo=64 * 2**20):
+        self.diretorio = diretorio
+        self.tamanho_maximo = tamanho_maximo
+        self.acertos = 0
+        self.falhas = 0
+        os.makedirs(diretorio, exist_ok=True)
+
+    @staticmethod
+    def impressao_digital(itens, capacidade):
+        """Hash da instância: mesmo catálogo e mesma capacidade -> mesma impressão digital"""
+        itens = ItensArray.de_itens(itens)
+        resumo = hashlib.sha256(b"mochila-v1")
+        for array in (itens.valores, itens.pesos_dimensoes, np.asarray(capacidade, dtype=np.float64)):
+            resumo.update(str(array.shape).encode())
+            resumo.update(np.ascontiguousarray(array, dtype="<f8").tobytes())
+        if itens.grupos is not None:
+            resumo.update(np.ascontiguousarray(itens.grupos, dtype="<i8").tobytes())
+        return resumo.hexdigest()
+
+    @classmethod
+    def chave(cls, impressao, algoritmo, parametros, semente):
+        """
+        Chave de um resultado: instância + algoritmo + parâmetros que afetam o resultado + semente.
+        Só entram os parâmetros informados: a partida a quente que executar() injeta (a melhor
+        solução conhecida) fica fora da chave, então o resultado guardado é o da primeira
+        execução com esses parâmetros, qualquer que fosse a melhor conhecida naquele momento
+        """
+        relevantes = {nome: valor for nome, valor in parametros.items() if nome not in FORA_DA_CHAVE}
+        descricao = json.dumps([impressao, algoritmo, relevantes, semente], sort_keys=True,
+                               default=_descrever_parametro)
+        return hashlib.sha256(descricao.encode()).hexdigest()
+
+    def executar(self, algoritmo, itens, capacidade_maxima=50, semente=0, aquecer=True, **parametros):
+        """
+        Devolve o resultado guardado para (instância, algoritmo, parâmetros, semente) ou executa
+        o algoritmo com random.seed(semente) e guarda o resultado. Sem semente (None) a execução
+        não é reprodutível: roda sempre, e só alimenta a melhor solução conhecida
+        
+        Args:
+            algoritmo: Uma das chaves de ALGORITMOS
+            itens: Lista de ItemDataclass com nome, valor e peso (ou ItensArray)
+            capacidade_maxima: Capacidade (ou vetor de capacidades) da instância
+            semente: Semente da execução (padrão: 0)
+            aquecer: Se HC, SA e AG partem da melhor solução conhecida da instância quando
+                     'solucao_inicial' não é informada (padrão: True); essa partida não entra
+                     na chave (ver chave())
+            **parametros: Parâmetros repassados ao algoritmo
+        
+        Returns:
+            tuple: (solucao, valor, peso, estatisticas) - estatisticas traz 'do_cache', 'tempo_s',
+                   'iteracoes' e 'motivo_parada' (quando o algoritmo informa)
+        """
+        algoritmo = algoritmo.upper()
+        if algoritmo not in ALGORITMOS:
+            raise ValueError(f"Algoritmo {algoritmo} não suportado no cache de resultados")
+        
+        itens = ItensArray.de_itens(itens)
+        impressao = self.impressao_digital(itens, capacidade_maxima)
+        chave = self.chave(impressao, algoritmo, parametros, semente) if semente is not None else None
+        
+        if chave is not None:
+            guardado = self._ler(self._caminho(chave))
+            if guardado is not None:
+                self.acertos += 1
+                estatisticas = json.loads(str(guardado["estatisticas"]))
+                estatisticas["do_cache"] = True
+                return (self._solucao(guardado), float(guardado["valor"]), float(guardado["peso"]),
+                        estatisticas)
+            self.falhas += 1
+        
+        parametros = dict(parametros)
+        if aquecer and algoritmo in METAHEURISTICAS and parametros.get("solucao_inicial") is None:
+            melhor = self.melhor_conhecida(itens, capacidade_maxima)
+            if melhor is not None:
+                parametros["solucao_inicial"] = melhor[0]
+        
+        coletor = _ColetorFim()
+        if algoritmo in METAHEURISTICAS:
+            parametros["observadores"] = list(parametros.get("observadores") or []) + [coletor]
+        
+        if semente is not None:
+            random.seed(semente)
+        inicio = time.perf_counter()
+        solucao, valor, peso, _ = ALGORITMOS[algoritmo](itens, capacidade_maxima=capacidade_maxima, **parametros)
+        tempo = time.perf_counter() - inicio
+        
+        estatisticas = {"algoritmo": algoritmo, "tempo_s": tempo, "do_cache": False}
+        if coletor.evento is not None:
+            estatisticas["iteracoes"] = int(coletor.evento.iteracao)
+            if "motivo_parada" in (coletor.evento.dados or {}):
+                estatisticas["motivo_parada"] = coletor.evento.dados["motivo_parada"]
+        
+        if solucao is not None:
+            manter = {self._caminho_melhor(impressao)}
+            if chave is not None:
+                self._gravar(self._caminho(chave), solucao, valor, peso,
+                             estatisticas=json.dumps(estatisticas), instancia=impressao)
+                manter.add(self._caminho(chave))
+            self._atualizar_melhor(itens, capacidade_maxima, impressao, solucao, algoritmo)
+            self._descartar_excesso(manter)
+        
+        return solucao, valor, peso, estatisticas
+
+    def melhor_conhecida(self, itens, capacidade):
+        """
+        Melhor solução viável já guardada para a instância, por qualquer algoritmo
+        
+        Returns:
+            tuple: (solucao, valor, algoritmo) ou None
+        """
+        guardado = self._ler(self._caminho_melhor(self.impressao_digital(itens, capacidade)))
+        if guardado is None:
+            return None
+        return self._solucao(guardado), float(guardado["valor"]), str(guardado["algoritmo"])
+
+    def _atualizar_melhor(self, itens, capacidade, impressao, solucao, algoritmo):
+        # Valor real, sem penalização, e só soluções viáveis (o AG pode devolver uma inviável)
+        if not Restricoes(itens, capacidade).viavel(solucao):
+            return
+        valor, peso = itens.avaliar(solucao)
+        atual = self.melhor_conhecida(itens, capacidade)
+        if atual is None or valor > atual[1]:
+            self._gravar(self._caminho_melhor(impressao), solucao, valor, peso, algoritmo=algoritmo)
+
+    def _caminho(self, chave):
+        return os.path.join(self.diretorio, f"{chave}.npz")
+
+    def _caminho_melhor(self, impressao):
+        return os.path.join(self.diretorio, f"melhor-{impressao}.npz")
+
+    @staticmethod
+    def _solucao(guardado):
+        return SolucaoBits(guardado["bits"], int(guardado["n_itens"]))
+
+    def _ler(self, caminho):
+        """Lê uma entrada e a marca como usada agora; ausente ou corrompida conta como falha"""
+        try:
+            with np.load(caminho, allow_pickle=False) as arquivo:
+                guardado = {nome: arquivo[nome] for nome in arquivo.files}
+            os.utime(caminho)
+        except (OSError, ValueError, KeyError, zipfile.BadZipFile):
+            return None
+        return guardado
+
+    def _gravar(self, caminho, solucao, valor, peso, **extras):
+        """Grava uma entrada de forma atômica: arquivo temporário no mesmo diretório + os.replace"""
+        solucao = solucao if isinstance(solucao, SolucaoBits) else SolucaoBits.de_array(np.asarray(solucao))
+        descritor, caminho_temporario = tempfile.mkstemp(dir=self.diretorio, suffix=".tmp")
+        try:
+            with os.fdopen(descritor, "wb") as destino:
+                np.savez(destino, bits=solucao.bits, n_itens=solucao.n_itens, valor=valor,
+                         peso=np.asarray(peso, dtype=np.float64), **extras)
+            os.replace(caminho_temporario, caminho)
+        except BaseException:
+            if os.path.exists(caminho_temporario):
+                os.remove(caminho_temporario)
+            raise
+
+    def _descartar_excesso(self, manter):
+        """
+        Remove as entradas usadas há mais tempo até o diretório caber em tamanho_maximo,
+        poupando as de 'manter' (o resultado recém-gravado e a melhor solução da instância)
+        """
+        entradas = []
+        for nome in os.listdir(self.diretorio):
+            if nome.endswith(".npz"):
+                caminho = os.path.join(self.diretorio, nome)
+                try:
+                    informacao = os.stat(caminho)
+                except FileNotFoundError:
+                    continue
+                entradas.append((informacao.st_mtime_ns, informacao.st_size, caminho))
+        
+        total = sum(tamanho for _, tamanho, _ in entradas)
+        for _, tamanho, caminho in sorted(entradas):
+            if total <= self.tamanho_maximo:
+                break
+            if caminho in manter:
+                continue
+            try:
+                os.remove(caminho)
+            except FileNotFoundError:
+                pass
+            total -= tamanho
+
+    def __repr__(self):
+        return f"CacheResultados({self.diretorio!r}, {self.acertos} acertos, {self.falhas} falhas)"
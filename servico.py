@@ -0,0 +1,345 @@
+import asyncio
+import itertools
+import multiprocessing
+import os
+import queue
+import random
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+from eventos import Evento, MELHORIA, ITERACAO, FIM_CICLO, FIM
+from itens import ItensArray
+from resultados import ALGORITMOS, METAHEURISTICAS
+
+# Eventos repassados como progresso: o SA avisa a cada patamar (FIM_CICLO) e não a cada passo,
+# para não ligar a emissão de ITERACAO no seu laço interno
+TIPOS_PROGRESSO = {
+    'HC': {MELHORIA, ITERACAO, FIM},
+    'SA': {MELHORIA, FIM_CICLO, FIM},
+    'AG': {MELHORIA, ITERACAO, FIM},
+}
+
+# Algoritmos com orçamento de tempo próprio: o prazo vira 'tempo_limite' e a execução termina
+# normalmente, com a melhor solução até ali; nos demais o prazo interrompe a execução
+COM_TEMPO_LIMITE = ('SA', 'AG', 'BB')
+
+
+class _Interrompido(Exception):
+    """Levantada pelo monitor dentro do algoritmo para abandonar a execução"""
+
+
+class _Monitor:
+    """
+    Observador que roda no trabalhador: repassa o progresso ao serviço (melhorias sempre,
+    os demais eventos no máximo a cada 'intervalo' segundos) e interrompe a execução se a
+    tarefa foi cancelada ou se o prazo acabou
+    """
+
+    def __init__(self, id_tarefa, algoritmo, progresso, cancelamentos, limite, intervalo):
+        self.tipos = TIPOS_PROGRESSO[algoritmo]
+        self.id_tarefa = id_tarefa
+        self.progresso = progresso
+        self.cancelamentos = cancelamentos
+        self.limite = limite
+        self.intervalo = intervalo
+        self._proximo_envio = 0.0
+        self._proxima_verificacao = time.time() + intervalo
+        self.ultimo = None
+
+    def __call__(self, evento):
+        agora = time.time()
+        if evento.tipo == FIM:
+            self.ultimo = evento
+        elif evento.tipo == MELHORIA or agora >= self._proximo_envio:
+            self._proximo_envio = agora + self.intervalo
+            # Sem 'dados': o progresso leva só os números, não soluções inteiras
+            self.progresso.put((self.id_tarefa, Evento(evento.tipo, evento.algoritmo, evento.iteracao,
+                                                       evento.fitness, evento.peso, evento.temperatura)))
+        
+        if agora >= self._proxima_verificacao:
+            # Consultar os cancelamentos pode custar uma ida e volta ao Manager: só a cada intervalo
+            self._proxima_verificacao = agora + self.intervalo
+            if self.cancelamentos.get(self.id_tarefa):
+                raise _Interrompido("cancelada")
+        if self.limite is not None and agora >= self.limite:
+            raise _Interrompido("prazo_esgotado")
+
+
+def _resolver(id_tarefa, algoritmo, nomes, valores, pesos, grupos, capacidade, parametros, semente,
+              limite, progresso, cancelamentos, intervalo):
+    """
+    Executa uma tarefa no trabalhador (processo ou thread)
+
+    Returns:
+        tuple: (estado, resultado) - estado 'concluida' com (solucao, valor, peso, estatisticas),
+               ou 'cancelada'/'prazo_esgotado' sem resultado
+    """
+    itens = ItensArray(nomes, valores, pesos, grupos=grupos)
+    # Sem relatório no console: redirecionar o stdout seria global ao processo e não é
+    # seguro com vários trabalhadores em threads
+    parametros = dict(parametros, mostrar_processo=False)
+    if algoritmo in COM_TEMPO_LIMITE and limite is not None:
+        restante = max(0.0, limite - time.time())
+        tempo_limite = parametros.get("tempo_limite")
+        parametros["tempo_limite"] = restante if tempo_limite is None else min(tempo_limite, restante)
+        limite = None
+
+    monitor = None
+    if algoritmo in METAHEURISTICAS:
+        monitor = _Monitor(id_tarefa, algoritmo, progresso, cancelamentos, limite, intervalo)
+        parametros["observadores"] = list(parametros.get("observadores") or []) + [monitor]
+
+    if semente is not None:
+        random.seed(semente)
+    inicio = time.perf_counter()
+    try:
+        solucao, valor, peso, _ = ALGORITMOS[algoritmo](itens, capacidade_maxima=capacidade, **parametros)
+    except _Interrompido as interrupcao:
+        return str(interrupcao), None
+
+    estatisticas = {"algoritmo": algoritmo, "tempo_s": time.perf_counter() - inicio}
+    if monitor is not None and monitor.ultimo is not None:
+        estatisticas["iteracoes"] = int(monitor.ultimo.iteracao)
+        if "motivo_parada" in (monitor.ultimo.dados or {}):
+            estatisticas["motivo_parada"] = monitor.ultimo.dados["motivo_parada"]
+    return "concluida", (solucao, valor, peso, estatisticas)
+
+
+class TarefaOtimizacao:
+    """
+    Uma tarefa submetida ao ServicoOtimizacao. 'estado' passa de 'pendente' a 'executando' e
+    termina em 'concluida', 'cancelada', 'prazo_esgotado' ou 'erro'. O progresso chega como
+    Eventos (eventos.py, sem 'dados') por 'async for evento in tarefa.progresso()'
+    """
+
+    def __init__(self, servico, id_tarefa, algoritmo, itens, capacidade, parametros, semente, limite,
+                 max_progresso):
+        self._servico = servico
+        self.id = id_tarefa
+        self.algoritmo = algoritmo
+        self.itens = itens
+        self.capacidade = capacidade
+        self.parametros = parametros
+        self.semente = semente
+        self.limite = limite
+        self.estado = "pendente"
+        self._futuro = asyncio.get_running_loop().create_future()
+        self._progresso = asyncio.Queue(maxsize=max_progresso)
+
+    async def resultado(self):
+        """
+        Aguarda o fim da tarefa
+        
+        Returns:
+            tuple: (solucao, valor, peso, estatisticas)
+        
+        Raises:
+            asyncio.CancelledError: se a tarefa foi cancelada
+            TimeoutError: se o prazo acabou antes do fim
+        """
+        return await asyncio.shield(self._futuro)
+
+    async def progresso(self):
+        """Eventos de progresso (melhorias, iterações amostradas) até o fim da tarefa"""
+        while True:
+            evento = await self._progresso.get()
+            if evento is None:
+                return
+            yield evento
+
+    def cancelar(self):
+        """Cancela a tarefa: pendente, nunca executa; em execução, é interrompida no próximo evento"""
+        if self.terminada:
+            return False
+        self._servico._cancelar(self)
+        return True
+
+    @property
+    def terminada(self):
+        return self._futuro.done()
+
+    def _publicar(self, evento):
+        # Consumidor lento: descarta o evento mais antigo em vez de crescer sem limite
+        if self._progresso.full():
+            self._progresso.get_nowait()
+        self._progresso.put_nowait(evento)
+
+    def _concluir(self, estado, resultado=None, erro=None):
+        if self._futuro.done():
+            return
+        self.estado = estado
+        if estado == "concluida":
+            self._futuro.set_result(resultado)
+        elif estado == "cancelada":
+            self._futuro.cancel()
+        elif estado == "prazo_esgotado":
+            self._futuro.set_exception(TimeoutError(f"Tarefa {self.id} ({self.algoritmo}): prazo esgotado"))
+        else:
+            self._futuro.set_exception(erro)
+        # Evita o aviso de exceção nunca lida quando ninguém aguarda o resultado
+        if not self._futuro.cancelled():
+            self._futuro.exception()
+        self._publicar(None)
+
+    def __repr__(self):
+        return f"TarefaOtimizacao({self.id}, {self.algoritmo}, {self.estado})"
+
+
+class ServicoOtimizacao:
+    """
+    Serviço assíncrono de otimização para um processo de longa duração: recebe tarefas
+    (itens, capacidade, algoritmo, parâmetros), enfileira e despacha para um pool de
+    trabalhadores sem bloquear o laço de eventos, com cancelamento, prazos e progresso.
+
+    Com processos (padrão), cada tarefa leva seus arrays ao trabalhador; progresso e
+    cancelamentos passam por uma fila e um dicionário de um multiprocessing.Manager. Com
+    threads (usar_processos=False) não há custo de envio, mas os algoritmos disputam o GIL
+    e compartilham o gerador 'random', então a semente não garante reprodutibilidade.
+    PD e BB não emitem eventos: não mandam progresso e só atendem o cancelamento enquanto
+    estão na fila; o prazo do BB vira seu 'tempo_limite', o da PD só vale na fila
+
+    Uso:
+        async with ServicoOtimizacao(n_trabalhadores=4) as servico:
+            tarefa = await servico.submeter("SA", itens, capacidade, semente=1, prazo=2.0)
+            async for evento in tarefa.progresso():
+                ...
+            solucao, valor, peso, estatisticas = await tarefa.resultado()
+    """
+
+    def __init__(self, n_trabalhadores=None, usar_processos=True, intervalo_progresso=0.1, max_progresso=256):
+        self.n_trabalhadores = n_trabalhadores or os.cpu_count() or 1
+        self.usar_processos = usar_processos
+        self.intervalo_progresso = intervalo_progresso
+        self.max_progresso = max_progresso
+        self._ids = itertools.count(1)
+        self._tarefas = {}
+        self._laco = None
+
+    async def iniciar(self):
+        self._laco = asyncio.get_running_loop()
+        if self.usar_processos:
+            self._manager = multiprocessing.Manager()
+            self._progresso_trabalhadores = self._manager.Queue()
+            self._cancelamentos = self._manager.dict()
+            self._executor = ProcessPoolExecutor(max_workers=self.n_trabalhadores)
+        else:
+            self._manager = None
+            self._progresso_trabalhadores = queue.Queue()
+            self._cancelamentos = {}
+            self._executor = ThreadPoolExecutor(max_workers=self.n_trabalhadores)
+        
+        # Uma thread leitora traz o progresso dos trabalhadores para o laço de eventos
+        self._leitor = threading.Thread(target=self._ler_progresso, daemon=True)
+        self._leitor.start()
+        
+        self._fila = asyncio.Queue()
+        self._despachantes = [asyncio.create_task(self._despachar()) for _ in range(self.n_trabalhadores)]
+        return self
+
+    async def encerrar(self, cancelar_pendentes=False):
+        """Encerra o serviço depois das tarefas na fila (ou cancelando-as, se pedido)"""
+        if cancelar_pendentes:
+            for tarefa in list(self._tarefas.values()):
+                tarefa.cancelar()
+        await self._fila.join()
+        for _ in self._despachantes:
+            self._fila.put_nowait(None)
+        await asyncio.gather(*self._despachantes)
+        
+        self._executor.shutdown(wait=True)
+        self._progresso_trabalhadores.put(None)
+        await self._laco.run_in_executor(None, self._leitor.join)
+        if self._manager is not None:
+            self._manager.shutdown()
+
+    async def __aenter__(self):
+        return await self.iniciar()
+
+    async def __aexit__(self, tipo, erro, rastreio):
+        await self.encerrar(cancelar_pendentes=erro is not None)
+
+    async def submeter(self, algoritmo, itens, capacidade_maxima=50, semente=None, prazo=None, **parametros):
+        """
+        Enfileira uma tarefa e a devolve sem esperar pela execução
+        
+        Args:
+            algoritmo: Uma das chaves de ALGORITMOS ('HC', 'SA', 'AG', 'PD', 'BB')
+            itens: Lista de ItemDataclass com nome, valor e peso (ou ItensArray)
+            capacidade_maxima: Capacidade (ou vetor de capacidades) da instância
+            semente: Semente da execução (padrão: None, não reprodutível)
+            prazo: Segundos a partir da submissão, contando o tempo na fila (padrão: None)
+            **parametros: Parâmetros repassados ao algoritmo
+        
+        Returns:
+            TarefaOtimizacao
+        """
+        algoritmo = algoritmo.upper()
+        if algoritmo not in ALGORITMOS:
+            raise ValueError(f"Algoritmo {algoritmo} não suportado no serviço")
+        if self._laco is None:
+            raise RuntimeError("O serviço não foi iniciado")
+        
+        limite = time.time() + prazo if prazo is not None else None
+        tarefa = TarefaOtimizacao(self, next(self._ids), algoritmo, ItensArray.de_itens(itens),
+                                  capacidade_maxima, parametros, semente, limite, self.max_progresso)
+        self._tarefas[tarefa.id] = tarefa
+        await self._fila.put(tarefa)
+        return tarefa
+
+    async def resolver(self, algoritmo, itens, capacidade_maxima=50, semente=None, prazo=None, **parametros):
+        """Submete uma tarefa e aguarda o resultado (solucao, valor, peso, estatisticas)"""
+        tarefa = await self.submeter(algoritmo, itens, capacidade_maxima, semente, prazo, **parametros)
+        return await tarefa.resultado()
+
+    def _cancelar(self, tarefa):
+        if tarefa.estado == "executando":
+            self._cancelamentos[tarefa.id] = True
+        # O resultado fica cancelado na hora; o trabalhador é liberado quando notar o pedido
+        tarefa._concluir("cancelada")
+
+    async def _despachar(self):
+        while True:
+            tarefa = await self._fila.get()
+            try:
+                if tarefa is None:
+                    return
+                await self._executar(tarefa)
+            finally:
+                self._fila.task_done()
+
+    async def _executar(self, tarefa):
+        if tarefa.terminada:
+            self._tarefas.pop(tarefa.id, None)
+            return
+        if tarefa.limite is not None and time.time() >= tarefa.limite:
+            tarefa._concluir("prazo_esgotado")
+            self._tarefas.pop(tarefa.id, None)
+            return
+        
+        tarefa.estado = "executando"
+        itens = tarefa.itens
+        try:
+            estado, resultado = await self._laco.run_in_executor(
+                self._executor, _resolver, tarefa.id, tarefa.algoritmo, itens.nomes, itens.valores,
+                itens.pesos_dimensoes, itens.grupos, tarefa.capacidade, tarefa.parametros, tarefa.semente,
+                tarefa.limite, self._progresso_trabalhadores, self._cancelamentos, self.intervalo_progresso)
+        except Exception as erro:
+            tarefa._concluir("erro", erro=erro)
+        else:
+            tarefa._concluir(estado, resultado)
+        finally:
+            self._cancelamentos.pop(tarefa.id, None)
+            self._tarefas.pop(tarefa.id, None)
+
+    def _ler_progresso(self):
+        while True:
+            mensagem = self._progresso_trabalhadores.get()
+            if mensagem is None:
+                return
+            self._laco.call_soon_threadsafe(self._entregar, *mensagem)
+
+    def _entregar(self, id_tarefa, evento):
+        tarefa = self._tarefas.get(id_tarefa)
+        if tarefa is not None and not tarefa.terminada:
+            tarefa._publicar(evento)
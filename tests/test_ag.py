@@ -0,0 +1,42 @@
+import pytest
+
+from AG import AG
+from conftest import executar_coletando
+from eventos import FIM, ITERACAO
+
+INSTANCIA = {"familia": "nao_correlacionada", "n_itens": 100, "semente": 3}
+
+def executar(instancia, **parametros):
+    _, valor, _, historico, eventos = executar_coletando(AG.executa_ag, instancia, {ITERACAO, FIM}, **parametros)
+    fim = eventos[-1]
+    assert fim.iteracao == len(historico) == sum(evento.tipo == ITERACAO for evento in eventos)
+    return valor, fim, eventos
+
+def test_sem_criterios_roda_todas_as_geracoes(instancia):
+    _, fim, _ = executar(instancia, geracoes=30)
+    assert fim.iteracao == 30
+    assert fim.dados["motivo_parada"] == "geracoes"
+
+def test_estagnacao(instancia):
+    _, fim, eventos = executar(instancia, geracoes=1000, geracoes_sem_melhoria=10)
+    assert fim.dados["motivo_parada"] == "estagnacao"
+    melhores = [evento.fitness for evento in eventos[:-1]]
+    assert max(melhores[-10:]) <= max(melhores[:-10])
+
+def test_diversidade(instancia):
+    _, fim, eventos = executar(instancia, geracoes=1000, diversidade_minima=0.4)
+    assert fim.dados["motivo_parada"] == "diversidade"
+    assert eventos[0].dados["diversidade"] > 0.9
+    assert eventos[-2].dados["diversidade"] < 0.4
+
+def test_valor_alvo_e_tempo_limite(instancia):
+    valor, fim, _ = executar(instancia, geracoes=1000, valor_alvo=35000)
+    assert fim.dados["motivo_parada"] == "valor_alvo" and valor >= 35000
+    _, fim, _ = executar(instancia, geracoes=10**6, tempo_limite=0.02)
+    assert fim.dados["motivo_parada"] == "tempo_limite"
+
+def test_parametros_invalidos(instancia):
+    with pytest.raises(ValueError):
+        AG.executa_ag(*instancia, geracoes_sem_melhoria=0)
+    with pytest.raises(ValueError):
+        AG.executa_ag_ilhas(instancia[0], capacidade_maxima=instancia[1], valor_alvo=1)
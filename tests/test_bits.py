@@ -0,0 +1,92 @@
+import numpy as np
+import pytest
+
+from bits import (SolucaoBits, contar_bits, desempacotar, empacotar, inverter_posicoes,
+                  mascaras_prefixo)
+
+TAMANHOS = [1, 7, 8, 9, 63, 64, 65]
+
+@pytest.mark.parametrize("n_itens", TAMANHOS)
+def test_empacotar_e_desempacotar_ida_e_volta(n_itens):
+    rng = np.random.default_rng(n_itens)
+    solucao = rng.integers(0, 2, n_itens, dtype=np.uint8)
+    
+    bits = SolucaoBits.de_array(solucao)
+    assert len(bits) == n_itens
+    assert np.array_equal(bits.desempacotar(), solucao)
+    assert np.array_equal(np.asarray(bits), solucao)
+    assert bits.contar() == solucao.sum()
+    assert np.array_equal(bits.indices(), np.flatnonzero(solucao))
+    assert [bits[i] for i in range(n_itens)] == solucao.tolist()
+    assert bits[-1] == solucao[-1]
+
+def test_indice_fora_da_solucao():
+    bits = SolucaoBits.zeros(10)
+    with pytest.raises(IndexError):
+        bits[10]
+    with pytest.raises(IndexError):
+        bits[-11]
+
+@pytest.mark.parametrize("n_itens", TAMANHOS)
+def test_inverter_nao_toca_preenchimento(n_itens):
+    bits = SolucaoBits.zeros(n_itens)
+    for i in range(n_itens):
+        bits.inverter(i)
+    assert bits.contar() == n_itens
+    assert np.array_equal(bits.bits, np.packbits(np.ones(n_itens, dtype=np.uint8)))
+    
+    bits.inverter(0)
+    assert bits[0] == 0 and bits.contar() == n_itens - 1
+
+def test_igualdade_hash_e_copia():
+    a = SolucaoBits.de_array([1, 0, 1, 1, 0, 0, 1, 0, 1])
+    b = a.copy()
+    assert a == b and hash(a) == hash(b)
+    
+    b.inverter(3)
+    assert a != b
+    assert a[3] == 1
+    assert SolucaoBits.de_array([0] * 8) != SolucaoBits.de_array([0] * 9)
+
+@pytest.mark.parametrize("n_itens", TAMANHOS)
+def test_mascaras_prefixo_igual_referencia(n_itens):
+    pontos_corte = np.arange(n_itens + 1)
+    mascaras = mascaras_prefixo(pontos_corte, n_itens)
+    
+    referencia = np.packbits(np.arange(n_itens)[None, :] < pontos_corte[:, None], axis=1)
+    assert mascaras.dtype == np.uint8
+    assert np.array_equal(mascaras, referencia)
+
+@pytest.mark.parametrize("n_itens", TAMANHOS)
+def test_cruzar_igual_crossover_de_um_ponto(n_itens):
+    rng = np.random.default_rng(100 + n_itens)
+    pai1 = rng.integers(0, 2, n_itens, dtype=np.uint8)
+    pai2 = rng.integers(0, 2, n_itens, dtype=np.uint8)
+    
+    for ponto_corte in range(n_itens + 1):
+        mascara = SolucaoBits(mascaras_prefixo([ponto_corte], n_itens)[0], n_itens)
+        filho = SolucaoBits.de_array(pai1).cruzar(SolucaoBits.de_array(pai2), mascara)
+        esperado = np.concatenate((pai1[:ponto_corte], pai2[ponto_corte:]))
+        assert np.array_equal(filho.desempacotar(), esperado)
+
+@pytest.mark.parametrize("n_itens", TAMANHOS)
+def test_funcoes_de_matriz(n_itens):
+    rng = np.random.default_rng(200 + n_itens)
+    matriz = rng.integers(0, 2, (6, n_itens), dtype=np.uint8)
+    
+    empacotada = empacotar(matriz)
+    assert np.array_equal(desempacotar(empacotada, n_itens), matriz)
+    assert np.array_equal(contar_bits(empacotada), matriz.sum(axis=1))
+
+@pytest.mark.parametrize("n_itens", TAMANHOS)
+def test_inverter_posicoes_igual_referencia(n_itens):
+    rng = np.random.default_rng(300 + n_itens)
+    matriz = rng.integers(0, 2, (5, n_itens), dtype=np.uint8)
+    posicoes = np.sort(rng.choice(matriz.size, size=min(matriz.size, 12), replace=False))
+    
+    empacotada = inverter_posicoes(empacotar(matriz), posicoes, n_itens)
+    
+    esperada = matriz.reshape(-1).copy()
+    esperada[posicoes] ^= 1
+    assert np.array_equal(desempacotar(empacotada, n_itens), esperada.reshape(matriz.shape))
+    assert np.array_equal(empacotada, empacotar(esperada.reshape(matriz.shape)))
@@ -0,0 +1,42 @@
+import random
+
+import numpy as np
+
+from AG import AG
+from benchmark import Benchmark
+from cache import CacheFitness
+
+def test_lru_descarta_o_menos_usado():
+    cache = CacheFitness(tamanho_maximo=2)
+    cache.guardar(b"a", (1.0, 1.0))
+    cache.guardar(b"b", (2.0, 2.0))
+    assert cache.obter(b"a") == (1.0, 1.0)  # "a" passa a ser o mais recente
+    cache.guardar(b"c", (3.0, 3.0))
+    
+    assert len(cache) == 2
+    assert cache.obter(b"b") is None
+    assert cache.obter(b"a") == (1.0, 1.0) and cache.obter(b"c") == (3.0, 3.0)
+    assert (cache.acertos, cache.falhas) == (3, 1)
+
+def test_chaves_distinguem_linhas():
+    populacao = np.array([[0b10100000], [0b10100000], [0b00000001]], dtype=np.uint8)
+    chaves = CacheFitness.chaves(populacao)
+    assert chaves[0] == chaves[1] != chaves[2]
+
+def test_contadores_do_ag_somam_as_avaliacoes():
+    itens, capacidade = Benchmark.gerar_instancia("fracamente_correlacionada", 40, semente=6)
+    random.seed(1)
+    _, valor, _, historico = AG.executa_ag(itens, capacidade_maxima=capacidade, pop_size=30, geracoes=25)
+    
+    # Uma consulta ao cache por indivíduo por geração; só as falhas são calculadas
+    for geracao, acertos, falhas in historico.como_array()[:, [0, 5, 6]]:
+        assert acertos + falhas == 30 * (geracao + 1)
+    assert historico.estatisticas.avaliacoes == int(historico[-1][6])
+    assert historico[-1][5] > 0
+    
+    # O cache não muda o resultado, só poupa avaliações
+    random.seed(1)
+    _, valor_sem_cache, _, historico_sem_cache = AG.executa_ag(itens, capacidade_maxima=capacidade, pop_size=30,
+                                                               geracoes=25, tamanho_cache=0)
+    assert valor_sem_cache == valor
+    assert historico_sem_cache.estatisticas.avaliacoes == 30 * 25
@@ -0,0 +1,45 @@
+import numpy as np
+import pytest
+
+from carregador import CarregadorItens
+from itens import calcular_ratios
+
+def escrever_csv(caminho, valores, pesos):
+    with open(caminho, "w", encoding="utf-8") as arquivo:
+        arquivo.write("nome,valor,peso\n")
+        for i, (valor, peso) in enumerate(zip(valores, pesos)):
+            arquivo.write(f"Item {i},{valor},{peso}\n")
+
+def test_csv_em_blocos_ida_e_volta(tmp_path):
+    rng = np.random.default_rng(0)
+    valores = rng.integers(1, 100, 1050).astype(float)
+    pesos = rng.integers(0, 50, 1050).astype(float)
+    caminho_csv, caminho_binario = str(tmp_path / "itens.csv"), str(tmp_path / "itens.bin")
+    escrever_csv(caminho_csv, valores, pesos)
+    
+    # Blocos bem menores que o arquivo, com um bloco final incompleto
+    assert CarregadorItens.converter_csv(caminho_csv, caminho_binario, tamanho_bloco=100) == 1050
+    itens = CarregadorItens.abrir_binario(caminho_binario)
+    
+    assert itens.mapeado_em_memoria
+    assert np.array_equal(itens.valores, valores) and np.array_equal(itens.pesos, pesos)
+    assert np.array_equal(itens.ratios, calcular_ratios(valores, pesos))
+    assert not list(tmp_path.glob("*.tmp"))
+
+def test_csv_sem_itens(tmp_path):
+    caminho_csv, caminho_binario = str(tmp_path / "vazio.csv"), str(tmp_path / "vazio.bin")
+    escrever_csv(caminho_csv, [], [])
+    
+    assert CarregadorItens.converter_csv(caminho_csv, caminho_binario) == 0
+    assert len(CarregadorItens.abrir_binario(caminho_binario)) == 0
+
+def test_binario_com_assinatura_invalida(tmp_path):
+    caminho = tmp_path / "outro.bin"
+    caminho.write_bytes(b"NAOEMOCH" + bytes(56))
+    with pytest.raises(ValueError):
+        CarregadorItens.abrir_binario(str(caminho))
+    
+    # Arquivo menor que o cabeçalho
+    caminho.write_bytes(b"MOCHILA")
+    with pytest.raises(ValueError):
+        CarregadorItens.abrir_binario(str(caminho))
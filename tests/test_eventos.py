@@ -0,0 +1,62 @@
+import random
+
+import pytest
+
+from conftest import Coletor
+from eventos import FIM, INICIO, ITERACAO, MELHORIA, Emissor, RelatorioConsole
+from itens import ItensPreDefinidos
+from HC import HC
+from SA import SA
+from AG import AG
+
+EXECUTAR = {
+    "HC": lambda itens, **kw: HC.executa_hc(itens, **kw),
+    "SA": lambda itens, **kw: SA.executa_sa(itens, **kw),
+    "AG": lambda itens, **kw: AG.executa_ag(itens, geracoes=30, **kw),
+}
+
+@pytest.mark.parametrize("algoritmo", list(EXECUTAR))
+def test_sem_observadores_nao_imprime(algoritmo, capsys):
+    random.seed(1)
+    EXECUTAR[algoritmo](ItensPreDefinidos.obter_itens_array())
+    assert capsys.readouterr().out == ""
+
+@pytest.mark.parametrize("algoritmo", list(EXECUTAR))
+def test_observador_recebe_inicio_iteracoes_e_fim(algoritmo):
+    eventos = []
+    random.seed(1)
+    solucao, valor, peso, _ = EXECUTAR[algoritmo](ItensPreDefinidos.obter_itens_array(),
+                                                  observadores=[eventos.append])
+    
+    assert eventos[0].tipo == INICIO and eventos[-1].tipo == FIM
+    assert all(evento.algoritmo == algoritmo for evento in eventos)
+    assert any(evento.tipo == ITERACAO for evento in eventos)
+    
+    fim = eventos[-1]
+    assert fim.fitness == valor and fim.peso == peso
+    assert fim.dados["solucao"] == solucao
+
+def test_observador_com_tipos_recebe_so_os_seus():
+    melhorias = Coletor({MELHORIA})
+    # Semente em que a solução inicial não é a melhor: a execução tem melhorias a relatar
+    random.seed(0)
+    _, valor, _, _ = SA.executa_sa(ItensPreDefinidos.obter_itens_array(), observadores=[melhorias])
+    
+    assert melhorias and all(evento.tipo == MELHORIA for evento in melhorias)
+    assert melhorias[-1].fitness == valor
+
+def test_emissor_sem_interessados_nao_monta_evento():
+    emissor = Emissor("HC", [RelatorioConsole(detalhado=False)])
+    assert emissor.escuta(FIM)
+    assert not emissor.escuta(ITERACAO)
+    assert not Emissor("HC").escuta(FIM)
+
+def test_relatorio_resumido_do_hc(capsys):
+    random.seed(3)
+    _, valor, _, _ = HC.executa_hc(ItensPreDefinidos.obter_itens_array(),
+                                   observadores=[RelatorioConsole(detalhado=False)])
+    saida = capsys.readouterr().out
+    
+    assert "HILL CLIMBING" in saida
+    assert f"Melhor valor encontrado: R$ {valor:.2f}" in saida
+    assert "Item  0:" not in saida
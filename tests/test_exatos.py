@@ -0,0 +1,89 @@
+import itertools
+
+import numpy as np
+import pytest
+
+from itens import ItensArray
+from PD import PD
+from BB import BB
+
+def forca_bruta(valores, pesos, capacidade):
+    """Valor ótimo por enumeração de todos os subconjuntos"""
+    melhor = 0.0
+    for escolha in itertools.product((0, 1), repeat=len(valores)):
+        escolha = np.array(escolha)
+        if pesos @ escolha <= capacidade:
+            melhor = max(melhor, float(valores @ escolha))
+    return melhor
+
+def instancias_aleatorias(semente, quantidade=60, max_itens=11):
+    """Instâncias pequenas com valores e pesos inteiros, incluindo zeros"""
+    rng = np.random.default_rng(semente)
+    for _ in range(quantidade):
+        n_itens = int(rng.integers(1, max_itens + 1))
+        valores = rng.integers(0, 30, n_itens).astype(float)
+        pesos = rng.integers(0, 25, n_itens).astype(float)
+        capacidade = int(rng.integers(0, 60))
+        yield ItensArray(None, valores, pesos), capacidade
+
+def verificar_solucao(itens, capacidade, solucao, valor, peso):
+    valor_real, peso_real = itens.avaliar(solucao)
+    assert valor_real == pytest.approx(valor)
+    assert peso_real == pytest.approx(peso)
+    assert peso_real <= capacidade
+
+@pytest.mark.parametrize("limite_tabela", [1, 8, 1 << 20])
+def test_pd_hirschberg_igual_forca_bruta(limite_tabela):
+    # limite_tabela pequeno força a divisão de Hirschberg até subproblemas de um item
+    for itens, capacidade in instancias_aleatorias(1):
+        solucao, valor, peso, _ = PD.executa_pd(itens, capacidade, limite_tabela=limite_tabela)
+        assert valor == pytest.approx(forca_bruta(itens.valores, itens.pesos, capacidade))
+        verificar_solucao(itens, capacidade, solucao, valor, peso)
+
+def test_pd_modo_valor_igual_forca_bruta():
+    for itens, capacidade in instancias_aleatorias(2):
+        solucao, valor, peso, _ = PD.executa_pd(itens, capacidade, modo="valor")
+        assert solucao is None
+        assert valor == pytest.approx(forca_bruta(itens.valores, itens.pesos, capacidade))
+        assert peso <= capacidade
+
+@pytest.mark.parametrize("modo", ["valor", "hirschberg"])
+def test_pd_capacidade_zero_leva_itens_sem_peso(modo):
+    itens = ItensArray(None, [3.0, 4.0, 5.0, 0.0], [0.0, 2.0, 0.0, 0.0])
+    solucao, valor, peso, _ = PD.executa_pd(itens, 0, modo=modo, limite_tabela=1)
+    assert valor == 8.0
+    assert peso == 0.0
+    if solucao is not None:
+        verificar_solucao(itens, 0, solucao, valor, peso)
+
+def test_pd_rejeita_pesos_fracionarios():
+    with pytest.raises(ValueError):
+        PD.executa_pd(ItensArray(None, [1.0, 2.0], [1.5, 2.0]), 3)
+
+@pytest.mark.parametrize("ordem_nos", ["profundidade", "melhor"])
+def test_bb_igual_forca_bruta(ordem_nos):
+    for itens, capacidade in instancias_aleatorias(3):
+        solucao, valor, peso, historico = BB.executa_bb(itens, capacidade, ordem_nos=ordem_nos)
+        assert valor == pytest.approx(forca_bruta(itens.valores, itens.pesos, capacidade))
+        verificar_solucao(itens, capacidade, solucao, valor, peso)
+        # Sem orçamento a busca termina provando a otimalidade
+        assert historico[-1][3] == pytest.approx(valor)
+
+@pytest.mark.parametrize("ordem_nos", ["profundidade", "melhor"])
+def test_bb_capacidade_zero_leva_itens_sem_peso(ordem_nos):
+    itens = ItensArray(None, [3.0, 4.0, 5.0, 0.0], [0.0, 2.0, 0.0, 0.0])
+    solucao, valor, peso, _ = BB.executa_bb(itens, 0, ordem_nos=ordem_nos)
+    assert valor == 8.0
+    verificar_solucao(itens, 0, solucao, valor, peso)
+
+def test_bb_orcamento_de_nos_mantem_limitante_valido():
+    rng = np.random.default_rng(4)
+    valores = rng.integers(100, 200, 60).astype(float)
+    pesos = valores + rng.integers(-10, 10, 60)
+    itens = ItensArray(None, valores, pesos)
+    capacidade = float(pesos.sum() // 2)
+    
+    solucao, valor, peso, historico = BB.executa_bb(itens, capacidade, max_nos=5)
+    verificar_solucao(itens, capacidade, solucao, valor, peso)
+    _, otimo, _, _ = PD.executa_pd(itens, capacidade, modo="valor")
+    assert valor <= otimo <= historico[-1][3] + 1e-9
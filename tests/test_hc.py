@@ -0,0 +1,60 @@
+import random
+
+import numpy as np
+import pytest
+
+from benchmark import Benchmark
+from HC import HC
+from itens import ItensArray
+from PD import PD
+
+def instancias_pequenas(semente, quantidade=40, max_itens=12):
+    """Instâncias pequenas com valores e pesos inteiros (somas exatas em float)"""
+    rng = np.random.default_rng(semente)
+    for _ in range(quantidade):
+        n_itens = int(rng.integers(1, max_itens + 1))
+        valores = rng.integers(1, 30, n_itens).astype(float)
+        pesos = rng.integers(1, 25, n_itens).astype(float)
+        yield ItensArray(None, valores, pesos), int(rng.integers(1, 60))
+
+def melhor_flip(itens, capacidade, solucao):
+    """Maior fitness entre os vizinhos por flip de 1 item, avaliados do zero"""
+    melhor = 0.0
+    for i in range(len(itens)):
+        vizinho = np.asarray(solucao).copy()
+        vizinho[i] ^= 1
+        valor, peso = itens.avaliar(vizinho)
+        melhor = max(melhor, valor if peso <= capacidade else 0.0)
+    return melhor
+
+@pytest.mark.parametrize("modo_busca", ["melhor", "primeira"])
+def test_hc_para_em_otimo_local_com_totais_corretos(modo_busca):
+    random.seed(4)
+    for itens, capacidade in instancias_pequenas(1):
+        solucao, valor, peso, historico = HC.executa_hc(itens, capacidade_maxima=capacidade, modo_busca=modo_busca)
+        _, otimo, _, _ = PD.executa_pd(itens, capacidade_maxima=capacidade)
+        
+        # Os totais mantidos por delta ao longo da busca batem com a avaliação do zero
+        assert itens.avaliar(solucao) == (valor, peso)
+        assert historico[-1][1:] == (valor, peso)
+        assert peso <= capacidade and valor <= otimo
+        # Estagnação: nenhum flip melhora a solução devolvida
+        assert melhor_flip(itens, capacidade, solucao) <= valor
+
+@pytest.mark.parametrize("modo_busca", ["melhor", "primeira"])
+def test_hc_com_reinicios_chega_ao_otimo(modo_busca):
+    random.seed(5)
+    for itens, capacidade in instancias_pequenas(2, quantidade=15, max_itens=8):
+        _, otimo, _, _ = PD.executa_pd(itens, capacidade_maxima=capacidade)
+        melhor = max(HC.executa_hc(itens, capacidade_maxima=capacidade, modo_busca=modo_busca)[1]
+                     for _ in range(30))
+        assert melhor == otimo
+
+def test_modos_concordam_na_partida_sem_melhoria():
+    itens, capacidade = Benchmark.gerar_instancia("nao_correlacionada", 60, semente=7)
+    solucao, valor, _, _ = HC.executa_hc(itens, capacidade_maxima=capacidade)
+    # Partindo de um ótimo local, nenhum dos modos se move
+    for modo_busca in ("melhor", "primeira"):
+        _, valor_modo, _, historico = HC.executa_hc(itens, capacidade_maxima=capacidade, modo_busca=modo_busca,
+                                                    solucao_inicial=solucao)
+        assert valor_modo == valor and len(historico) == 1
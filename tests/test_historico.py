@@ -0,0 +1,104 @@
+import random
+
+import numpy as np
+import pytest
+
+from historico import Historico
+from itens import ItensPreDefinidos
+from SA import SA
+
+CAMPOS = ("iteracao", "fitness", "peso")
+
+def estados(quantidade, semente=0):
+    rng = np.random.default_rng(semente)
+    fitness = rng.integers(0, 100, quantidade)
+    return [(i, float(fitness[i]), float(i % 7)) for i in range(quantidade)]
+
+def test_sem_dizimacao_guarda_tudo_como_tuplas():
+    historico = Historico(CAMPOS, capacidade_inicial=4)
+    linhas = estados(50)
+    for linha in linhas:
+        historico.registrar(*linha)
+    historico.finalizar()
+    
+    assert len(historico) == 50
+    assert list(historico) == [tuple(map(float, linha)) for linha in linhas]
+    assert historico[-1] == tuple(map(float, linhas[-1]))
+    assert historico[1:3] == [tuple(map(float, linha)) for linha in linhas[1:3]]
+    assert np.array_equal(historico.coluna("fitness"), [linha[1] for linha in linhas])
+    with pytest.raises(IndexError):
+        historico[50]
+
+def test_intervalo_guarda_um_a_cada_k_e_o_ultimo():
+    historico = Historico(CAMPOS, intervalo=10)
+    for linha in estados(95):
+        historico.registrar(*linha)
+    historico.finalizar()
+    
+    assert historico.coluna("iteracao").tolist() == list(range(0, 95, 10)) + [94]
+
+def test_apenas_melhorias_guarda_recordes():
+    historico = Historico(CAMPOS, apenas_melhorias=True)
+    linhas = estados(200, semente=3)
+    for linha in linhas:
+        historico.registrar(*linha)
+    historico.finalizar()
+    
+    fitness = historico.coluna("fitness")
+    assert np.all(np.diff(fitness[:-1]) > 0)
+    assert fitness[-2] == max(linha[1] for linha in linhas)
+    assert historico[-1][0] == 199
+
+@pytest.mark.parametrize("opcoes", [{}, {"intervalo": 7}, {"apenas_melhorias": True}])
+def test_registrar_lote_igual_a_registrar(opcoes):
+    linhas = estados(500, semente=5)
+    individual = Historico(CAMPOS, **opcoes)
+    for linha in linhas:
+        individual.registrar(*linha)
+    
+    em_lote = Historico(CAMPOS, **opcoes)
+    rng = np.random.default_rng(6)
+    inicio = 0
+    while inicio < len(linhas):
+        fim = inicio + int(rng.integers(1, 40))
+        em_lote.registrar_lote(linhas[inicio:fim])
+        inicio = fim
+    
+    assert np.array_equal(individual.finalizar().como_array(), em_lote.finalizar().como_array())
+
+def test_limite_mantem_memoria_constante():
+    historico = Historico(CAMPOS, limite=64, capacidade_inicial=16)
+    for linha in estados(100000):
+        historico.registrar(*linha)
+    historico.finalizar()
+    
+    assert len(historico) <= 65
+    assert historico[0][0] == 0 and historico[-1][0] == 99999
+    assert np.all(np.diff(historico.coluna("iteracao")) > 0)
+
+def test_arquivo_descarrega_em_disco(tmp_path):
+    caminho = str(tmp_path / "historico.bin")
+    historico = Historico(CAMPOS, arquivo=caminho, capacidade_inicial=32)
+    linhas = estados(1000)
+    historico.registrar_lote(linhas[:500])
+    for linha in linhas[500:]:
+        historico.registrar(*linha)
+    
+    assert historico._dados.shape[0] == 32
+    historico.finalizar()
+    
+    assert len(historico) == 1000
+    assert historico[0] == tuple(map(float, linhas[0]))
+    assert historico[777] == tuple(map(float, linhas[777]))
+    assert np.array_equal(np.fromfile(caminho).reshape(-1, 3), historico.como_array())
+
+def test_sa_com_historico_dizimado():
+    random.seed(4)
+    itens = ItensPreDefinidos.obter_itens_array()
+    _, valor, _, completo = SA.executa_sa(itens)
+    random.seed(4)
+    _, valor_dizimado, _, dizimado = SA.executa_sa(itens, opcoes_historico={"intervalo": 100})
+    
+    assert valor == valor_dizimado
+    assert len(dizimado) == (len(completo) - 1) // 100 + 2
+    assert dizimado[-1] == completo[-1]
@@ -0,0 +1,61 @@
+import random
+
+from AG import AG
+from HC import HC
+from SA import SA
+
+INSTANCIA = {"familia": "fracamente_correlacionada", "n_itens": 80, "semente": 4}
+
+def test_hc_conta_vizinhos_avaliados(instancia):
+    itens, capacidade = instancia
+    random.seed(1)
+    _, _, _, historico = HC.executa_hc(itens, capacidade_maxima=capacidade)
+    estatisticas = historico.estatisticas
+    
+    movimentos = int(historico[-1][0])
+    # Modo "melhor": a vizinhança inteira a cada iteração, mais a que não tem melhoria
+    assert estatisticas.avaliacoes == 1 + (movimentos + 1) * len(itens)
+    assert estatisticas.contadores["aceitos"] == movimentos
+    assert 0 < estatisticas.taxa_aceitacao < 1
+    
+    random.seed(1)
+    _, _, _, historico = HC.executa_hc(itens, capacidade_maxima=capacidade, modo_busca="primeira")
+    assert historico.estatisticas.avaliacoes < 1 + (int(historico[-1][0]) + 1) * len(itens)
+
+def test_sa_taxa_de_aceitacao_e_fases(instancia):
+    itens, capacidade = instancia
+    random.seed(2)
+    _, _, _, historico = SA.executa_sa(itens, capacidade_maxima=capacidade, T0="auto")
+    estatisticas = historico.estatisticas
+    
+    passos = int(historico[-1][0])
+    # Os 200 vizinhos amostrados na calibração de T0 também contam
+    assert estatisticas.avaliacoes == 1 + passos + 200
+    assert 0 < estatisticas.taxa_aceitacao <= 1
+    assert set(estatisticas.fases) == {"inicializacao", "busca"}
+    assert sum(estatisticas.fases.values()) <= estatisticas.tempo_total
+    assert estatisticas.avaliacoes_por_s > 0
+
+def test_ag_avaliacoes_sao_as_falhas_do_cache(instancia):
+    itens, capacidade = instancia
+    random.seed(3)
+    eventos = []
+    _, _, _, historico = AG.executa_ag(itens, capacidade_maxima=capacidade, geracoes=30,
+                                       observadores=[eventos.append])
+    estatisticas = historico.estatisticas
+    
+    assert estatisticas.avaliacoes == int(historico[-1][6])
+    assert estatisticas.taxa_aceitacao is None
+    assert {"avaliacao", "selecao", "cruzamento", "mutacao"} <= set(estatisticas.fases)
+    assert eventos[-1].dados["estatisticas"] is estatisticas
+    assert estatisticas.como_dict()["tempo_avaliacao_s"] == estatisticas.fases["avaliacao"]
+
+def test_perfil_e_memoria_so_quando_pedidos(instancia):
+    itens, capacidade = instancia
+    _, _, _, historico = SA.executa_sa(itens, capacidade_maxima=capacidade)
+    assert historico.estatisticas.perfil is None and historico.estatisticas.pico_memoria is None
+    
+    _, _, _, historico = SA.executa_sa(itens, capacidade_maxima=capacidade, perfilar=True, rastrear_memoria=True)
+    estatisticas = historico.estatisticas
+    assert estatisticas.pico_memoria > 0
+    assert "sortear_flip" in estatisticas.relatorio_perfil()
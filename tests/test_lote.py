@@ -0,0 +1,63 @@
+import random
+
+import numpy as np
+import pytest
+
+from benchmark import Benchmark
+from HC import HC
+from itens import ItemDataclass, ItensPreDefinidos
+from lote import InstanciasLote
+from PD import PD
+from reparo import Reparador
+from SA import SA
+
+@pytest.fixture(scope="module")
+def instancias():
+    # Tamanhos variados: o lote completa as menores com itens fantasma
+    tamanhos = [15, 40, 23, 80, 15, 61]
+    return ([Benchmark.gerar_instancia("fracamente_correlacionada", n, semente=s) for s, n in enumerate(tamanhos)]
+            + [(ItensPreDefinidos.obter_itens_array(), 50)])
+
+def test_reparo_em_lote_igual_ao_reparador(instancias):
+    lote = InstanciasLote(instancias)
+    populacao = lote.aleatorias(np.random.default_rng(2))
+    reparada = lote.reparar(populacao)
+    
+    for linha, (itens, capacidade) in enumerate(instancias):
+        n = len(itens)
+        esperado = Reparador(itens, capacidade).reparar(populacao[linha:linha + 1, :n])[0]
+        assert np.array_equal(reparada[linha, :n], esperado)
+        assert not reparada[linha, n:].any()
+
+def test_hc_em_lote_igual_ao_hc_por_instancia(instancias):
+    rng = np.random.default_rng(5)
+    iniciais = [rng.integers(0, 2, len(itens), dtype=np.uint8) for itens, _ in instancias]
+    
+    resultados = HC.executa_hc_lote(instancias, solucoes_iniciais=iniciais)
+    for (itens, capacidade), inicial, (solucao, valor, peso, _) in zip(instancias, iniciais, resultados):
+        esperado, valor_esperado, peso_esperado, _ = HC.executa_hc(itens, capacidade_maxima=capacidade,
+                                                                   solucao_inicial=inicial)
+        assert (valor, peso) == (valor_esperado, peso_esperado)
+        assert np.array_equal(np.asarray(solucao), np.asarray(esperado))
+
+def test_sa_em_lote_viavel_e_proximo_do_otimo(instancias):
+    random.seed(3)
+    resultados = SA.executa_sa_lote(instancias, T0=1000.0, passos_por_T=100)
+    random.seed(3)
+    assert [valor for _, valor, _, _ in SA.executa_sa_lote(instancias, T0=1000.0, passos_por_T=100)] == \
+           [valor for _, valor, _, _ in resultados]
+    
+    for (itens, capacidade), (solucao, valor, peso, aceitos) in zip(instancias, resultados):
+        assert len(solucao) == len(itens)
+        assert itens.avaliar(solucao) == (valor, peso)
+        assert peso <= capacidade and aceitos > 0
+        _, otimo, _, _ = PD.executa_pd(itens, capacidade_maxima=capacidade)
+        # A mesma qualidade do SA por instância, que fica em torno de 95% do ótimo aqui
+        assert valor >= 0.9 * otimo
+
+def test_lote_rejeita_instancias_nao_simples():
+    itens = [ItemDataclass("A", 10, 2, pesos_extras=(1,)), ItemDataclass("B", 5, 1, pesos_extras=(3,))]
+    with pytest.raises(ValueError):
+        SA.executa_sa_lote([(itens, [3, 3])])
+    with pytest.raises(ValueError):
+        HC.executa_hc_lote([(ItensPreDefinidos.obter_itens_array(), 50)], solucoes_iniciais=[[1, 0]])
@@ -0,0 +1,59 @@
+import random
+
+import numpy as np
+import pytest
+
+from benchmark import Benchmark, FAMILIAS
+from itens import ItemDataclass
+from PD import PD
+from reducao import Reducao
+
+# O BB fica nas famílias em que a redução deixa um núcleo pequeno; nas correlacionadas
+# nada é fixado e a árvore do BB explode, então só a PD as cobre
+@pytest.mark.parametrize("familia, algoritmo", [(familia, "PD") for familia in FAMILIAS]
+                         + [("nao_correlacionada", "BB"), ("fracamente_correlacionada", "BB")])
+def test_reducao_exata_preserva_o_otimo(familia, algoritmo):
+    itens, capacidade = Benchmark.gerar_instancia(familia, 300, semente=2, amplitude=300)
+    _, otimo, _, _ = PD.executa_pd(itens, capacidade_maxima=capacidade)
+    
+    solucao, valor, peso, reducao = Reducao.executa(algoritmo, itens, capacidade)
+    assert reducao.exata
+    assert valor == otimo
+    assert len(solucao) == len(itens) and itens.avaliar(solucao) == (valor, peso) and peso <= capacidade
+
+def test_fixacao_e_mapeamento():
+    itens, capacidade = Benchmark.gerar_instancia("nao_correlacionada", 2000, semente=1)
+    reducao = Reducao(itens, capacidade)
+    
+    # Catálogo grande não correlacionado: sobra só um núcleo pequeno em torno da quebra
+    assert len(reducao.livres) < 0.1 * len(itens)
+    assert len(reducao.livres) + len(reducao.fixados_dentro) + len(reducao.fixados_fora) == len(itens)
+    assert reducao.limite_inferior <= reducao.limite_superior
+    
+    reduzida = np.random.default_rng(0).integers(0, 2, len(reducao.livres), dtype=np.uint8)
+    completa = reducao.expandir(reduzida)
+    assert np.array_equal(reducao.reduzir(completa), reduzida)
+    assert completa[reducao.fixados_dentro].all() and not completa[reducao.fixados_fora].any()
+    valor, peso = itens.avaliar(completa)
+    assert valor == reducao.valor_fixado + reducao.itens_reduzidos.avaliar(reduzida)[0]
+
+def test_dominancia_trivial():
+    itens = [ItemDataclass("Grande", 100, 60), ItemDataclass("Sem valor", 0, 1),
+             ItemDataclass("Grátis", 5, 0), ItemDataclass("A", 10, 30), ItemDataclass("B", 9, 25)]
+    reducao = Reducao(itens, 50)
+    assert reducao.fixacao[:3].tolist() == [0, 0, 1]
+
+def test_nucleo_heuristico_com_metaheuristica():
+    itens, capacidade = Benchmark.gerar_instancia("fortemente_correlacionada", 500, semente=3)
+    random.seed(0)
+    solucao, valor, peso, reducao = Reducao.executa("SA", itens, capacidade, tamanho_nucleo=40)
+    
+    assert not reducao.exata and len(reducao.livres) == 40
+    assert len(solucao) == len(itens) and peso <= capacidade
+    # Nunca pior que a incumbente gulosa
+    assert valor >= reducao.limite_inferior
+
+def test_reducao_rejeita_instancias_nao_simples():
+    itens = [ItemDataclass("A", 10, 2, grupo=0), ItemDataclass("B", 5, 1, grupo=0)]
+    with pytest.raises(ValueError):
+        Reducao(itens, 3)
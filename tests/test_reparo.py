@@ -0,0 +1,52 @@
+import numpy as np
+import pytest
+
+from benchmark import Benchmark
+from HC import HC
+from reparo import Reparador
+
+def reparo_item_a_item(itens, capacidade, solucao):
+    """Reparo de referência: remove o selecionado de menor ratio enquanto exceder a capacidade"""
+    solucao = solucao.copy()
+    removidos = []
+    while itens.pesos @ solucao > capacidade:
+        selecionados = np.flatnonzero(solucao)
+        item = selecionados[np.argmin(itens.ratios[selecionados])]
+        solucao[item] = 0
+        removidos.append(int(item))
+    return solucao, removidos
+
+# Soma de subconjuntos: todos os ratios empatam, o desempate por índice é o que importa
+INSTANCIA = {"familia": "soma_subconjuntos", "n_itens": 60, "semente": 4, "amplitude": 20}
+
+@pytest.mark.parametrize("familia", ["nao_correlacionada", "soma_subconjuntos"])
+def test_remocao_igual_ao_laco_item_a_item(familia):
+    itens, capacidade = Benchmark.gerar_instancia(familia, 60, semente=4, amplitude=20)
+    reparador = Reparador(itens, capacidade)
+    populacao = np.random.default_rng(0).integers(0, 2, size=(30, len(itens)), dtype=np.uint8)
+    
+    reparada = reparador.reparar(populacao)
+    for linha, original in zip(reparada, populacao):
+        esperada, removidos = reparo_item_a_item(itens, capacidade, original)
+        assert np.array_equal(linha, esperada)
+        assert reparador.reparar_solucao(original)[1] == removidos
+
+def test_preenchimento_deixa_folga_menor_que_qualquer_item_fora(instancia):
+    itens, capacidade = instancia
+    reparador = Reparador(itens, capacidade)
+    populacao = np.random.default_rng(1).integers(0, 2, size=(30, len(itens)), dtype=np.uint8)
+    
+    for linha in reparador.reparar(populacao, preencher=True):
+        folga = capacidade - itens.pesos @ linha
+        assert folga >= 0
+        assert (itens.pesos[linha == 0] > folga).all()
+
+def test_ordem_calculada_uma_vez_por_instancia(instancia):
+    itens, capacidade = instancia
+    assert Reparador(itens, capacidade).ordem is Reparador(itens, capacidade // 2).ordem
+
+def test_preencher_reparo_no_hc(instancia):
+    itens, capacidade = instancia
+    solucao, _, peso, _ = HC.executa_hc(itens, capacidade, max_iteracoes=0, preencher_reparo=True)
+    assert peso <= capacidade
+    assert (itens.pesos[np.asarray(solucao) == 0] > capacidade - peso).all()
@@ -0,0 +1,77 @@
+import itertools
+import random
+
+import numpy as np
+import pytest
+
+from AG import AG
+from HC import HC
+from itens import ItemDataclass, ItensArray
+from PD import PD
+from reparo import Reparador
+from restricoes import Restricoes
+from SA import SA
+
+CAPACIDADE = [40, 35, 50]
+
+@pytest.fixture(scope="module")
+def itens():
+    rng = np.random.default_rng(0)
+    return ItensArray(None, rng.integers(1, 50, 12), rng.integers(1, 20, (12, 3)), grupos=rng.integers(-1, 4, 12))
+
+@pytest.fixture(scope="module")
+def otimo(itens):
+    restricoes = Restricoes(itens, CAPACIDADE)
+    solucoes = np.array(list(itertools.product((0, 1), repeat=len(itens))), dtype=np.uint8)
+    return (solucoes[restricoes.viaveis(solucoes)] @ itens.valores).max()
+
+def test_itens_com_varios_recursos_e_grupos():
+    lista = [ItemDataclass("a", 10, 2, (3, 1), grupo=0), ItemDataclass("b", 5, 1, (1, 1)),
+             ItemDataclass("c", 8, 4, (2, 2), grupo=0)]
+    itens = ItensArray.de_itens(lista)
+    assert itens.n_dimensoes == 3 and not itens.simples
+    assert itens.grupos.tolist() == [0, -1, 0]
+    assert list(itens) == lista
+    
+    with pytest.raises(ValueError):
+        Restricoes(itens, [10, 10])
+    with pytest.raises(ValueError):
+        PD.executa_pd(itens, 10)
+
+def test_delta_igual_a_avaliacao_em_lote(itens):
+    restricoes = Restricoes(itens, CAPACIDADE)
+    for solucao in np.random.default_rng(1).integers(0, 2, size=(40, len(itens)), dtype=np.uint8):
+        estado = restricoes.estado(solucao)
+        assert (estado.violacoes == 0) == restricoes.viavel(solucao)
+        
+        vizinhos = np.tile(solucao, (len(itens), 1))
+        np.fill_diagonal(vizinhos, 1 - solucao)
+        esperado = restricoes.viaveis(vizinhos)
+        assert np.array_equal(estado.vizinhos_viaveis(solucao == 1), esperado)
+        assert [estado.viavel_apos_flip(i, 1 - 2 * int(solucao[i])) for i in range(len(itens))] == esperado.tolist()
+        
+        estado.aplicar_flip(0, 1 - 2 * int(solucao[0]))
+        assert (estado.violacoes == 0) == esperado[0]
+
+def test_reparo_e_preenchimento_viaveis_e_maximais(itens):
+    restricoes = Restricoes(itens, CAPACIDADE)
+    populacao = np.random.default_rng(2).integers(0, 2, size=(50, len(itens)), dtype=np.uint8)
+    
+    reparada = Reparador(itens, CAPACIDADE).reparar(populacao, preencher=True)
+    assert restricoes.viaveis(reparada).all()
+    for solucao in reparada:
+        estado = restricoes.estado(solucao)
+        assert not any(estado.viavel_apos_flip(i, 1) for i in np.flatnonzero(solucao == 0))
+
+@pytest.mark.parametrize("executa, parametros", [
+    (HC.executa_hc, {}),
+    (HC.executa_hc, {"modo_busca": "primeira"}),
+    (SA.executa_sa, {"T0": "auto"}),
+    (AG.executa_ag, {"preencher_reparo": True}),
+])
+def test_solvers_respeitam_todas_as_restricoes(itens, otimo, executa, parametros):
+    random.seed(0)
+    solucao, valor, peso, _ = executa(itens, CAPACIDADE, **parametros)
+    assert Restricoes(itens, CAPACIDADE).viavel(solucao)
+    assert itens.avaliar(solucao) == (pytest.approx(valor), pytest.approx(peso))
+    assert 0.7 * otimo <= valor <= otimo
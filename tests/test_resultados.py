@@ -0,0 +1,97 @@
+import os
+
+import numpy as np
+import pytest
+
+from bits import SolucaoBits
+from HC import HC
+from PD import PD
+import resultados
+from resultados import CacheResultados
+
+INSTANCIA = {"familia": "fracamente_correlacionada", "n_itens": 40, "semente": 3}
+
+@pytest.fixture
+def cache(tmp_path):
+    return CacheResultados(str(tmp_path))
+
+def test_acerto_devolve_o_mesmo_resultado_sem_executar(cache, instancia, monkeypatch):
+    itens, capacidade = instancia
+    solucao, valor, peso, estatisticas = cache.executar("SA", itens, capacidade, semente=7, passos_por_T=5)
+    assert not estatisticas["do_cache"]
+    
+    # Um acerto não pode chamar o algoritmo
+    monkeypatch.setitem(resultados.ALGORITMOS, "SA", None)
+    solucao_cache, valor_cache, peso_cache, estatisticas_cache = cache.executar(
+        "SA", itens, capacidade, semente=7, passos_por_T=5)
+    assert estatisticas_cache["do_cache"]
+    assert (valor_cache, peso_cache) == (valor, peso)
+    assert np.array_equal(np.asarray(solucao_cache), np.asarray(solucao))
+    assert estatisticas_cache["iteracoes"] == estatisticas["iteracoes"]
+    assert cache.acertos == 1 and cache.falhas == 1
+
+def test_chave_depende_de_instancia_parametros_e_semente(instancia):
+    itens, capacidade = instancia
+    impressao = CacheResultados.impressao_digital(itens, capacidade)
+    assert impressao == CacheResultados.impressao_digital(list(itens), capacidade)
+    assert impressao != CacheResultados.impressao_digital(itens, capacidade + 1)
+    
+    base = CacheResultados.chave(impressao, "SA", {"max_iteracoes": 200}, 7)
+    assert base == CacheResultados.chave(impressao, "SA", {"max_iteracoes": 200, "mostrar_processo": True}, 7)
+    assert base != CacheResultados.chave(impressao, "SA", {"max_iteracoes": 200}, 8)
+    assert base != CacheResultados.chave(impressao, "SA", {"max_iteracoes": 300}, 7)
+    assert base != CacheResultados.chave(impressao, "HC", {"max_iteracoes": 200}, 7)
+
+def test_chave_distingue_solucoes_iniciais_grandes():
+    # Arrays com mais de 1000 elementos: o repr do NumPy os resume com '...' e os confundiria
+    inicial = np.zeros(3000, dtype=np.uint8)
+    alterada = inicial.copy()
+    alterada[1500] = 1
+    chaves = {CacheResultados.chave("x", "SA", {"solucao_inicial": solucao}, 0)
+              for solucao in (inicial, alterada, SolucaoBits.de_array(alterada))}
+    assert len(chaves) == 2
+    assert CacheResultados.chave("x", "SA", {"solucao_inicial": alterada.copy()}, 0) in chaves
+
+def test_tamanho_limitado_descarta_os_mais_antigos(tmp_path, instancia):
+    itens, capacidade = instancia
+    cache = CacheResultados(str(tmp_path), tamanho_maximo=8000)
+    for semente in range(10):
+        cache.executar("HC", itens, capacidade, semente=semente, max_iteracoes=20, aquecer=False)
+    
+    arquivos = [os.path.join(tmp_path, nome) for nome in os.listdir(tmp_path)]
+    assert sum(os.path.getsize(arquivo) for arquivo in arquivos) <= 8000
+    # A entrada mais recente sobrevive ao descarte
+    _, _, _, estatisticas = cache.executar("HC", itens, capacidade, semente=9, max_iteracoes=20, aquecer=False)
+    assert estatisticas["do_cache"]
+
+def test_entrada_corrompida_conta_como_falha(cache, instancia):
+    itens, capacidade = instancia
+    cache.executar("HC", itens, capacidade, semente=1, max_iteracoes=20)
+    for nome in os.listdir(cache.diretorio):
+        if not nome.startswith("melhor-"):
+            with open(os.path.join(cache.diretorio, nome), "wb") as arquivo:
+                arquivo.write(b"corrompido")
+    
+    _, _, _, estatisticas = cache.executar("HC", itens, capacidade, semente=1, max_iteracoes=20)
+    assert not estatisticas["do_cache"]
+
+def test_partida_a_quente_pela_melhor_solucao_de_outro_algoritmo(cache, instancia):
+    itens, capacidade = instancia
+    _, otimo, _, _ = PD.executa_pd(itens, capacidade_maxima=capacidade)
+    cache.executar("PD", itens, capacidade)
+    
+    melhor, valor, algoritmo = cache.melhor_conhecida(itens, capacidade)
+    assert (valor, algoritmo) == (otimo, "PD")
+    
+    # Partindo do ótimo, o HC não tem para onde subir
+    _, valor_hc, _, _ = cache.executar("HC", itens, capacidade, semente=2, max_iteracoes=5)
+    assert valor_hc == otimo
+
+def test_solucao_inicial_e_reparada(instancia):
+    itens, capacidade = instancia
+    solucao, valor, peso, _ = HC.executa_hc(itens, capacidade_maxima=capacidade, max_iteracoes=0,
+                                            solucao_inicial=np.ones(len(itens), dtype=np.uint8))
+    assert peso <= capacidade
+    
+    with pytest.raises(ValueError):
+        HC.executa_hc(itens, capacidade_maxima=capacidade, solucao_inicial=[1, 0])
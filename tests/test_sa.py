@@ -0,0 +1,85 @@
+import pytest
+
+from conftest import executar_coletando
+from eventos import FIM, REAQUECIMENTO
+from PD import PD
+from SA import SA
+
+INSTANCIA = {"familia": "nao_correlacionada", "n_itens": 200, "semente": 2}
+
+def executar(instancia, **parametros):
+    solucao, valor, peso, historico, eventos = executar_coletando(SA.executa_sa, instancia, {FIM, REAQUECIMENTO},
+                                                                  **parametros)
+    itens, capacidade = instancia
+    assert peso <= capacidade
+    assert itens.avaliar(solucao) == (pytest.approx(valor), pytest.approx(peso))
+    return eventos, historico
+
+@pytest.mark.parametrize("resfriamento", ["geometrico", "lundy_mees"])
+def test_resfriamentos_param_em_tmin(instancia, resfriamento):
+    eventos, historico = executar(instancia, resfriamento=resfriamento)
+    assert eventos[-1].dados["motivo_parada"] == "temperatura_minima"
+    assert eventos[-1].temperatura <= 0.1
+    assert all(a[3] >= b[3] for a, b in zip(historico, historico[1:]))
+
+def test_adaptativo_respeita_orcamento_de_avaliacoes(instancia):
+    eventos, historico = executar(instancia, T0="auto", resfriamento="adaptativo", max_avaliacoes=1234)
+    assert eventos[-1].dados["motivo_parada"] == "max_avaliacoes"
+    assert eventos[-1].iteracao == 1234
+    assert historico[-1][0] == 1234
+
+def test_adaptativo_sem_orcamento_para_no_horizonte(instancia):
+    eventos, _ = executar(instancia, resfriamento="adaptativo")
+    assert eventos[-1].dados["motivo_parada"] == "horizonte"
+
+def test_tempo_limite(instancia):
+    eventos, _ = executar(instancia, alpha=0.99999, tempo_limite=0.05)
+    assert eventos[-1].dados["motivo_parada"] == "tempo_limite"
+
+def test_t0_automatico(instancia):
+    _, historico = executar(instancia, T0="auto", aceitacao_inicial=0.5)
+    assert historico[0][3] > 0
+
+def test_reaquecimento_limitado(instancia):
+    eventos, _ = executar(instancia, reaquecer_apos=2, max_reaquecimentos=2)
+    reaquecimentos = [evento for evento in eventos if evento.tipo == REAQUECIMENTO]
+    assert 1 <= len(reaquecimentos) <= 2
+    assert eventos[-1].dados["reaquecimentos"] == len(reaquecimentos)
+
+def test_congelamento(instancia):
+    eventos, _ = executar(instancia, T0=0.001, Tmin=1e-9, ciclos_congelados=2)
+    assert eventos[-1].dados["motivo_parada"] == "congelamento"
+
+def test_parametros_invalidos(instancia):
+    with pytest.raises(ValueError):
+        SA.executa_sa(*instancia, resfriamento="linear")
+    with pytest.raises(ValueError):
+        SA.executa_sa(*instancia, T0="auto", aceitacao_inicial=1.0)
+
+def executar_replicas(instancia, **parametros):
+    solucao, valor, peso, historico, eventos = executar_coletando(SA.executa_sa_replicas, instancia, {FIM},
+                                                                  **parametros)
+    itens, capacidade = instancia
+    assert peso <= capacidade
+    assert itens.avaliar(solucao) == (pytest.approx(valor), pytest.approx(peso))
+    return valor, eventos, historico
+
+def test_replicas_perto_do_otimo(instancia):
+    otimo = PD.executa_pd(*instancia, modo="valor")[1]
+    valor, eventos, historico = executar_replicas(instancia, Tmax=500.0, passos=3000)
+    assert valor >= 0.8 * otimo
+    assert eventos[-1].dados["motivo_parada"] == "passos"
+    assert historico[-1][0] == 3000 and historico[-1][3] == valor
+    assert all(0 <= taxa <= 1 for taxa in eventos[-1].dados["taxas_troca"])
+    assert eventos[-1].dados["taxas_troca"].max() > 0
+
+def test_replicas_deterministico(instancia):
+    assert executar_replicas(instancia, passos=500)[0] == executar_replicas(instancia, passos=500)[0]
+
+def test_replicas_tempo_limite_e_replica_unica(instancia):
+    eventos = executar_replicas(instancia, passos=10**7, tempo_limite=0.05)[1]
+    assert eventos[-1].dados["motivo_parada"] == "tempo_limite"
+    eventos = executar_replicas(instancia, n_replicas=1, passos=100)[1]
+    assert len(eventos[-1].dados["taxas_troca"]) == 0
+    with pytest.raises(ValueError):
+        SA.executa_sa_replicas(*instancia, Tmin=5.0, Tmax=1.0)
@@ -0,0 +1,100 @@
+import asyncio
+import random
+
+import pytest
+
+from eventos import MELHORIA
+from HC import HC
+from PD import PD
+from servico import ServicoOtimizacao
+
+INSTANCIA = {"familia": "fracamente_correlacionada", "n_itens": 60, "semente": 5}
+
+# SA longo: só termina por cancelamento ou prazo
+SA_LONGO = {"alpha": 0.9999, "Tmin": 1e-6, "passos_por_T": 200}
+
+def test_tarefas_concorrentes_em_processos(instancia):
+    itens, capacidade = instancia
+    _, otimo, _, _ = PD.executa_pd(itens, capacidade_maxima=capacidade)
+    random.seed(3)
+    _, valor_hc, _, _ = HC.executa_hc(itens, capacidade_maxima=capacidade)
+    
+    async def principal():
+        async with ServicoOtimizacao(n_trabalhadores=2) as servico:
+            tarefas = [await servico.submeter("PD", itens, capacidade) for _ in range(4)]
+            tarefas.append(await servico.submeter("HC", itens, capacidade, semente=3))
+            return await asyncio.gather(*(tarefa.resultado() for tarefa in tarefas))
+    
+    resultados = asyncio.run(principal())
+    assert [valor for _, valor, _, _ in resultados[:4]] == [otimo] * 4
+    # Mesma semente, mesmo resultado que a execução direta
+    assert resultados[4][1] == valor_hc
+    assert "motivo_parada" in resultados[4][3]
+
+def test_progresso_traz_melhorias(instancia):
+    itens, capacidade = instancia
+    
+    async def principal():
+        async with ServicoOtimizacao(n_trabalhadores=1, usar_processos=False) as servico:
+            tarefa = await servico.submeter("AG", itens, capacidade, semente=1, geracoes=30)
+            eventos = [evento async for evento in tarefa.progresso()]
+            return eventos, await tarefa.resultado()
+    
+    eventos, (_, valor, _, estatisticas) = asyncio.run(principal())
+    melhorias = [evento.fitness for evento in eventos if evento.tipo == MELHORIA]
+    assert melhorias and melhorias == sorted(melhorias)
+    assert estatisticas["iteracoes"] == 30
+
+@pytest.mark.parametrize("usar_processos", [False, True])
+def test_cancelamento_libera_o_trabalhador(instancia, usar_processos):
+    itens, capacidade = instancia
+    
+    async def principal():
+        async with ServicoOtimizacao(n_trabalhadores=1, usar_processos=usar_processos,
+                                     intervalo_progresso=0.01) as servico:
+            longa = await servico.submeter("SA", itens, capacidade, **SA_LONGO)
+            pendente = await servico.submeter("PD", itens, capacidade)
+            pendente.cancelar()
+            await asyncio.sleep(0.2)
+            longa.cancelar()
+            with pytest.raises(asyncio.CancelledError):
+                await longa.resultado()
+            with pytest.raises(asyncio.CancelledError):
+                await pendente.resultado()
+            # O trabalhador volta a atender novas tarefas
+            _, valor, _, _ = await asyncio.wait_for(servico.resolver("PD", itens, capacidade), timeout=30)
+            return longa.estado, pendente.estado, valor
+    
+    estado_longa, estado_pendente, valor = asyncio.run(principal())
+    assert (estado_longa, estado_pendente) == ("cancelada", "cancelada")
+    assert valor > 0
+
+def test_prazo(instancia):
+    itens, capacidade = instancia
+    
+    async def principal():
+        async with ServicoOtimizacao(n_trabalhadores=1, usar_processos=False) as servico:
+            # O SA para pelo próprio tempo_limite e devolve a melhor solução até o prazo
+            longa = await servico.submeter("SA", itens, capacidade, prazo=0.3, **SA_LONGO)
+            # Esta espera na fila além do prazo e nem chega a executar
+            atrasada = await servico.submeter("PD", itens, capacidade, prazo=0.1)
+            _, valor, peso, estatisticas = await longa.resultado()
+            with pytest.raises(TimeoutError):
+                await atrasada.resultado()
+            return valor, peso, estatisticas
+    
+    valor, peso, estatisticas = asyncio.run(principal())
+    assert valor > 0 and peso <= capacidade
+    assert estatisticas["motivo_parada"] == "tempo_limite"
+
+def test_trabalhadores_em_threads_nao_imprimem(instancia, capsys):
+    itens, capacidade = instancia
+    
+    async def principal():
+        async with ServicoOtimizacao(n_trabalhadores=2, usar_processos=False) as servico:
+            return await asyncio.gather(*(servico.resolver(algoritmo, itens, capacidade, mostrar_processo=True)
+                                          for algoritmo in ("HC", "PD", "AG")))
+    
+    resultados = asyncio.run(principal())
+    assert all(valor > 0 for _, valor, _, _ in resultados)
+    assert capsys.readouterr().out == ""